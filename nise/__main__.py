@@ -17,6 +17,7 @@
 """Cost and Usage Generator CLI."""
 import argparse
 import datetime
+import importlib.util
 import os
 from pprint import pformat
 
@@ -45,6 +46,17 @@ def valid_date(date_string):
     return valid
 
 
+def positive_int(value):
+    """Create a positive integer from an argument string."""
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"{value} is not a positive integer.")
+    return number
+
+
 def add_aws_parser_args(parser):
     """Add AWS sub-parser args."""
     parser.add_argument(
@@ -79,6 +91,39 @@ def add_aws_parser_args(parser):
                             or \'overwrite\' to finalize the normal report files.
                             """,
     )
+    parser.add_argument(
+        "--aws-num-instances",
+        metavar="NUM",
+        dest="aws_num_instances",
+        type=int,
+        required=False,
+        help="Number of resources each AWS generator emits. Static file entries are always generated.",
+    )
+    parser.add_argument(
+        "--aws-gzip-level",
+        metavar="LEVEL",
+        dest="aws_gzip_level",
+        type=int,
+        choices=range(1, 10),
+        required=False,
+        help="Compression level (1-9) of the gzipped report files placed in the bucket. (Default: 9)",
+    )
+    parser.add_argument(
+        "--aws-multipart-chunksize",
+        metavar="MB",
+        dest="aws_multipart_chunksize",
+        type=int,
+        required=False,
+        help="Part size in MB of multipart uploads to the S3 bucket. (Default: 8)",
+    )
+    parser.add_argument(
+        "--aws-max-concurrency",
+        metavar="NUM",
+        dest="aws_max_concurrency",
+        type=int,
+        required=False,
+        help="Number of threads uploading the parts of each file to the S3 bucket. (Default: 10)",
+    )
 
 
 def add_azure_parser_args(parser):
@@ -112,6 +157,14 @@ def add_azure_parser_args(parser):
         default=os.getenv("AZURE_STORAGE_ACCOUNT"),
         help="Azure container to place the data.",
     )
+    parser.add_argument(
+        "--azure-max-concurrency",
+        metavar="NUM",
+        dest="azure_max_concurrency",
+        type=int,
+        required=False,
+        help="Number of connections uploading the chunks of each file to the container. (Default: 1)",
+    )
 
 
 def add_gcp_parser_args(parser):
@@ -138,8 +191,9 @@ def add_ocp_parser_args(parser):
         "--ocp-cluster-id",
         metavar="OCP_CLUSTER_ID",
         dest="ocp_cluster_id",
+        nargs="+",
         required=False,
-        help="Cluster identifier for usage data.",
+        help="Cluster identifier for usage data. Several ids generate a report for each cluster.",
     )
     parser.add_argument(
         "--insights-upload",
@@ -148,6 +202,13 @@ def add_ocp_parser_args(parser):
         required=False,
         help="URL for Insights Upload Service.",
     )
+    parser.add_argument(
+        "--ocp-vectorized",
+        dest="ocp_vectorized",
+        action="store_true",
+        required=False,
+        help="Sample hourly pod usage with NumPy, one call per pod for all hours. Requires numpy.",
+    )
 
 
 def create_parser():
@@ -197,7 +258,66 @@ def create_parser():
         help="Maximum number of lines per report file. Default is 100000.",
     )
     parent_parser.add_argument(
-        "--static-report-file", dest="static_report_file", required=False, help="Generate static data based on yaml."
+        "--workers",
+        metavar="NUM",
+        dest="workers",
+        required=False,
+        type=positive_int,
+        default=1,
+        help="Number of worker processes used to run the AWS generators or OCP report types of a month in parallel. "
+        "Ignored when --month-workers is greater than one. (Default: 1)",
+    )
+    parent_parser.add_argument(
+        "--month-workers",
+        metavar="NUM",
+        dest="month_workers",
+        required=False,
+        type=positive_int,
+        default=1,
+        help="Number of months to generate concurrently for AWS, Azure and OCP reports. "
+        "The months of all OCP clusters share these workers. (Default: 1)",
+    )
+    parent_parser.add_argument(
+        "--upload-workers",
+        metavar="NUM",
+        dest="upload_workers",
+        required=False,
+        type=positive_int,
+        help="Number of report files uploaded concurrently to the S3 bucket, Azure container or GCP bucket. "
+        "(Default: 4)",
+    )
+    parent_parser.add_argument(
+        "--seed",
+        metavar="NUM",
+        dest="seed",
+        required=False,
+        type=int,
+        help="Seed of the generated data. Runs with the same seed and arguments write identical reports, "
+        "whatever the number of workers.",
+    )
+    parent_parser.add_argument(
+        "--cache-dir",
+        metavar="DIR",
+        dest="cache_dir",
+        required=False,
+        help="Directory caching the finished AWS, Azure and OCP report months of seeded runs. "
+        "Months already in the cache are routed without being generated again. Requires --seed.",
+    )
+    parent_parser.add_argument(
+        "--cache-size",
+        metavar="MB",
+        dest="cache_size",
+        required=False,
+        type=positive_int,
+        default=1024,
+        help="Size the cache directory is kept under by removing the least recently used months. (Default: 1024)",
+    )
+    parent_parser.add_argument(
+        "--static-report-file",
+        dest="static_report_file",
+        nargs="+",
+        required=False,
+        help="Generate static data based on yaml. OCP reports accept a file for each --ocp-cluster-id.",
     )
     parent_parser.add_argument(
         "-w",
@@ -278,7 +398,7 @@ def _get_ocp_options(options):
     Args:
         options (Dict): dictionary of arguments.
     Returns:
-        ocp_cluster_id (string): OCP cluster id
+        ocp_cluster_id (List): OCP cluster ids
 
     """
     ocp_cluster_id = options.get("ocp_cluster_id")
@@ -365,6 +485,10 @@ def _validate_ocp_arguments(parser, options):
         msg = "{} must be supplied."
         msg = msg.format("--ocp-cluster-id")
         parser.error(msg)
+    elif options.get("ocp_vectorized") and importlib.util.find_spec("numpy") is None:
+        msg = "{} requires numpy to be installed."
+        msg = msg.format("--ocp-vectorized")
+        parser.error(msg)
     elif insights_upload is not None and not os.path.isdir(insights_upload):
         insights_user = os.environ.get("INSIGHTS_USER")
         insights_password = os.environ.get("INSIGHTS_PASSWORD")
@@ -429,6 +553,30 @@ def _validate_provider_inputs(parser, options):
     return (valid_inputs, provider_type)
 
 
+def _validate_static_report_files(parser, options):
+    """Validate the static report files and unwrap a single file.
+
+    Args:
+        parser (Object): ArgParser parser.
+        options (Dict): dictionary of arguments.
+    Raises:
+        (ParserError): If several files are not one per OCP cluster.
+
+    """
+    static_report_files = options.get("static_report_file")
+    if not isinstance(static_report_files, list):
+        return
+    if len(static_report_files) == 1:
+        options["static_report_file"] = static_report_files[0]
+        return
+
+    cluster_ids = options.get("ocp_cluster_id") or []
+    if options.get("provider") != "ocp" or len(static_report_files) != len(cluster_ids):
+        msg = "Several {} values must be supplied with as many {} values."
+        msg = msg.format("--static-report-file", "--ocp-cluster-id")
+        parser.error(msg)
+
+
 def run(provider_type, options):
     """Run nise."""
     LOG.info("Creating reports...")
@@ -458,6 +606,9 @@ def main():
 
     if not (options.get("start_date") or options.get("static_report_file")):
         parser.error("the following arguments are required: -s, --start-date OR --static-report-file")
+    if options.get("cache_dir") and options.get("seed") is None:
+        parser.error("--cache-dir requires --seed")
+    _validate_static_report_files(parser, options)
 
     _, provider_type = _validate_provider_inputs(parser, options)
 
@@ -0,0 +1,210 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Defines the local cache of the finished report files of a month."""
+import hashlib
+import json
+import os
+import shutil
+from contextlib import contextmanager
+from tempfile import mkdtemp
+
+from nise import __version__
+from nise.util import LOG
+
+INDEX_FILE = "index.json"
+
+# Options that change how reports are produced or delivered, but not their contents.
+IGNORED_OPTIONS = frozenset(
+    (
+        "aws_max_concurrency",
+        "aws_multipart_chunksize",
+        "azure_max_concurrency",
+        "cache_dir",
+        "cache_size",
+        "log_level",
+        "month_workers",
+        "static_config",
+        "upload_workers",
+        "workers",
+    )
+)
+
+
+def _file_digest(path):
+    """Return the sha256 digest of a file, or None without a file."""
+    if not path:
+        return None
+    digest = hashlib.sha256()
+    with open(path, "rb") as source:
+        for chunk in iter(lambda: source.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(options, *keys):
+    """Return the cache key of the report files of a month.
+
+    Args:
+        options (Dict): options of the run
+        keys (List): values identifying the files within the run, such as the provider and month
+    Returns:
+        (String): hex digest of the nise version, the options, the static report file and the keys
+
+    """
+    values = {name: value for name, value in options.items() if name not in IGNORED_OPTIONS}
+    # The static file is a template rendered from the seeded generators, so its source fixes the rendering.
+    values["static_report_file"] = _file_digest(options.get("static_report_file"))
+    payload = json.dumps([__version__, values, keys], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _link_or_copy(source, destination):
+    """Hard link source to destination, copying it where links are not supported."""
+    os.makedirs(os.path.dirname(destination), exist_ok=True)
+    try:
+        os.link(source, destination)
+    except FileNotFoundError:
+        raise
+    except OSError:
+        shutil.copyfile(source, destination)
+
+
+def _tree_size(path):
+    """Return the size in bytes of the files below path."""
+    return sum(
+        os.path.getsize(os.path.join(directory, file_name))
+        for directory, _, file_names in os.walk(path)
+        for file_name in file_names
+    )
+
+
+class ReportCache:
+    """Local directory of the finished report files of each month, keyed by cache_key().
+
+    Each month is a directory holding copies of its files and an index of their names.
+    The modification time of the index records the last use of the month, and the least
+    recently used months are removed once the cache grows past max_size.
+    """
+
+    def __init__(self, directory, max_size=None):
+        """Initialize the cache.
+
+        Args:
+            directory (String): path of the cache directory, created if missing
+            max_size (Int): size in bytes the cache is evicted down to, unbounded if None
+        """
+        self.directory = directory
+        self.max_size = max_size
+        os.makedirs(directory, exist_ok=True)
+
+    def _entry_path(self, key):
+        """Return the directory of the month of key."""
+        return os.path.join(self.directory, key)
+
+    @contextmanager
+    def get(self, key):
+        """Yield the cached files of a month, or None if it is not cached.
+
+        The files are links in a hidden directory of the cache, removed on exit, so a
+        month evicted by another process while its files are being routed keeps them.
+
+        Args:
+            key (String): cache key of the month
+        Yields:
+            (Dict): lists of (name, path) pairs of the cached files, by group
+
+        """
+        entry = self._entry_path(key)
+        index_path = os.path.join(entry, INDEX_FILE)
+        checkout = mkdtemp(prefix=".", dir=self.directory)
+        try:
+            try:
+                with open(index_path) as index_file:
+                    index = json.load(index_file)
+                os.utime(index_path)
+                for files in index.values():
+                    for _, path in files:
+                        _link_or_copy(os.path.join(entry, path), os.path.join(checkout, path))
+            except (OSError, ValueError):
+                # Not cached, or evicted while it was being checked out.
+                yield None
+                return
+            LOG.info(f"Using the cached report files of {key}.")
+            yield {
+                group: [(name, os.path.join(checkout, path)) for name, path in files] for group, files in index.items()
+            }
+        finally:
+            shutil.rmtree(checkout, ignore_errors=True)
+
+    def put(self, key, groups):
+        """Store copies of the files of a month, then evict the least recently used months.
+
+        Args:
+            key (String): cache key of the month
+            groups (Dict): lists of (name, path) pairs of the files to store, by group
+
+        """
+        # Files are staged in a hidden directory and renamed into place, so that concurrent
+        # months never see a partial entry.
+        staging = mkdtemp(prefix=".", dir=self.directory)
+        index = {}
+        count = 0
+        for group, files in groups.items():
+            index[group] = []
+            for name, path in files:
+                # Each file keeps its name, some routes derive the destination from it.
+                cached_path = os.path.join(str(count), os.path.basename(path))
+                os.mkdir(os.path.join(staging, str(count)))
+                shutil.copyfile(path, os.path.join(staging, cached_path))
+                index[group].append((name, cached_path))
+                count += 1
+        with open(os.path.join(staging, INDEX_FILE), "w") as index_file:
+            json.dump(index, index_file)
+
+        try:
+            os.rename(staging, self._entry_path(key))
+        except OSError:
+            # Another process stored the same month first.
+            shutil.rmtree(staging, ignore_errors=True)
+            return
+        LOG.info(f"Cached the report files of {key}.")
+        self.evict()
+
+    def evict(self):
+        """Remove the least recently used months until the cache fits in max_size."""
+        if not self.max_size:
+            return
+
+        entries = []
+        for key in os.listdir(self.directory):
+            if key.startswith("."):
+                continue
+            entry = self._entry_path(key)
+            try:
+                last_used = os.path.getmtime(os.path.join(entry, INDEX_FILE))
+                size = _tree_size(entry)
+            except OSError:
+                continue
+            entries.append((last_used, size, key))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, key in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            LOG.info(f"Evicting the cached report files of {key}.")
+            shutil.rmtree(self._entry_path(key), ignore_errors=True)
+            total_size -= size
@@ -19,8 +19,6 @@ import datetime
 import string
 from abc import abstractmethod
 from copy import deepcopy
-from random import choice
-from random import randint
 
 from nise.generators.aws.constants import BILL_COLS
 from nise.generators.aws.constants import IDENTITY_COLS
@@ -30,7 +28,8 @@ from nise.generators.aws.constants import PRODUCT_COLS
 from nise.generators.aws.constants import REGIONS
 from nise.generators.aws.constants import RESERVE_COLS
 from nise.generators.generator import AbstractGenerator
-from nise.util import load_yaml
+from nise.generators.generator import get_static_config
+from nise.util import random_streams
 
 
 class AWSGenerator(AbstractGenerator):
@@ -45,6 +44,7 @@ class AWSGenerator(AbstractGenerator):
         "resourceTags/user:openshift_project",
         "resourceTags/user:openshift_node",
     }
+    DEFAULT_RESOURCE_TAG_COLS = frozenset(RESOURCE_TAG_COLS)
     AWS_COLUMNS = set(
         IDENTITY_COLS
         + BILL_COLS
@@ -56,32 +56,34 @@ class AWSGenerator(AbstractGenerator):
     )
     TEMPLATE = "aws.j2"
 
-    TEMPLATE_KWARGS = {
-        "payer": AbstractGenerator.fake.ean13(),
-        "users": [AbstractGenerator.fake.ean13() for _ in range(0, randint(2, 6))],
-        "invoice_id": "".join([choice(string.digits) for _ in range(9)]),
-    }
+    # AWS_COLUMNS in report order, re-sorted only when tag columns are added.
+    _column_order = ()
+
+    # Filled by init_template_kwargs() on first use.
+    TEMPLATE_KWARGS = {}
+
+    def __init__(self, start_date, end_date, user_config=None, num_instances=None, seed=None):
+        """Initialize the generator.
+
+        Args:
+            num_instances (int): number of resources to emit when not set by the static file.
+            seed (int): seed of the random values of the generator.
+        """
+        self._row_prototypes = {}
+        self.init_template_kwargs()
+        self.seed_random(seed)
 
-    def __init__(self, start_date, end_date, user_config=None):
-        """Initialize the generator."""
         # generate the same number of elements as the static file, if there is one
         # this is needed to ensure that deepupdate() works correctly.
-        gen_count = randint(2, 6)
+        gen_count = num_instances or self.random.randint(2, 6)
+        user_config = get_static_config(user_config)
         if user_config:
-            preload = load_yaml(user_config)
-            seen = {}
-            for generators in preload.get("generators"):
-                for key in generators.keys():
-                    if key in seen.keys():
-                        seen[key] += 1
-                    else:
-                        seen[key] = 1
             name = type(self).__name__
-            if name in seen:
-                gen_count = seen[name]
+            if name in user_config.counts:
+                gen_count = max(user_config.counts[name], num_instances or 0)
         self._gen_fake_data(gen_count)
 
-        super().__init__(start_date, end_date, user_config=user_config)
+        super().__init__(start_date, end_date, user_config=user_config, seed=seed)
 
         tag_cols = []
         self._tags = {}
@@ -94,6 +96,62 @@ class AWSGenerator(AbstractGenerator):
             self.RESOURCE_TAG_COLS.update(tag_cols)
             self.AWS_COLUMNS.update(tag_cols)
 
+    @property
+    def expected_row_count(self):
+        """Return the number of rows generate_data() will produce."""
+        return len(self.hours) * self.num_instances
+
+    @classmethod
+    def init_template_kwargs(cls, seed=None, accounts=None):
+        """Generate the payer, user accounts and invoice id shared by every AWS generator.
+
+        Reports call it once per run and pass the accounts it returns to their worker
+        processes, which may not inherit the accounts of the parent process.
+
+        Args:
+            seed (int): seed of the accounts, replacing the accounts generated earlier.
+            accounts (dict): accounts returned by an earlier call, replacing the current accounts.
+        Returns:
+            (dict): the accounts
+        """
+        if accounts:
+            AWSGenerator.TEMPLATE_KWARGS.update(accounts)
+        elif seed is not None or "payer" not in AWSGenerator.TEMPLATE_KWARGS:
+            rng, fake, _ = random_streams(seed)
+            AWSGenerator.TEMPLATE_KWARGS.update(
+                payer=fake.ean13(),
+                users=[fake.ean13() for _ in range(0, rng.randint(2, 6))],
+                invoice_id="".join([rng.choice(string.digits) for _ in range(9)]),
+            )
+        return {key: AWSGenerator.TEMPLATE_KWARGS[key] for key in ("payer", "users", "invoice_id")}
+
+    @classmethod
+    def reset_tag_columns(cls):
+        """Remove the tag columns added by generators created so far.
+
+        Reports reset the columns for each month, so the columns of a month do not
+        depend on which months were generated before it in the same process.
+        """
+        added = AWSGenerator.RESOURCE_TAG_COLS - AWSGenerator.DEFAULT_RESOURCE_TAG_COLS
+        AWSGenerator.RESOURCE_TAG_COLS.difference_update(added)
+        AWSGenerator.AWS_COLUMNS.difference_update(added)
+        AWSGenerator._column_order = ()
+
+    @classmethod
+    def set_columns(cls, columns):
+        """Replace the report columns with those of another process, such as the parent of a worker."""
+        cls.reset_tag_columns()
+        tag_cols = set(columns) - AWSGenerator.AWS_COLUMNS
+        AWSGenerator.RESOURCE_TAG_COLS.update(tag_cols)
+        AWSGenerator.AWS_COLUMNS.update(tag_cols)
+
+    @classmethod
+    def column_order(cls):
+        """Return the report columns in a fixed, sorted order."""
+        if len(AWSGenerator._column_order) != len(cls.AWS_COLUMNS):
+            AWSGenerator._column_order = tuple(sorted(cls.AWS_COLUMNS))
+        return AWSGenerator._column_order
+
     @abstractmethod
     def _gen_fake_data(self, count):
         """Populate TEMPLATE_KWARGS with fake values."""
@@ -112,7 +170,7 @@ class AWSGenerator(AbstractGenerator):
                 if not val.get("payer_account"):
                     updated["generators"][idx][key]["payer_account"] = payer
                 if not val.get("usage_accounts"):
-                    updated["generators"][idx][key]["usage_accounts"] = tuple(set([payer] + users))
+                    updated["generators"][idx][key]["usage_accounts"] = tuple(dict.fromkeys([payer] + users))
                 if not val.get("invoice_id"):
                     updated["generators"][idx][key]["invoice_id"] = invoice_id
         return updated
@@ -136,9 +194,29 @@ class AWSGenerator(AbstractGenerator):
         if self._tags:
             tags = self._tags.get(tag_key)
         else:
-            tags = choice(options)
+            tags = self.random.choice(options)
         return tags
 
+    def _row_prototype(self, bill_begin, payer_account):
+        """Return the row template shared by every row of a billing period.
+
+        The template holds a placeholder for each column and the billing period values,
+        so each hourly row only needs a copy and its hour-specific fields.
+        """
+        # AWS_COLUMNS grows as generators add tag columns, so its size is part of the key.
+        key = (bill_begin, payer_account, len(self.AWS_COLUMNS))
+        prototype = self._row_prototypes.get(key)
+        if prototype is None:
+            bill_end = AbstractGenerator.next_month(bill_begin)
+            prototype = dict.fromkeys(self.AWS_COLUMNS, "")
+            prototype["bill/BillingEntity"] = "AWS"
+            prototype["bill/BillType"] = "Anniversary"
+            prototype["bill/PayerAccountId"] = payer_account or ""
+            prototype["bill/BillingPeriodStartDate"] = AWSGenerator.timestamp(bill_begin)
+            prototype["bill/BillingPeriodEndDate"] = AWSGenerator.timestamp(bill_end)
+            self._row_prototypes[key] = prototype
+        return prototype
+
     def _init_data_row(self, start, end, **kwargs):  # noqa: C901
         """Create a row of data with placeholder for all headers."""
         if not (start and end):
@@ -149,21 +227,9 @@ class AWSGenerator(AbstractGenerator):
             raise ValueError("end must be a date object.")
 
         bill_begin = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
-        bill_end = AbstractGenerator.next_month(bill_begin)
-        row = {}
-        COL_MAP = {
-            "identity/LineItemId": self.fake.sha1(raw_output=False),
-            "identity/TimeInterval": AWSGenerator.time_interval(start, end),
-            "bill/BillingEntity": "AWS",
-            "bill/BillType": "Anniversary",
-            "bill/PayerAccountId": kwargs.get("config", {}).get("payer_account"),
-            "bill/BillingPeriodStartDate": AWSGenerator.timestamp(bill_begin),
-            "bill/BillingPeriodEndDate": AWSGenerator.timestamp(bill_end),
-        }
-        for column in self.AWS_COLUMNS:
-            row[column] = ""
-            if COL_MAP.get(column):
-                row[column] = COL_MAP.get(column)
+        row = self._row_prototype(bill_begin, kwargs.get("config", {}).get("payer_account")).copy()
+        row["identity/LineItemId"] = self.ids.sha1()
+        row["identity/TimeInterval"] = AWSGenerator.time_interval(start, end)
 
         return row
 
@@ -173,11 +239,11 @@ class AWSGenerator(AbstractGenerator):
             for region in REGIONS:
                 if config.get("region") in region:
                     return region
-        return choice(REGIONS)
+        return self.random.choice(REGIONS)
 
     def _add_common_usage_info(self, row, start, end, **kwargs):
         """Add common usage information."""
-        row["lineItem/UsageAccountId"] = choice(self.config[0].get("usage_accounts"))
+        row["lineItem/UsageAccountId"] = self.random.choice(self.config[0].get("usage_accounts"))
         row["lineItem/LineItemType"] = "Usage"
         row["lineItem/UsageStartDate"] = start.replace(tzinfo=datetime.timezone.utc)
         row["lineItem/UsageEndDate"] = end.replace(tzinfo=datetime.timezone.utc)
@@ -186,7 +252,7 @@ class AWSGenerator(AbstractGenerator):
     def _add_tag_data(self, row, config):
         """Add tag data to the row."""
         for key, value in config.get("tags", {}).items():
-            row[key] = value
+            row[str(key)] = value
 
     def _generate_region_short_code(self, region):
         """Generate the AWS short code for a region."""
@@ -15,9 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for ebs data generation."""
-from random import choice
-from random import uniform
-
 from nise.generators.aws.aws_generator import AWSGenerator
 from nise.generators.aws.constants import REGIONS
 
@@ -39,9 +36,9 @@ class DataTransferGenerator(AWSGenerator):
         while len(self.TEMPLATE_KWARGS["data_transfer_gens"]) < count:
             self.TEMPLATE_KWARGS["data_transfer_gens"].append(
                 {
-                    "amount": uniform(0.000002, 0.09),
-                    "rate": round(uniform(0.12, 0.19), 3),
-                    "region": choice(REGIONS)[1],
+                    "amount": self.random.uniform(0.000002, 0.09),
+                    "rate": round(self.random.uniform(0.12, 0.19), 3),
+                    "region": self.random.choice(REGIONS)[1],
                 }
             )
 
@@ -49,7 +46,7 @@ class DataTransferGenerator(AWSGenerator):
         """Get data transfer info."""
         location1, aws_region, _, storage_region1 = self._get_location(config=config)
         location2, _, _, storage_region2 = self._get_location(config=config)
-        trans_desc, operation, trans_type = choice(self.DATA_TRANSFER)
+        trans_desc, operation, trans_type = self.random.choice(self.DATA_TRANSFER)
         trans_desc = trans_desc.format(storage_region1, storage_region2)
         description = f"${rate} per GB - {location1} data transfer to {location2}"
         return trans_desc, operation, description, location1, location2, trans_type, aws_region
@@ -15,9 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for ebs data generation."""
-from random import choice
-from random import uniform
-
 from nise.generators.aws.aws_generator import AWSGenerator
 from nise.generators.aws.constants import REGIONS
 
@@ -35,12 +32,16 @@ class EBSGenerator(AWSGenerator):
         self.TEMPLATE_KWARGS["ebs_gens"] = []
         while len(self.TEMPLATE_KWARGS["ebs_gens"]) < count:
             self.TEMPLATE_KWARGS["ebs_gens"].append(
-                {"amount": uniform(0.2, 300.99), "rate": round(uniform(0.02, 0.16), 3), "region": choice(REGIONS)[1]}
+                {
+                    "amount": self.random.uniform(0.2, 300.99),
+                    "rate": round(self.random.uniform(0.02, 0.16), 3),
+                    "region": self.random.choice(REGIONS)[1],
+                }
             )
 
     def _get_storage(self):
         """Get storage data."""
-        return choice(self.STORAGE)
+        return self.random.choice(self.STORAGE)
 
     def _update_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
@@ -15,8 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for ec2 data generation."""
-from random import choice
-
 from nise.generators.aws.aws_generator import AWSGenerator
 from nise.generators.aws.constants import ARCHS
 from nise.generators.aws.constants import EC2_INSTANCE_TYPES
@@ -35,9 +33,9 @@ class EC2Generator(AWSGenerator):
         while len(self.TEMPLATE_KWARGS["ec2_gens"]) < count:
             self.TEMPLATE_KWARGS["ec2_gens"].append(
                 {
-                    "region": choice(REGIONS)[1],
-                    "processor_arch": choice(ARCHS),
-                    "instance_type": choice(EC2_INSTANCE_TYPES),
+                    "region": self.random.choice(REGIONS)[1],
+                    "processor_arch": self.random.choice(ARCHS),
+                    "instance_type": self.random.choice(EC2_INSTANCE_TYPES),
                     "tags": [{"key": self.fake.word(), "value": self.fake.word()}],
                 }
             )
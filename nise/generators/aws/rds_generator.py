@@ -15,8 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for rds data generation."""
-from random import choice
-
 from nise.generators.aws.aws_generator import AWSGenerator
 from nise.generators.aws.constants import ARCHS
 from nise.generators.aws.constants import RDS_INSTANCE_TYPES
@@ -32,9 +30,9 @@ class RDSGenerator(AWSGenerator):
         while len(self.TEMPLATE_KWARGS["rds_gens"]) < count:
             self.TEMPLATE_KWARGS["rds_gens"].append(
                 {
-                    "region": choice(REGIONS)[1],
-                    "processor_arch": choice(ARCHS),
-                    "instance_type": choice(RDS_INSTANCE_TYPES),
+                    "region": self.random.choice(REGIONS)[1],
+                    "processor_arch": self.random.choice(ARCHS),
+                    "instance_type": self.random.choice(RDS_INSTANCE_TYPES),
                 }
             )
 
@@ -15,8 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for route 53 data generation."""
-from random import choices
-
 from nise.generators.aws.aws_generator import AWSGenerator
 from nise.generators.aws.constants import ROUTE_53_PRODUCTS
 from nise.generators.aws.constants import ROUTE_53_PRODUCTS_DICT
@@ -30,7 +28,7 @@ class Route53Generator(AWSGenerator):
         self.TEMPLATE_KWARGS["route53_gens"] = []
         while len(self.TEMPLATE_KWARGS["route53_gens"]) < count:
             self.TEMPLATE_KWARGS["route53_gens"].append(
-                {"product_family": choices(ROUTE_53_PRODUCTS, weights=[1, 10])[0]}
+                {"product_family": self.random.choices(ROUTE_53_PRODUCTS, weights=[1, 10])[0]}
             )
 
     def _get_arn(self, resource_id):
@@ -42,7 +40,7 @@ class Route53Generator(AWSGenerator):
         current_config = kwargs.get("config", {})
 
         product_family, usage_type, rate, cost = ROUTE_53_PRODUCTS_DICT.get(current_config.get("product_family"))
-        operation = self.fake.pystr(min_chars=1, max_chars=6).upper()
+        operation = self.ids.pystr(min_chars=1, max_chars=6).upper()
         if usage_type == "HostedZone":
             operation = usage_type
         row = self._add_common_usage_info(row, start, end)
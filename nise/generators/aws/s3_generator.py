@@ -15,8 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for s3 data generation."""
-from random import uniform
-
 from nise.generators.aws.aws_generator import AWSGenerator
 
 
@@ -28,7 +26,7 @@ class S3Generator(AWSGenerator):
         self.TEMPLATE_KWARGS["s3_gens"] = []
         while len(self.TEMPLATE_KWARGS["s3_gens"]) < count:
             self.TEMPLATE_KWARGS["s3_gens"].append(
-                {"amount": uniform(0.2, 6000.99), "rate": round(uniform(0.02, 0.06), 3)}
+                {"amount": self.random.uniform(0.2, 6000.99), "rate": round(self.random.uniform(0.02, 0.06), 3)}
             )
 
     def _get_arn(self, avail_zone, config):
@@ -17,14 +17,15 @@
 """Defines the abstract generator."""
 import datetime
 import json
+import random
 from abc import abstractmethod
 from copy import deepcopy
-from random import choice
-from random import randint
 
 from dateutil.relativedelta import relativedelta
 from nise.generators.generator import AbstractGenerator
-from nise.util import load_yaml
+from nise.generators.generator import get_static_config
+from nise.util import derive_seed
+from nise.util import random_streams
 
 AZURE_COLUMNS = (
     "SubscriptionGuid",
@@ -93,41 +94,65 @@ class AzureGenerator(AbstractGenerator):
 
     TEMPLATE = "azure.j2"
 
-    TEMPLATE_KWARGS = {
-        "payer": AbstractGenerator.fake.uuid4(),
-        "users": [AbstractGenerator.fake.uuid4() for _ in range(0, randint(2, 6))],
-    }
+    # Filled by init_template_kwargs() on first use.
+    TEMPLATE_KWARGS = {}
+
+    def __init__(self, start_date, end_date, cache={}, user_config=None, seed=None, meter_seed=None):
+        """Initialize the generator.
+
+        Args:
+            seed (int): seed of the random values of the generator.
+            meter_seed (int): seed of the meter values, shared by the generators of every month of a run.
+        """
+        self.meter_seed = meter_seed
+        self.init_template_kwargs()
+        self.seed_random(seed)
 
-    def __init__(self, start_date, end_date, cache={}, user_config=None):
-        """Initialize the generator."""
         # generate the same number of elements as the static file, if there is one
         # this is needed to ensure that deepupdate() works correctly.
-        gen_count = randint(2, 6)
+        gen_count = self.random.randint(2, 6)
+        user_config = get_static_config(user_config)
         if user_config:
-            preload = load_yaml(user_config)
-            seen = {}
-            for generators in preload.get("generators"):
-                for key in generators.keys():
-                    if key in seen.keys():
-                        seen[key] += 1
-                    else:
-                        seen[key] = 1
             name = type(self).__name__
-            if name in seen:
-                gen_count = seen[name]
+            if name in user_config.counts:
+                gen_count = user_config.counts[name]
         self._gen_fake_data(gen_count)
 
         # pass an element of the instance_id defaults into the template
         svcname, svctype = self._get_accts_str(self.SERVICE_NAME)
         self.TEMPLATE_KWARGS["_service_name"] = "{}/{}".format(svcname, svctype[:-1])
 
-        super().__init__(start_date, end_date, user_config=user_config)
+        super().__init__(start_date, end_date, user_config=user_config, seed=seed)
 
         self._meter_cache = cache
+        # The cache may live in a manager process, so each meter is asked for once per generator.
+        self._local_meters = {}
 
         # Azure end_date is always the following day
         self.end_date += relativedelta(days=1)
 
+    @classmethod
+    def init_template_kwargs(cls, seed=None, accounts=None):
+        """Generate the payer and user accounts shared by every Azure generator.
+
+        Reports call it once per run and pass the accounts it returns to their worker
+        processes, which may not inherit the accounts of the parent process.
+
+        Args:
+            seed (int): seed of the accounts, replacing the accounts generated earlier.
+            accounts (dict): accounts returned by an earlier call, replacing the current accounts.
+        Returns:
+            (dict): the accounts
+        """
+        if accounts:
+            AzureGenerator.TEMPLATE_KWARGS.update(accounts)
+        elif seed is not None or "payer" not in AzureGenerator.TEMPLATE_KWARGS:
+            rng, fake, _ = random_streams(seed)
+            AzureGenerator.TEMPLATE_KWARGS.update(
+                payer=fake.uuid4(), users=[fake.uuid4() for _ in range(0, rng.randint(2, 6))]
+            )
+        return {key: AzureGenerator.TEMPLATE_KWARGS[key] for key in ("payer", "users")}
+
     @abstractmethod
     def _gen_fake_data(self, count):
         """Populate TEMPLATE_KWARGS with fake values."""
@@ -145,28 +170,37 @@ class AzureGenerator(AbstractGenerator):
                 if not val.get("payer_account"):
                     updated["generators"][idx][key]["payer_account"] = payer
                 if not val.get("usage_accounts"):
-                    updated["generators"][idx][key]["usage_accounts"] = tuple(set([payer] + users))
+                    updated["generators"][idx][key]["usage_accounts"] = tuple(dict.fromkeys([payer] + users))
         return updated
 
     def _get_accts_str(self, service_name):
         """Return instance idea fields."""
         if service_name == "Bandwidth":
-            service_name = choice(self.SERVICE_NAMES)
+            service_name = self.random.choice(self.SERVICE_NAMES)
         return self.ACCTS_STR[service_name]
 
     def _get_cached_meter_values(self, meter_id, service_meter):
         """Return meter cached meter data to ensure meter_id and values are consistent."""
-        if not self._meter_cache.get(meter_id):
-            self._meter_cache[meter_id] = choice(service_meter)
-        return self._meter_cache.get(meter_id)
+        meter_values = self._local_meters.get(meter_id)
+        if meter_values:
+            return meter_values
+        meter_values = self._meter_cache.get(meter_id)
+        if not meter_values:
+            # A seeded run picks the values from its meter seed and the meter id alone, so
+            # every month picks the same values whichever of them is generated first.
+            rng = self.random if self.meter_seed is None else random.Random(derive_seed(self.meter_seed, meter_id))
+            # setdefault keeps the first value when months are generated concurrently with a shared cache.
+            meter_values = self._meter_cache.setdefault(meter_id, rng.choice(service_meter))
+        self._local_meters[meter_id] = meter_values
+        return meter_values
 
     def _get_resource_info(self, meter_id, service_meter, ex_resource, add_info, service_info):
         """Return resource information."""
         service_tier, meter_sub, meter_name, units_of_measure = self._get_cached_meter_values(meter_id, service_meter)
 
-        resource_group, resource_name = choice(ex_resource)
-        additional_info = choice(add_info)
-        service_info_2 = choice(service_info)
+        resource_group, resource_name = self.random.choice(ex_resource)
+        additional_info = self.random.choice(add_info)
+        service_info_2 = self.random.choice(service_info)
         self._consumed, second_part = self._get_accts_str(self.SERVICE_NAME)
         self._resource_type = self._consumed + "/" + second_part
 
@@ -197,9 +231,9 @@ class AzureGenerator(AbstractGenerator):
         """Pick resource location."""
         filtered = list(filter(lambda x: config.get("resource_location") in x, self.RESOURCE_LOCATION))
         if filtered:
-            location = choice(filtered)
+            location = self.random.choice(filtered)
         else:
-            location = choice(self.RESOURCE_LOCATION)
+            location = self.random.choice(self.RESOURCE_LOCATION)
         return location
 
     def _add_common_usage_info(self, row, start, end, **kwargs):
@@ -274,16 +308,13 @@ class AzureGenerator(AbstractGenerator):
         return []
 
     def _generate_daily_data(self):
-        """Create daily data."""
-        data = []
+        """Yield daily data rows."""
         for day in self.days:
             for cfg in self.config:
                 start = day.get("start")
                 end = day.get("end")
                 row = self._init_data_row(start, end)
-                row = self._update_data(row, start, end, config=cfg)
-                data.append(row)
-        return data
+                yield self._update_data(row, start, end, config=cfg)
 
     def generate_data(self, report_type=None):
         """Responsible for generating data."""
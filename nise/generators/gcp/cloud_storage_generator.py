@@ -15,9 +15,6 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for gcp cloud storage data generation."""
-from random import choice
-from random import randint
-
 from nise.generators.gcp.gcp_generator import GCPGenerator
 
 
@@ -43,15 +40,17 @@ class CloudStorageGenerator(GCPGenerator):
         ),
     )
 
-    def __init__(self, start_date, end_date, project, user_config=None):
+    def __init__(self, start_date, end_date, project, user_config=None, seed=None):
         """Initialize the generator."""
+        self.seed_random(seed)
+
         # pass defaults to the template.
-        num_instances = randint(2, 10)
+        num_instances = self.random.randint(2, 10)
         self.TEMPLATE_KWARGS["cloudstorage_gens"] = []
         for _ in range(0, num_instances):
-            self.TEMPLATE_KWARGS["cloudstorage_gens"].append({"_storage": choice(self.STORAGE)})
+            self.TEMPLATE_KWARGS["cloudstorage_gens"].append({"_storage": self.random.choice(self.STORAGE)})
 
-        super().__init__(start_date, end_date, project, user_config=user_config)
+        super().__init__(start_date, end_date, project, user_config=user_config, seed=seed)
 
     def _update_data(self, row, config={}):
         """Update a data row with storage values."""
@@ -68,14 +67,17 @@ class CloudStorageGenerator(GCPGenerator):
         return row
 
     def generate_data(self, report_type=None):
-        """Generate GCP storage data for some days."""
+        """Generate GCP storage data for some days.
+
+        Yields:
+            (datetime, List): the start of a day and the rows of that day
+
+        """
         days = self._create_days_list(self.start_date, self.end_date)
-        data = {}
         for day in days:
             rows = []
             for config in self.config:
                 row = self._init_data_row(day["start"], day["end"])
                 row = self._update_data(row, config=config)
                 rows.append(row)
-            data[day["start"]] = rows
-        return data
+            yield day["start"], rows
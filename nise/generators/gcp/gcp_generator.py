@@ -51,7 +51,7 @@ class GCPGenerator(AbstractGenerator):
     # Not yet implemented.
     TEMPLATE_KWARGS = {}
 
-    def __init__(self, start_date, end_date, project, user_config=None):
+    def __init__(self, start_date, end_date, project, user_config=None, seed=None):
         """
         Initialize the generator.
 
@@ -59,9 +59,10 @@ class GCPGenerator(AbstractGenerator):
             start_date (datetime): Day to start generating reports from.
             end_date (datetime): Last day to generate reports for.
             project (int): GCP project number
+            seed (int): seed of the random values of the generator.
         """
         self.TEMPLATE_KWARGS["project_gens"] = [{}]
-        super().__init__(start_date, end_date, user_config=user_config)
+        super().__init__(start_date, end_date, user_config=user_config, seed=seed)
 
         self.project = project
 
@@ -90,7 +91,7 @@ class GCPGenerator(AbstractGenerator):
 
     @abstractmethod
     def generate_data(self, report_type=None):
-        """Responsible for generating data."""
+        """Responsible for generating data, yielding (day start, rows) one day at a time."""
 
     def _init_data_row(self, start, end, **kwargs):  # noqa: C901
         """Create a row of data with placeholder for all headers."""
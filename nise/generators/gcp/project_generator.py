@@ -15,16 +15,21 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Module for generating GCP Projects."""
-from faker import Faker
+from nise.util import random_streams
 
 
 class ProjectGenerator:
     """Generator for GCP Compute Engine data."""
 
-    def __init__(self, account):
-        """Initialize GCP Project Generator."""
+    def __init__(self, account, seed=None):
+        """Initialize GCP Project Generator.
+
+        Args:
+            account (str): GCP account of the projects
+            seed (int): seed of the fake project values
+        """
         self.account = account
-        self.fake = Faker()
+        _, self.fake, _ = random_streams(seed)
 
     def generate_projects(self, num_projects=1):
         """Generate GCP project information."""
@@ -17,28 +17,111 @@
 """Defines the abstract generator."""
 import datetime
 import os
+import random
 from abc import ABC
 from abc import abstractmethod
+from collections import Counter
+from copy import deepcopy
+from functools import lru_cache
+from operator import itemgetter
 from pprint import pformat
 
-from faker import Faker
 from jinja2 import ChoiceLoader
 from jinja2 import Environment
 from jinja2 import FileSystemLoader
 from jinja2 import PackageLoader
+from nise.jinja_ext import bind_faker_passthrough
 from nise.jinja_ext import faker_passthrough
 from nise.util import deepupdate
+from nise.util import FAKER
+from nise.util import ID_FACTORY
 from nise.util import load_yaml
 from nise.util import LOG
+from nise.util import random_streams
 
 REPORT_TYPE = "report_type"
-LOADER_LIST = []
+ENVIRONMENT_CACHE_SIZE = 32
+TEMPLATE_CACHE_SIZE = 64
+
+
+@lru_cache(maxsize=ENVIRONMENT_CACHE_SIZE)
+def get_template_environment(user_config_dir=None):
+    """Return the Jinja environment for the package templates and an optional user config directory.
+
+    Environments are cached per directory so templates are compiled once per process.
+    """
+    loaders = [PackageLoader("nise")]
+    if user_config_dir:
+        loaders.append(FileSystemLoader(user_config_dir))
+
+    env = Environment(loader=ChoiceLoader(loaders), cache_size=TEMPLATE_CACHE_SIZE)
+    env.globals["faker"] = faker_passthrough
+    return env
+
+
+class StaticConfig:
+    """A static report file parsed once per run and shared by every generator."""
+
+    TEMPLATE_TOKENS = ("{{", "{%", "{#")
+
+    def __init__(self, path, data=None):
+        """Initialize the static config.
+
+        Args:
+            path (str): path to the static report file.
+            data (dict): the already parsed static report file, if available.
+        """
+        self.path = path
+        self.directory = os.path.abspath(os.path.dirname(path))
+        self.data = data if data is not None else load_yaml(path)
+        self.counts = Counter(key for generators in self.data.get("generators", []) for key in generators.keys())
+        self._is_template = None
+        self._user_yaml = None
+
+    @staticmethod
+    def _sort_generators(user_yaml):
+        """Sort lists of dicts so that generator class names align."""
+        generators = user_yaml.get("generators")
+        user_yaml["generators"] = sorted(generators, key=lambda d: list(d.keys()))
+        return user_yaml
+
+    def is_template(self):
+        """Return True if the static file uses Jinja syntax and must be rendered per generator."""
+        if self._is_template is None:
+            with open(self.path) as static_file:
+                source = static_file.read()
+            self._is_template = any(token in source for token in self.TEMPLATE_TOKENS)
+        return self._is_template
+
+    def render(self, env, template_kwargs):
+        """Return a private copy of the static config for one generator."""
+        if self.is_template():
+            user_template = env.get_template(os.path.basename(self.path))
+            return self._sort_generators(load_yaml(user_template.render(**template_kwargs)))
+
+        if self._user_yaml is None:
+            self._user_yaml = self._sort_generators(deepcopy(self.data))
+        return deepcopy(self._user_yaml)
+
+
+def get_static_config(user_config):
+    """Return user_config as a StaticConfig, parsing the file if a path was given."""
+    if not user_config:
+        return None
+    if isinstance(user_config, StaticConfig):
+        return user_config
+    return StaticConfig(user_config)
 
 
 class AbstractGenerator(ABC):
     """Defines a abstract class for generators."""
 
-    fake = Faker()
+    fake = FAKER
+    # Faster source of the names and IDs generated per row or per resource
+    ids = ID_FACTORY
+    # Source of random choices and samples, see seed_random()
+    random = random
+    seed = None
 
     # Jinja template filename defined by each generator
     TEMPLATE = None
@@ -46,34 +129,33 @@ class AbstractGenerator(ABC):
     # keyword args passed to TEMPLATE
     TEMPLATE_KWARGS = None
 
-    def __init__(self, start_date, end_date, user_config=None):
-        """Initialize the generator."""
+    def __init__(self, start_date, end_date, user_config=None, seed=None):
+        """Initialize the generator.
+
+        Args:
+            user_config (str or StaticConfig): static report file to merge with the default template.
+            seed (int): seed of the random values of the generator, see seed_random().
+        """
+        if self.seed is None:
+            self.seed_random(seed)
+
         if not self.TEMPLATE:
             raise AttributeError("Class attribute 'TEMPLATE' must be defined.")
 
         if not self.TEMPLATE_KWARGS:
             raise AttributeError("Class attribute 'TEMPLATE_KWARGS' must be defined.")
 
-        LOADER_LIST.append(PackageLoader("nise"))
-        if user_config:
-            LOADER_LIST.append(FileSystemLoader(os.path.abspath(os.path.dirname(user_config))))
-
-        env = Environment(loader=ChoiceLoader(LOADER_LIST))
-        env.globals["faker"] = faker_passthrough
+        user_config = get_static_config(user_config)
+        env = get_template_environment(user_config.directory if user_config else None)
 
         default_template = env.get_template(self.TEMPLATE)
+        template_kwargs = dict(self.TEMPLATE_KWARGS, faker=bind_faker_passthrough(self.fake))
         if user_config:
-            user_template = env.get_template(os.path.basename(user_config))
-            user_yaml = load_yaml(user_template.render(**self.TEMPLATE_KWARGS))
-
-            # sort lists of dicts so that generator class names align.
-            generators = user_yaml.get("generators")
-            user_yaml["generators"] = sorted(generators, key=lambda d: list(d.keys()))
-
-            default_yaml = load_yaml(default_template.render(**self.TEMPLATE_KWARGS))
+            user_yaml = user_config.render(env, template_kwargs)
+            default_yaml = load_yaml(default_template.render(**template_kwargs))
             config = deepupdate(default_yaml, user_yaml)  # merge user-supplied static file with base template
         else:
-            config = load_yaml(default_template.render(**self.TEMPLATE_KWARGS))
+            config = load_yaml(default_template.render(**template_kwargs))
 
         # handle special-cases in YAML config syntax
         config = self._format_config(config)
@@ -94,6 +176,16 @@ class AbstractGenerator(ABC):
 
         super().__init__()
 
+    def seed_random(self, seed=None):
+        """Give the generator its own random, Faker and ID streams derived from seed.
+
+        Without a seed the generator draws from the random module and the shared Faker.
+        Subclasses that draw values before calling AbstractGenerator.__init__ seed first.
+        """
+        if seed is not None:
+            self.seed = seed
+            self.random, self.fake, self.ids = random_streams(seed)
+
     @abstractmethod
     def _format_config(self, config):
         """Abstract method for sub-classes to handle special cases in the config layout.
@@ -185,3 +277,13 @@ class AbstractGenerator(ABC):
     @abstractmethod
     def generate_data(self, report_type=None):
         """Responsible for generating data."""
+
+    def generate_rows(self, columns, report_type=None):
+        """Generate data rows as tuples in the given column order.
+
+        Every row produced by generate_data() holds a value for each report column,
+        so a single itemgetter built for the run replaces a per-row dict lookup per field.
+        """
+        getter = itemgetter(*columns)
+        for row in self.generate_data(report_type):
+            yield getter(row)
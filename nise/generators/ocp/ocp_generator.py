@@ -16,18 +16,18 @@
 #
 """Defines the abstract generator."""
 import datetime
-from copy import deepcopy
-from random import choice
-from random import choices
-from random import randint
-from random import uniform
+import random
 
 from dateutil import parser
 from nise.generators.generator import AbstractGenerator
 from nise.generators.generator import REPORT_TYPE
+from nise.util import derive_seed
 
 GIGABYTE = 1024 * 1024 * 1024
 HOUR = 60 * 60
+FULL_PERIOD = "full_period"
+# Hours of pod usage sampled at once by vectorized sampling, bounding the samples held in memory.
+VECTORIZED_HOURS = 24
 
 OCP_POD_USAGE = "ocp_pod_usage"
 OCP_STORAGE_USAGE = "ocp_storage_usage"
@@ -93,22 +93,39 @@ class OCPGenerator(AbstractGenerator):
     # Keyword args passed to TEMPLATE at render time.
     TEMPLATE_KWARGS = {"start_date": None, "end_date": None, "nodes": []}
 
-    def __init__(self, start_date, end_date, user_config=None):
-        """Initialize the generator."""
+    def __init__(self, start_date, end_date, user_config=None, vectorized=False, seed=None):
+        """Initialize the generator.
+
+        Args:
+            vectorized (Boolean): sample the hourly pod usage with NumPy, one call per pod for all hours
+            seed (int): seed of the random values of the generator
+
+        """
+        self.seed_random(seed)
+
+        # Seeded from self.random so that seeding the generator also fixes the NumPy samples.
+        self._rng = None
+        if vectorized:
+            # numpy is imported by the methods that use it, so runs without vectorized sampling skip its import.
+            try:
+                import numpy
+            except ImportError:
+                raise ImportError("numpy is required for vectorized OCP usage sampling.")
+            self._rng = numpy.random.default_rng(self.random.getrandbits(64))
+
         # initialize TEMPLATE_KWARGS values
         if not user_config:
             self._gen_nodes()
 
         # super() renders the TEMPLATE
-        super().__init__(start_date, end_date, user_config=user_config)
+        super().__init__(start_date, end_date, user_config=user_config, seed=seed)
 
         self.nodes = [node for conf in self.config for node in conf.get("nodes")]
+        self._normalize_node_usage()
 
         self.ocp_report_generation = {
-            OCP_POD_USAGE: {
-                "_generate_hourly_data": self._gen_hourly_pods_usage,
-                "_update_data": self._update_pod_data,
-            },
+            # Pod rows are built from _pod_rows(), which computes the fields of each pod once for every hour.
+            OCP_POD_USAGE: {"_generate_hourly_data": self._gen_hourly_pods_usage},
             OCP_STORAGE_USAGE: {
                 "_generate_hourly_data": self._gen_hourly_storage_usage,
                 "_update_data": self._update_storage_data,
@@ -135,7 +152,7 @@ class OCPGenerator(AbstractGenerator):
         nodes = []
         for _ in range(0, self.fake.pyint(2, 6)):
             node = {
-                "node_name": "node_" + self.fake.word(),
+                "node_name": "node_" + self.ids.word(),
                 "cpu_cores": self.fake.pyint(2, 16),
                 "memory_gig": self.fake.pyint(16, 256),
                 "resource_id": "i-" + self.fake.ean8(),
@@ -152,7 +169,7 @@ class OCPGenerator(AbstractGenerator):
     def _gen_namespaces(self, node):
         """Create namespaces on specific nodes and keep relationship."""
         namespaces = []
-        names = ["ns_" + self.fake.word() for _ in range(0, self.fake.pyint(1, 4))]
+        names = ["ns_" + self.ids.word() for _ in range(0, self.fake.pyint(1, 4))]
         for name in names:
             pods = self._gen_pods(node, name)
             namespace = {"namespace_name": name, "pods": pods, "volumes": self._gen_volumes(pods)}
@@ -161,10 +178,10 @@ class OCPGenerator(AbstractGenerator):
 
     def _gen_openshift_labels(self, seeding=None):
         """Create pod labels for output data."""
-        self.apps = [self.fake.word() for _ in range(0, self.fake.pyint(3, 6))]
-        self.organizations = [self.fake.word() for _ in range(0, self.fake.pyint(3, 6))]
-        self.markets = [self.fake.word() for _ in range(0, self.fake.pyint(3, 6))]
-        self.versions = [self.fake.word() for _ in range(0, self.fake.pyint(3, 6))]
+        self.apps = [self.ids.word() for _ in range(0, self.fake.pyint(3, 6))]
+        self.organizations = [self.ids.word() for _ in range(0, self.fake.pyint(3, 6))]
+        self.markets = [self.ids.word() for _ in range(0, self.fake.pyint(3, 6))]
+        self.versions = [self.ids.word() for _ in range(0, self.fake.pyint(3, 6))]
         seeded_labels = {
             "environment": ["dev", "ci", "qa", "stage", "prod"],
             "app": self.apps,
@@ -174,16 +191,16 @@ class OCPGenerator(AbstractGenerator):
         }
         if seeding:
             seeded_labels = seeding
-        gen_label_keys = [self.fake.word() for _ in range(0, self.fake.pyint(3, 6))]
+        gen_label_keys = [self.ids.word() for _ in range(0, self.fake.pyint(3, 6))]
         all_label_keys = list(seeded_labels.keys()) + gen_label_keys
-        num_labels = randint(2, len(all_label_keys))
-        chosen_label_keys = choices(all_label_keys, k=num_labels)
+        num_labels = self.random.randint(2, len(all_label_keys))
+        chosen_label_keys = self.random.choices(all_label_keys, k=num_labels)
 
         labels = {}
         for label_key in chosen_label_keys:
-            label_value = self.fake.word()
+            label_value = self.ids.word()
             if label_key in seeded_labels:
-                label_value = choice(seeded_labels[label_key])
+                label_value = self.random.choice(seeded_labels[label_key])
             labels[f"label_{label_key}"] = label_value
 
         label_str = ""
@@ -206,17 +223,17 @@ class OCPGenerator(AbstractGenerator):
             if mem_used >= memory_gig * 0.95:
                 break
 
-            pod_name = "pod_" + self.fake.word()
+            pod_name = "pod_" + self.ids.word()
 
-            cpu_request = round(uniform(0.02, cpu_cores), 5)
-            cpu_limit = round(uniform(cpu_request, cpu_cores), 5)
-            pod_cpu_usage = round(uniform(0.02, cpu_limit), 5)
+            cpu_request = round(self.random.uniform(0.02, cpu_cores), 5)
+            cpu_limit = round(self.random.uniform(cpu_request, cpu_cores), 5)
+            pod_cpu_usage = round(self.random.uniform(0.02, cpu_limit), 5)
             cpu_usage = {"full_period": pod_cpu_usage}
             cpu_used += pod_cpu_usage
 
-            mem_request_gig = round(uniform(1, memory_gig), 2)
-            mem_limit_gig = round(uniform(mem_request_gig, memory_gig), 2)
-            pod_mem_usage = round(uniform(1, mem_limit_gig), 2)
+            mem_request_gig = round(self.random.uniform(1, memory_gig), 2)
+            mem_limit_gig = round(self.random.uniform(mem_request_gig, memory_gig), 2)
+            pod_mem_usage = round(self.random.uniform(1, mem_limit_gig), 2)
             mem_usage_gig = {"full_period": pod_mem_usage}
             mem_used += pod_mem_usage
 
@@ -246,7 +263,7 @@ class OCPGenerator(AbstractGenerator):
         """Create volumes on specific namespaces and keep relationship."""
         volumes = []
         for _ in range(0, len(pods)):
-            volume_name = "vol_" + self.fake.word()
+            volume_name = "vol_" + self.ids.word()
             volume_request_gig = self.fake.pyint(20, 100)
             volume_request = volume_request_gig * GIGABYTE
             volume_claims = []
@@ -254,8 +271,8 @@ class OCPGenerator(AbstractGenerator):
             for _ in range(0, len(pods)):
                 if volume_request - total_claims <= GIGABYTE:
                     break
-                volume_claim_name = "vc_" + self.fake.word()
-                pod = choice(pods)
+                volume_claim_name = "vc_" + self.ids.word()
+                pod = self.random.choice(pods)
                 claim_capacity = min(
                     self.fake.pyint(20, 100) * GIGABYTE, (volume_request_gig * GIGABYTE - total_claims)
                 )
@@ -274,7 +291,7 @@ class OCPGenerator(AbstractGenerator):
                 {
                     "namespace": pod.get("namespace"),
                     "volume_name": volume_name,
-                    "storage_class": choice(("gp2", "fast", "slow", "gold")),
+                    "storage_class": self.random.choice(("gp2", "fast", "slow", "gold")),
                     "volume_request_gig": volume_request_gig,
                     "labels": self._gen_openshift_labels(),
                     "volume_claims": volume_claims,
@@ -309,51 +326,84 @@ class OCPGenerator(AbstractGenerator):
         row["interval_end"] = OCPGenerator.timestamp(end)
         return row
 
+    @staticmethod
+    def _normalize_usage(usage_dict):
+        """Key a usage dict by datetime.date, keeping the full_period entry as is."""
+        if not usage_dict:
+            return usage_dict
+        normalized = {}
+        for date, usage in usage_dict.items():
+            if date == FULL_PERIOD:
+                normalized[FULL_PERIOD] = usage
+            elif isinstance(date, datetime.datetime):
+                normalized[date.date()] = usage
+            elif isinstance(date, datetime.date):
+                normalized[date] = usage
+            else:
+                normalized[parser.parse(date).date()] = usage
+        return normalized
+
+    def _normalize_node_usage(self):
+        """Normalize the pod and volume claim usage dicts of all nodes for date lookups."""
+        for node in self.nodes:
+            for namespace in node.get("namespaces", []):
+                for pod in namespace.get("pods", []):
+                    pod["cpu_usage"] = self._normalize_usage(pod.get("cpu_usage"))
+                    pod["mem_usage_gig"] = self._normalize_usage(pod.get("mem_usage_gig"))
+                for volume in namespace.get("volumes", []):
+                    for volume_claim in volume.get("volume_claims", []):
+                        volume_claim["volume_claim_usage_gig"] = self._normalize_usage(
+                            volume_claim.get("volume_claim_usage_gig")
+                        )
+
     @staticmethod
     def _get_usage_for_date(usage_dict, start):
-        """Return usage for specified hour."""
+        """Return usage for specified hour from a usage dict normalized by _normalize_usage.
+
+        Usage for the date of the hour takes precedence over the full_period usage.
+        """
         if usage_dict:
-            for date, usage in usage_dict.items():
-                if date == "full_period":
-                    return usage
-                if parser.parse(date).date() == start.date():
-                    return usage
+            usage = usage_dict.get(start.date())
+            if usage is None:
+                usage = usage_dict.get(FULL_PERIOD)
+            return usage
         return None
 
-    def _update_pod_data(self, row, start, end, **kwargs):
-        """Update data with generator specific data."""
-        del kwargs["report_type"]
-        pod = kwargs.pop("pod")
-
-        pod_seconds = kwargs.pop("pod_seconds")
-
+    @staticmethod
+    def _pod_usage_spec(pod, pod_seconds, cpu_usage, mem_usage_gig):
+        """Return the parameters used to sample the hourly usage of a pod."""
         cpu_request = pod.get("cpu_request")
         mem_request_gig = pod.get("mem_request_gig")
-
         cpu_limit = min(pod.get("cpu_limit"), cpu_request)
         mem_limit_gig = min(pod.get("mem_limit_gig"), mem_request_gig)
+        return (pod_seconds, cpu_request, cpu_limit, mem_request_gig, mem_limit_gig, cpu_usage, mem_usage_gig)
+
+    @staticmethod
+    def _pod_request_fields(spec):
+        """Return the request and limit columns of a pod, which are the same for every hour."""
+        pod_seconds, cpu_request, cpu_limit, mem_request_gig, mem_limit_gig, _, _ = spec
+        return {
+            "pod_request_cpu_core_seconds": pod_seconds * cpu_request,
+            "pod_limit_cpu_core_seconds": pod_seconds * cpu_limit,
+            "pod_request_memory_byte_seconds": pod_seconds * mem_request_gig * GIGABYTE,
+            "pod_limit_memory_byte_seconds": pod_seconds * mem_limit_gig * GIGABYTE,
+        }
+
+    def _pod_usage_seconds(self, spec, start):
+        """Sample the cpu core seconds and memory byte seconds used by a pod in an hour."""
+        pod_seconds, cpu_request, cpu_limit, mem_request_gig, mem_limit_gig, cpu_usage, mem_usage_gig = spec
 
-        cpu_usage = self._get_usage_for_date(kwargs.pop("cpu_usage"), start)
-        cpu = round(uniform(0.02, cpu_limit), 5)
+        cpu_usage = self._get_usage_for_date(cpu_usage, start)
+        cpu = round(self.random.uniform(0.02, cpu_limit), 5)
         if cpu_usage:
             cpu = min(cpu_limit, cpu_request, cpu_usage)
 
-        mem_usage_gig = self._get_usage_for_date(kwargs.pop("mem_usage_gig"), start)
-        mem = round(uniform(1, mem_limit_gig), 2)
+        mem_usage_gig = self._get_usage_for_date(mem_usage_gig, start)
+        mem = round(self.random.uniform(1, mem_limit_gig), 2)
         if mem_usage_gig:
             mem = min(mem_limit_gig, mem_request_gig, mem_usage_gig)
 
-        kwargs["pod"] = pod.get("pod_name")
-        kwargs["pod_usage_cpu_core_seconds"] = pod_seconds * cpu
-        kwargs["pod_request_cpu_core_seconds"] = pod_seconds * cpu_request
-        kwargs["pod_limit_cpu_core_seconds"] = pod_seconds * cpu_limit
-        kwargs["pod_usage_memory_byte_seconds"] = pod_seconds * mem * GIGABYTE
-        kwargs["pod_request_memory_byte_seconds"] = pod_seconds * mem_request_gig * GIGABYTE
-        kwargs["pod_limit_memory_byte_seconds"] = pod_seconds * mem_limit_gig * GIGABYTE
-        kwargs["interval_start"] = start
-        kwargs["interval_end"] = end
-        row.update(kwargs)
-        return row
+        return pod_seconds * cpu, pod_seconds * mem * GIGABYTE
 
     def _update_storage_data(self, row, start, end, **kwargs):
         """Update data with generator specific data."""
@@ -362,7 +412,7 @@ class OCPGenerator(AbstractGenerator):
         volume_request = kwargs.get("volume_request")
         vc_capacity_gig = min(kwargs.get("vc_capacity", 10.0), volume_request)
 
-        vc_usage_gig = round(uniform(2.0, vc_capacity_gig), 2)
+        vc_usage_gig = round(self.random.uniform(2.0, vc_capacity_gig), 2)
         if volume_claim_usage_gig:
             vc_usage_gig = min(volume_claim_usage_gig, vc_capacity_gig)
         vc_usage = vc_usage_gig * GIGABYTE
@@ -403,41 +453,107 @@ class OCPGenerator(AbstractGenerator):
         row = method(row, start, end, **kwargs)
         return row
 
+    def _pod_rows(self):
+        """Return the fields of each pod usage row that do not change between hours, with its usage spec."""
+        pods = []
+        for node in self.nodes:
+            node_fields = {
+                "node": node.get("node_name"),
+                "resource_id": node.get("resource_id"),
+                "node_capacity_cpu_cores": node.get("cpu_cores"),
+                "node_capacity_cpu_core_seconds": node.get("cpu_cores") * 3600,
+                "node_capacity_memory_bytes": node.get("memory_gig") * GIGABYTE,
+                "node_capacity_memory_byte_seconds": node.get("memory_gig") * GIGABYTE,
+            }
+            for namespace in node.get("namespaces", []):
+                name = namespace.get("namespace_name")
+                for pod in namespace.get("pods", []):
+                    spec = self._pod_usage_spec(
+                        pod, pod.get("pod_seconds"), pod.get("cpu_usage"), pod.get("mem_usage_gig")
+                    )
+                    fields = dict(node_fields, namespace=name, pod=pod.get("pod_name"), pod_labels=pod.get("labels"))
+                    fields.update(self._pod_request_fields(spec))
+                    pods.append((fields, spec))
+        return pods
+
+    def _usage_by_hour(self, usage_dict, starts):
+        """Return the usage of each hour as an array, 0 where there is none."""
+        import numpy
+
+        if not usage_dict:
+            return numpy.zeros(len(starts))
+        if list(usage_dict) == [FULL_PERIOD]:
+            return numpy.full(len(starts), usage_dict[FULL_PERIOD] or 0, dtype=float)
+        return numpy.array([self._get_usage_for_date(usage_dict, start) or 0 for start in starts], dtype=float)
+
+    def _sample_pods_usage_seconds(self, pods, starts):
+        """Sample the usage seconds of every pod for the given hours with one NumPy call per pod and column.
+
+        Returns:
+            (ndarray): the cpu core seconds, a row per hour and a column per pod
+            (ndarray): the memory byte seconds, a row per hour and a column per pod
+
+        """
+        import numpy
+
+        cpu_seconds = []
+        mem_seconds = []
+        for _, spec in pods:
+            pod_seconds, cpu_request, cpu_limit, mem_request_gig, mem_limit_gig, cpu_usage, mem_usage_gig = spec
+
+            cpu = numpy.round(self._rng.uniform(0.02, cpu_limit, len(starts)), 5)
+            cpu_usage = self._usage_by_hour(cpu_usage, starts)
+            cpu = numpy.where(cpu_usage != 0, numpy.minimum(min(cpu_limit, cpu_request), cpu_usage), cpu)
+
+            mem = numpy.round(self._rng.uniform(1, mem_limit_gig, len(starts)), 2)
+            mem_usage_gig = self._usage_by_hour(mem_usage_gig, starts)
+            mem = numpy.where(
+                mem_usage_gig != 0, numpy.minimum(min(mem_limit_gig, mem_request_gig), mem_usage_gig), mem
+            )
+
+            cpu_seconds.append(pod_seconds * cpu)
+            mem_seconds.append(pod_seconds * mem * GIGABYTE)
+        return numpy.array(cpu_seconds).T, numpy.array(mem_seconds).T
+
     def _gen_hourly_pods_usage(self, **kwargs):
         """Create hourly data for pod usage."""
+        pods = self._pod_rows()
+        if self._rng is not None and pods:
+            yield from self._gen_hourly_pods_usage_vectorized(pods, **kwargs)
+            return
         for hour in self.hours:
             start = hour.get("start")
             end = hour.get("end")
-            for node in self.nodes:
-                for namespace in node.get("namespaces", []):
-                    name = namespace.get("namespace_name")
-                    for pod in namespace.get("pods", []):
-                        cpu_usage = pod.get("cpu_usage", None)
-                        mem_usage_gig = pod.get("mem_usage_gig", None)
-                        pod_seconds = pod.get("pod_seconds", None)
-                        row = self._init_data_row(start, end, **kwargs)
-                        row = self._update_data(
-                            row,
-                            start,
-                            end,
-                            pod=deepcopy(pod),
-                            cpu_usage=cpu_usage,
-                            mem_usage_gig=mem_usage_gig,
-                            pod_seconds=pod_seconds,
-                            namespace=name,
-                            node=node.get("node_name"),
-                            resource_id=node.get("resource_id"),
-                            node_capacity_cpu_cores=node.get("cpu_cores"),
-                            node_capacity_cpu_core_seconds=node.get("cpu_cores") * 3600,
-                            node_capacity_memory_bytes=node.get("memory_gig") * GIGABYTE,
-                            node_capacity_memory_byte_seconds=node.get("memory_gig") * GIGABYTE,
-                            pod_labels=pod.get("labels"),
-                            **kwargs,
-                        )
-                        row.pop("cpu_usage", None)
-                        row.pop("mem_usage_gig", None)
-                        row.pop("pod_seconds", None)
-                        yield row
+            hour_row = self._init_data_row(start, end, **kwargs)
+            hour_row["interval_start"] = start
+            hour_row["interval_end"] = end
+            for fields, spec in pods:
+                row = hour_row.copy()
+                row.update(fields)
+                row["pod_usage_cpu_core_seconds"], row["pod_usage_memory_byte_seconds"] = self._pod_usage_seconds(
+                    spec, start
+                )
+                yield row
+
+    def _gen_hourly_pods_usage_vectorized(self, pods, **kwargs):
+        """Create hourly data for pod usage from usage sampled for VECTORIZED_HOURS hours at a time."""
+        for first in range(0, len(self.hours), VECTORIZED_HOURS):
+            last = first + VECTORIZED_HOURS
+            hours = self.hours[first:last]
+            cpu_seconds, mem_seconds = self._sample_pods_usage_seconds(pods, [hour.get("start") for hour in hours])
+            for hour, hour_cpu_seconds, hour_mem_seconds in zip(hours, cpu_seconds, mem_seconds):
+                start = hour.get("start")
+                end = hour.get("end")
+                hour_row = self._init_data_row(start, end, **kwargs)
+                hour_row["interval_start"] = start
+                hour_row["interval_end"] = end
+                pod_seconds = zip(pods, hour_cpu_seconds.tolist(), hour_mem_seconds.tolist())
+                for (fields, _), pod_cpu_seconds, pod_mem_seconds in pod_seconds:
+                    row = hour_row.copy()
+                    row.update(fields)
+                    row["pod_usage_cpu_core_seconds"] = pod_cpu_seconds
+                    row["pod_usage_memory_byte_seconds"] = pod_mem_seconds
+                    yield row
 
     def _gen_hourly_storage_usage(self, **kwargs):
         """Create hourly data for storage usage."""
@@ -488,5 +604,13 @@ class OCPGenerator(AbstractGenerator):
 
     def generate_data(self, report_type=None):
         """Responsibile for generating data."""
+        if self.seed is not None:
+            # Each report type draws from its own stream, so report types generated by
+            # separate workers match report types generated one after the other.
+            self.random = random.Random(derive_seed(self.seed, report_type))
+            if self._rng is not None:
+                import numpy
+
+                self._rng = numpy.random.default_rng(self.random.getrandbits(64))
         meta = {REPORT_TYPE: report_type}
         return self._generate_hourly_data(**meta)
@@ -15,9 +15,9 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 """Jinja2 extensions."""
-from faker import Faker
+from nise.util import FAKER
 
-FAKE = Faker()
+FAKE = FAKER
 
 
 def faker_passthrough(provider, **kwargs):
@@ -33,3 +33,15 @@ def faker_passthrough(provider, **kwargs):
 
     """
     return getattr(FAKE, provider)(**kwargs)
+
+
+def bind_faker_passthrough(fake):
+    """Return a faker_passthrough drawing from the given Faker instead of the shared one.
+
+    Passing the result to a template render as ``faker`` seeds the fake values of the template.
+    """
+
+    def passthrough(provider, **kwargs):
+        return getattr(fake, provider)(**kwargs)
+
+    return passthrough
@@ -21,7 +21,7 @@ from uuid import uuid4
 
 import jinja2
 from dateutil.relativedelta import relativedelta
-from faker import Faker
+from nise.util import FAKER
 
 TEMPLATE_DIR = os.path.dirname(__file__)
 AWS_TEMPLATE_FILE = "aws-template-manifest.json"
@@ -55,14 +55,14 @@ def _manifest_datetime_range(start, end):
     return start_str + "-" + end_str
 
 
-def aws_generate_manifest(template_data):
-    """Generate the manifest file.
+def aws_assembly_path(template_data, assembly_id):
+    """Build the S3 storage path of a report assembly.
 
     Args:
         template_data (Dict): data to render template with
+        assembly_id (UUID): the assembly identifier
     Returns:
         (String): S3 storage path
-        (String): Rendered template data
 
     """
     start = template_data.get("start_date")
@@ -71,18 +71,34 @@ def aws_generate_manifest(template_data):
     bp_end = bp_start + relativedelta(months=+1)
 
     range_str = _manifest_datetime_range(bp_start, bp_end)
-    assembly_id = uuid4()
-    report_id = Faker().sha256(raw_output=False)
     prefix_name = template_data.get("aws_prefix_name")
+    if prefix_name:
+        return f"{prefix_name}/{report_name}/{range_str}/{assembly_id}"
+    return f"/{report_name}/{range_str}/{assembly_id}"
+
+
+def aws_generate_manifest(template_data):
+    """Generate the manifest file.
+
+    Args:
+        template_data (Dict): data to render template with
+    Returns:
+        (String): S3 storage path
+        (String): Rendered template data
+
+    """
+    start = template_data.get("start_date")
+    bp_start = start.replace(microsecond=0, second=0, minute=0, hour=0, day=1)
+    bp_end = bp_start + relativedelta(months=+1)
+
+    assembly_id = template_data.get("assembly_id") or uuid4()
+    assembly_path = aws_assembly_path(template_data, assembly_id)
+    report_id = template_data.get("report_id") or FAKER.sha256(raw_output=False)
     file_names = template_data.get("file_names")
     report_keys = []
     for file_name in file_names:
         file_base_name = os.path.basename(file_name)
-        if prefix_name:
-            report_key = f"{prefix_name}/{report_name}/{range_str}" f"/{assembly_id}/{file_base_name}.gz"
-        else:
-            report_key = f"/{report_name}/{range_str}/{assembly_id}/{file_base_name}.gz"
-        report_keys.append(report_key)
+        report_keys.append(f"{assembly_path}/{file_base_name}.gz")
 
     render_data = {
         "assembly_id": assembly_id,
@@ -98,7 +114,6 @@ def aws_generate_manifest(template_data):
     template_env = jinja2.Environment(loader=template_loader)
     template = template_env.get_template(AWS_TEMPLATE_FILE)
     output = template.render(render_data)
-    assembly_path = os.path.dirname(report_keys[0])
     return assembly_path, output
 
 
@@ -17,7 +17,6 @@
 """Module responsible for generating the cost and usage report."""
 import base64
 import calendar
-import copy
 import csv
 import gzip
 import json
@@ -26,21 +25,32 @@ import random
 import shutil
 import string
 import tarfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
-from tempfile import gettempdir
+from io import BytesIO
+from io import TextIOWrapper
+from multiprocessing import Manager
+from operator import itemgetter
+from tempfile import mkdtemp
 from tempfile import NamedTemporaryFile
 from tempfile import TemporaryDirectory
+from uuid import UUID
 from uuid import uuid4
 
 import requests
 from dateutil import parser as date_parser
 from dateutil.relativedelta import relativedelta
-from faker import Faker
+from nise.cache import cache_key
+from nise.cache import ReportCache
 from nise.copy import copy_to_local_dir
 from nise.extract import extract_payload
+from nise.extract import month_date_range
 from nise.generators.aws import AWS_GENERATORS
+from nise.generators.aws import AWSGenerator
 from nise.generators.aws import DataTransferGenerator  # noqa: F401
 from nise.generators.aws import EBSGenerator  # noqa: F401
 from nise.generators.aws import EC2Generator  # noqa: F401
@@ -50,6 +60,7 @@ from nise.generators.aws import S3Generator  # noqa: F401
 from nise.generators.aws import VPCGenerator  # noqa: F401
 from nise.generators.azure import AZURE_COLUMNS
 from nise.generators.azure import AZURE_GENERATORS
+from nise.generators.azure import AzureGenerator
 from nise.generators.azure import BandwidthGenerator  # noqa: F401
 from nise.generators.azure import SQLGenerator  # noqa: F401
 from nise.generators.azure import StorageGenerator  # noqa: F401
@@ -60,42 +71,55 @@ from nise.generators.gcp import ComputeEngineGenerator  # noqa: F401
 from nise.generators.gcp import GCP_GENERATORS
 from nise.generators.gcp import GCP_REPORT_COLUMNS
 from nise.generators.gcp import ProjectGenerator
-from nise.generators.ocp import OCP_NODE_LABEL
-from nise.generators.ocp import OCP_POD_USAGE
+from nise.generators.generator import StaticConfig
 from nise.generators.ocp import OCP_REPORT_TYPE_TO_COLS
-from nise.generators.ocp import OCP_STORAGE_USAGE
 from nise.generators.ocp import OCPGenerator
+from nise.manifest import aws_assembly_path
 from nise.manifest import aws_generate_manifest
 from nise.manifest import ocp_generate_manifest
+from nise.upload import s3_transfer_config
 from nise.upload import upload_to_azure_container
 from nise.upload import upload_to_gcp_storage
 from nise.upload import upload_to_s3
+from nise.util import derive_seed
 from nise.util import load_yaml
 from nise.util import LOG
+from nise.util import random_streams
 
+GZIP_COMPRESSLEVEL = 9
+UPLOAD_WORKERS = 4
 
-def create_temporary_copy(path, temp_file_name, temp_dir_name="None"):
-    """Create temporary copy of a file."""
-    temp_dir = gettempdir()
-    if temp_dir_name:
-        new_dir = os.path.join(temp_dir, temp_dir_name)
-        if not os.path.exists(new_dir):
-            os.mkdir(new_dir)
-        temp_path = os.path.join(new_dir, temp_file_name)
-    else:
-        temp_path = os.path.join(temp_dir, temp_file_name)
-    shutil.copy2(path, temp_path)
-    return temp_path
 
+def _write_csv(output_file, data, header, gzip_file=None, compresslevel=None, append=False):
+    """Output csv file data.
+
+    Args:
+        output_file (String): path of the csv file, None to only write the compressed copy
+        data (List): rows as tuples in header order
+        header (List): column names
+        gzip_file (String): path of a gzip-compressed copy written in the same pass
+        compresslevel (Int): gzip compression level of the compressed copy
+        append (Boolean): add the rows to existing files without writing the header
 
-def _write_csv(output_file, data, header):
-    """Output csv file data."""
-    LOG.info(f"Writing to {output_file.split('/')[-1]}")
-    with open(output_file, "w") as file:
-        writer = csv.DictWriter(file, fieldnames=header)
-        writer.writeheader()
-        for row in data:
-            writer.writerow(row)
+    """
+    mode = "a" if append else "w"
+    with ExitStack() as stack:
+        writers = []
+        if output_file:
+            if not append:
+                LOG.info(f"Writing to {output_file.split('/')[-1]}")
+            writers.append(csv.writer(stack.enter_context(open(output_file, mode))))
+        if gzip_file:
+            if not append:
+                LOG.info(f"Writing to {gzip_file.split('/')[-1]}")
+            level = compresslevel or GZIP_COMPRESSLEVEL
+            # No timestamp in the gzip header, so the same rows always compress to the same bytes.
+            gzip_stream = gzip.GzipFile(gzip_file, f"{mode}b", compresslevel=level, mtime=0)
+            writers.append(csv.writer(stack.enter_context(TextIOWrapper(gzip_stream))))
+        for writer in writers:
+            if not append:
+                writer.writerow(header)
+            writer.writerows(data)
 
 
 def _remove_files(file_list):
@@ -108,9 +132,80 @@ def _remove_files(file_list):
             raise FileNotFoundError
 
 
-def _generate_azure_filename():
+def _derive_seed(options, *keys):
+    """Derive the seed of the random stream named by keys from --seed.
+
+    Returns:
+        (Int): the seed, None when --seed is not set
+
+    """
+    seed = options.get("seed")
+    if seed is None:
+        return None
+    return derive_seed(seed, *keys)
+
+
+def _month_key(month):
+    """Return the key naming the random streams of a month."""
+    return month.get("start").strftime("%Y-%m")
+
+
+def _generator_seed(options, provider, generator, month=None, instance=None):
+    """Return the seed of a generator of the run.
+
+    Each (provider, generator class, month, instance) gets its own seed, so a generator
+    produces the same data whichever process generates it and in whichever order.
+
+    Args:
+        options (Dict): options of the run
+        provider (String): provider of the report
+        generator (Class): the generator class
+        month (Dict): the month generated, None for a generator covering the whole run
+        instance (String): tells apart generators of the same class and month, such as clusters or projects
+    Returns:
+        (Int): the seed, None when --seed is not set
+
+    """
+    return _derive_seed(options, provider, generator.__name__, _month_key(month) if month else None, instance)
+
+
+def _report_random(options, *keys):
+    """Return the random stream of the values a report draws outside its generators.
+
+    Returns:
+        (random.Random): the stream named by keys, None when --seed is not set
+
+    """
+    seed = _derive_seed(options, *keys)
+    if seed is None:
+        return None
+    return random.Random(seed)
+
+
+def _report_uuid(rng=None):
+    """Return a random UUID, drawn from rng when the run is seeded."""
+    if rng is None:
+        return uuid4()
+    return UUID(int=rng.getrandbits(128), version=4)
+
+
+def _report_cache(options):
+    """Return the cache of the finished months of a seeded run.
+
+    Returns:
+        (ReportCache): the cache, None without --cache-dir and --seed or with --write-monthly
+
+    """
+    cache_dir = options.get("cache_dir")
+    if not cache_dir or options.get("seed") is None or options.get("write_monthly"):
+        return None
+    cache_size = options.get("cache_size")
+    return ReportCache(cache_dir, cache_size * 1024 * 1024 if cache_size else None)
+
+
+def _generate_azure_filename(rng=None):
     """Generate filename for azure report."""
-    output_file_name = "{}_{}".format("costreport", uuid4())
+    output_file_name = "{}_{}".format("costreport", _report_uuid(rng))
     local_path = "{}/{}.csv".format(os.getcwd(), output_file_name)
     output_file_name = output_file_name + ".csv"
     return (local_path, output_file_name)
@@ -122,33 +217,31 @@ def _generate_azure_date_range(month):
     return start.strftime("%Y%m%d") + "-" + end.strftime("%Y%m%d")
 
 
-def _gzip_report(report_path):
-    """Compress the report."""
-    t_file = NamedTemporaryFile(mode="wb", suffix=".csv.gz", delete=False)
-    with open(report_path, "rb") as f_in, gzip.open(t_file.name, "wb") as f_out:
-        f_out.write(f_in.read())
-    return t_file.name
-
-
-def _tar_gzip_report(temp_dir):
-    """Compress the report and manifest to tarfile."""
-    t_file = NamedTemporaryFile(mode="w", suffix=".tar.gz", delete=False)
+def _tar_gzip_payload(report_file, report_name, manifest_data):
+    """Stream a report file and its manifest into a gzip tarball.
 
-    with tarfile.open(t_file.name, "w:gz") as tar:
-        tar.add(temp_dir, arcname=os.path.sep)
+    The report is read straight from its source path and the manifest from memory,
+    so no staging copies are written.
 
-    return t_file.name
+    Args:
+        report_file (String): path of the report file
+        report_name (String): name of the report inside the tarball
+        manifest_data (String): contents of manifest.json
+    Returns:
+        (String): Path to the tarball
 
+    """
+    manifest = manifest_data.encode()
+    manifest_info = tarfile.TarInfo("manifest.json")
+    manifest_info.size = len(manifest)
+    manifest_info.mtime = os.path.getmtime(report_file)
 
-def _tar_gzip_report_files(file_list):
-    """Compress the file list to a tarfile."""
-    with TemporaryDirectory() as t_directory:
-        for report_file in file_list:
-            temp_path = os.path.join(t_directory, os.path.basename(report_file))
-            shutil.copy2(report_file, temp_path)
-        fname = _tar_gzip_report(t_directory)
+    with NamedTemporaryFile(suffix=".tar.gz", delete=False) as t_file:
+        with tarfile.open(fileobj=t_file, mode="w:gz") as tar:
+            tar.add(report_file, arcname=report_name)
+            tar.addfile(manifest_info, BytesIO(manifest))
 
-    return fname
+    return t_file.name
 
 
 def _write_manifest(data):
@@ -171,6 +264,16 @@ def today():
     return datetime.now().replace(microsecond=0, second=0, minute=0)
 
 
+def _load_static_config(options):
+    """Return the parsed static report file for the run, parsing it on first use."""
+    static_report_file = options.get("static_report_file")
+    if not static_report_file:
+        return None
+    if not options.get("static_config"):
+        options["static_config"] = StaticConfig(static_report_file, load_yaml(static_report_file))
+    return options.get("static_config")
+
+
 def load_static_report_data(options):
     """Load and set start and end dates if static file is provided."""
     if not options.get("static_report_file"):
@@ -181,7 +284,7 @@ def load_static_report_data(options):
     LOG.info("Loading static data...")
     start_dates = {}
     end_dates = {}
-    static_report_data = load_yaml(options.get("static_report_file"))
+    static_report_data = _load_static_config(options).data
     for generator_dict in static_report_data.get("generators"):
         for genname, attributes in generator_dict.items():
 
@@ -250,23 +353,40 @@ def calculate_end_date(start_date, end_date):
     return generated_end_date
 
 
-def aws_route_file(bucket_name, bucket_file_path, local_path):
+def aws_route_file(bucket_name, bucket_file_path, local_path, transfer_config=None):
     """Route file to either S3 bucket or local filesystem."""
     if os.path.isdir(bucket_name):
         copy_to_local_dir(bucket_name, local_path, bucket_file_path)
     else:
-        upload_to_s3(bucket_name, bucket_file_path, local_path)
+        upload_to_s3(bucket_name, bucket_file_path, local_path, transfer_config)
 
 
-def azure_route_file(storage_account_name, storage_file_name, local_path, storage_file_path=None):
+def azure_route_file(
+    storage_account_name, storage_file_name, local_path, storage_file_path=None, max_concurrency=None
+):
     """Route file to either storage account or local filesystem."""
     connect_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
     if storage_file_path and connect_str:
-        upload_to_azure_container(storage_file_name, local_path, storage_file_path)
+        upload_to_azure_container(storage_file_name, local_path, storage_file_path, max_concurrency)
     else:
         copy_to_local_dir(storage_account_name, local_path, storage_file_name)
 
 
+def _route_files(route_func, routes, upload_workers=None):
+    """Route several files concurrently through a bounded thread pool.
+
+    Args:
+        route_func (Function): route function of the provider
+        routes (List): argument tuples of each route_func call
+        upload_workers (Int): number of files routed at once
+
+    """
+    with ThreadPoolExecutor(max_workers=upload_workers or UPLOAD_WORKERS) as executor:
+        futures = [executor.submit(route_func, *route) for route in routes]
+        for future in futures:
+            future.result()
+
+
 def ocp_route_file(insights_upload, local_path):
     """Route file to either Upload Service or local filesystem."""
     if os.path.isdir(insights_upload):
@@ -281,6 +401,37 @@ def ocp_route_file(insights_upload, local_path):
         LOG.info(response.text)
 
 
+def _ocp_write_local_payload(base_path, cluster_id, report_datetime, report_names, manifest_data, move=False):
+    """Write an OCP payload straight into the local Insights directory layout.
+
+    Produces the same <base>/<cluster>/<YYYYMMDD-YYYYMMDD> tree that extracting an
+    uploaded payload does, without building and unpacking a tarball.
+
+    Args:
+        base_path (String): local Insights upload directory
+        cluster_id (String): OCP cluster id
+        report_datetime (DateTime): date of the report month
+        report_names (Dict): payload report names mapped to the generated report files
+        manifest_data (String): contents of manifest.json
+        move (Boolean): move the generated report files instead of copying them
+
+    """
+    usage_month = month_date_range(report_datetime)
+    destination_dir = os.path.join(base_path, cluster_id, usage_month)
+    os.makedirs(destination_dir, exist_ok=True)
+
+    with open(os.path.join(destination_dir, "manifest.json"), "w") as manifest_file:
+        manifest_file.write(manifest_data)
+    for report_name, report_file in report_names.items():
+        destination_path = os.path.join(destination_dir, report_name)
+        if move:
+            shutil.move(report_file, destination_path)
+        else:
+            shutil.copyfile(report_file, destination_path)
+
+    LOG.info(f"Successfully wrote OCP payload for {cluster_id}/{usage_month}")
+
+
 def gcp_route_file(bucket_name, bucket_file_path, local_path):
     """Route file to either GCP bucket or local filesystem."""
     if os.path.isdir(bucket_name):
@@ -356,13 +507,45 @@ def _create_month_list(start_date, end_date, days_per_month):
     return months
 
 
-def _aws_finalize_report(data):
+def _month_workers(options, months):
+    """Return the number of months to generate concurrently."""
+    return min(options.get("month_workers") or 1, len(months))
+
+
+def _run_months(month_func, options, months, *args):
+    """Run month_func for each month, generating several months concurrently if --month-workers is set."""
+    _run_month_tasks(month_func, [(options, month) for month in months], _month_workers(options, months), *args)
+
+
+def _run_month_tasks(month_func, tasks, month_workers, *args):
+    """Run month_func for each (options, month) task, running month_workers tasks concurrently.
+
+    Months are independent windows that write to month-named files, so they can be
+    generated in any order. Generator-level workers are disabled inside month workers
+    to avoid nesting process pools.
+    """
+    if month_workers <= 1:
+        for options, month in tasks:
+            month_func(options, month, *args)
+        return
+
+    workers = max(options.get("workers") or 1 for options, _ in tasks)
+    if workers > 1:
+        LOG.warning(f"Ignoring --workers {workers}: each of the {month_workers} month workers runs in one process.")
+    LOG.info(f"Producing {len(tasks)} months with {month_workers} workers.")
+    with ProcessPoolExecutor(max_workers=month_workers) as executor:
+        futures = [executor.submit(month_func, dict(options, workers=1), month, *args) for options, month in tasks]
+        for future in futures:
+            future.result()
+
+
+def _aws_finalize_report(data, columns, rng=None):
     """Populate invoice id for data."""
-    data = copy.deepcopy(data)
-    invoice_id = "".join([random.choice(string.digits) for _ in range(9)])
-    for row in data:
-        row["bill/InvoiceId"] = invoice_id
-    return data
+    rng = rng or random
+    invoice_id = "".join([rng.choice(string.digits) for _ in range(9)])
+    idx = columns.index("bill/InvoiceId")
+    after = idx + 1
+    return [row[:idx] + (invoice_id,) + row[after:] for row in data]
 
 
 def _create_generator_dates_from_yaml(attributes, month):
@@ -401,148 +584,349 @@ def _create_generator_dates_from_yaml(attributes, month):
     return gen_start_date, gen_end_date
 
 
-def write_aws_file(file_number, aws_report_name, month_name, year, data, aws_finalize_report, headers):
-    """Write AWS data to a file."""
-    headers = sorted(list(headers))
+def write_aws_file(
+    file_number,
+    aws_report_name,
+    month_name,
+    year,
+    data,
+    aws_finalize_report,
+    headers,
+    gzip_dir=None,
+    write_csv=True,
+    compresslevel=None,
+    rng=None,
+):
+    """Write AWS data to a file.
+
+    Rows are tuples in the order of headers, see AWSGenerator.column_order().
+    When gzip_dir is given the rows are also compressed into <gzip_dir>/<file name>.csv.gz
+    as they are written. The returned csv path names the file even when write_csv is False.
+    The invoice ids of finalized reports are drawn from rng when the run is seeded.
+    """
     if file_number != 0:
         file_name = "{}-{}-{}-{}".format(month_name, year, aws_report_name, str(file_number))
     else:
         file_name = f"{month_name}-{year}-{aws_report_name}"
 
     if aws_finalize_report and aws_finalize_report == "overwrite":
-        data = _aws_finalize_report(data)
+        data = _aws_finalize_report(data, headers, rng)
     elif aws_finalize_report and aws_finalize_report == "copy":
         # Currently only a local option as this does not simulate
-        finalized_data = _aws_finalize_report(data)
+        finalized_data = _aws_finalize_report(data, headers, rng)
         file_name_finalized = f"{file_name}-finalized"
         full_file_name = "{}/{}.csv".format(os.getcwd(), file_name_finalized)
         _write_csv(full_file_name, finalized_data, headers)
 
     full_file_name = "{}/{}.csv".format(os.getcwd(), file_name)
-    _write_csv(full_file_name, data, headers)
+    gzip_file = os.path.join(gzip_dir, f"{file_name}.csv.gz") if gzip_dir else None
+    _write_csv(full_file_name if write_csv else None, data, headers, gzip_file, compresslevel)
 
     return full_file_name
 
 
-def aws_create_report(options):  # noqa: C901
-    """Create a cost usage report file."""
-    data = []
-    if not (options.get("start_date") and options.get("end_date")):
-        options = load_static_report_data(options)
-    start_date = options.get("start_date")
-    end_date = options.get("end_date")
+def _create_aws_generator(generator, options, month):
+    """Create an AWS generator for the month, or None if its usage falls outside the month."""
+    gen_start_date = options.get("gen_starts", {}).get(generator.__name__, month.get("start"))
+    gen_end_date = options.get("gen_ends", {}).get(generator.__name__, month.get("end"))
+    # Skip if generator usage is outside of current month
+    if gen_end_date < month.get("start"):
+        return None
+    if gen_start_date > month.get("end"):
+        return None
 
-    aws_finalize_report = options.get("aws_finalize_report")
+    gen_start_date, gen_end_date = _create_generator_dates_from_yaml(options, month)
+
+    return generator(
+        gen_start_date,
+        gen_end_date,
+        user_config=_load_static_config(options),
+        num_instances=options.get("aws_num_instances"),
+        seed=_generator_seed(options, "aws", generator, month),
+    )
+
+
+def _aws_write_shard(gen, columns, shard_path):
+    """Write the rows of one AWS generator to a csv shard without a header.
+
+    Runs in a worker process when --workers is greater than one. The generator comes
+    from the parent process, which created every generator of the month, so the rows
+    hold the tag columns of the whole month.
+
+    Returns:
+        (String): path of the shard
+
+    """
+    AWSGenerator.set_columns(columns)
+    with open(shard_path, "w", newline="") as shard_file:
+        csv.writer(shard_file).writerows(gen.generate_rows(columns))
+    LOG.info(f"Done with {type(gen).__name__}.")
+    return shard_path
 
-    months = _create_month_list(start_date, end_date, options.get("days_per_month"))
 
+def _read_aws_shard(future):
+    """Yield the rows of the shard of a _aws_write_shard() future once it is written."""
+    with open(future.result(), newline="") as shard_file:
+        for row in csv.reader(shard_file):
+            yield tuple(row)
+
+
+def _aws_route_report(options, reports, manifests):
+    """Route the report files of a month, then the manifests that reference them.
+
+    Args:
+        options (Dict): options of the run
+        reports (List): (bucket path, local path) pairs of the report files
+        manifests (List): (bucket path, local path) pairs of the manifests
+
+    """
+    aws_bucket_name = options.get("aws_bucket_name")
+    upload_workers = options.get("upload_workers")
+    transfer_config = None
+    if not os.path.isdir(aws_bucket_name):
+        transfer_config = s3_transfer_config(
+            options.get("aws_multipart_chunksize"), options.get("aws_max_concurrency")
+        )
+    for files in (reports, manifests):
+        routes = [(aws_bucket_name, bucket_path, local_path, transfer_config) for bucket_path, local_path in files]
+        _route_files(aws_route_file, routes, upload_workers)
+
+
+def _aws_create_month(options, month):  # noqa: C901
+    """Create the cost usage report files for a single month."""
+    aws_finalize_report = options.get("aws_finalize_report")
     aws_bucket_name = options.get("aws_bucket_name")
     aws_report_name = options.get("aws_report_name")
+    aws_gzip_level = options.get("aws_gzip_level")
     write_monthly = options.get("write_monthly", False)
+    workers = options.get("workers") or 1
     payer_account = None
-    for month in months:
-        data = []
-        file_number = 0
-        monthly_files = []
-        num_gens = len(AWS_GENERATORS)
-        ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
-        LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
-        for count, generator in enumerate(AWS_GENERATORS):
-            gen_start_date = options.get("gen_starts", {}).get(generator.__name__, month.get("start"))
-            gen_end_date = options.get("gen_ends", {}).get(generator.__name__, month.get("end"))
-            # Skip if generator usage is outside of current month
-            if gen_end_date < month.get("start"):
-                continue
-            if gen_start_date > month.get("end"):
-                continue
 
-            gen_start_date, gen_end_date = _create_generator_dates_from_yaml(options, month)
+    data = []
+    file_number = 0
+    monthly_files = []
+    gen_start_date, gen_end_date = _create_generator_dates_from_yaml(options, month)
+
+    cache = _report_cache(options) if aws_bucket_name else None
+    if cache:
+        key = cache_key(options, "aws", month)
+        with cache.get(key) as cached:
+            if cached:
+                _aws_route_report(options, cached["reports"], cached["manifests"])
+                return
+
+    rng = _report_random(options, "aws", "report", _month_key(month))
+    AWSGenerator.init_template_kwargs(accounts=options.get("aws_accounts"))
+    # The month's columns hold the tags of its own generators only.
+    AWSGenerator.reset_tag_columns()
+
+    # Reports for a bucket are compressed while they are written: straight into the
+    # assembly directory of a local bucket, or into a staging directory for S3.
+    gzip_dir = None
+    if aws_bucket_name:
+        manifest_values = dict(
+            options, start_date=gen_start_date, end_date=gen_end_date, assembly_id=_report_uuid(rng)
+        )
+        if rng:
+            manifest_values["report_id"] = format(rng.getrandbits(256), "064x")
+        s3_cur_path = aws_assembly_path(manifest_values, manifest_values["assembly_id"])
+        if os.path.isdir(aws_bucket_name):
+            gzip_dir = f"{aws_bucket_name}/{s3_cur_path}"
+            os.makedirs(gzip_dir, exist_ok=True)
+        else:
+            gzip_dir = mkdtemp()
+    write_csv = write_monthly or not gzip_dir
+
+    gens = []
+    for generator in AWS_GENERATORS:
+        gen = _create_aws_generator(generator, options, month)
+        if gen:
+            gens.append(gen)
+
+    num_gens = len(gens)
+    ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
+    expected_rows = sum(gen.expected_row_count for gen in gens)
+    LOG.info(f"Producing {expected_rows} rows from {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
+    # Tag columns are registered at generator init, so the order is fixed from here on.
+    columns = AWSGenerator.column_order()
+    with ExitStack() as stack:
+        if workers > 1:
+            # Workers write the rows of each generator to a shard, which are merged here in
+            # generator order into the same files a serial run writes.
+            LOG.info(f"Running the generators with {workers} workers.")
+            shard_dir = stack.enter_context(TemporaryDirectory())
+            executor = stack.enter_context(ProcessPoolExecutor(max_workers=workers))
+            shard_paths = [os.path.join(shard_dir, f"{count}.csv") for count in range(num_gens)]
+            gen_rows = [
+                _read_aws_shard(executor.submit(_aws_write_shard, gen, columns, shard_path))
+                for gen, shard_path in zip(gens, shard_paths)
+            ]
+        else:
+            gen_rows = [gen.generate_rows(columns) for gen in gens]
 
-            gen = generator(gen_start_date, gen_end_date, user_config=options.get("static_report_file"))
+        for count, (gen, rows) in enumerate(zip(gens, gen_rows)):
             payer_account = gen.config[0].get("accounts", {}).get("payer")
-            for _ in range(gen.num_instances):
-                for hour in gen.generate_data():
-                    data += [hour]
-                    if len(data) == options.get("row_limit"):
-                        file_number += 1
-                        month_output_file = write_aws_file(
-                            file_number,
-                            aws_report_name,
-                            month.get("name"),
-                            gen_start_date.year,
-                            data,
-                            aws_finalize_report,
-                            gen.AWS_COLUMNS,
-                        )
-                        monthly_files.append(month_output_file)
-                        data.clear()
+            for hour in rows:
+                data += [hour]
+                if len(data) == options.get("row_limit"):
+                    file_number += 1
+                    month_output_file = write_aws_file(
+                        file_number,
+                        aws_report_name,
+                        month.get("name"),
+                        gen_start_date.year,
+                        data,
+                        aws_finalize_report,
+                        columns,
+                        gzip_dir,
+                        write_csv,
+                        aws_gzip_level,
+                        rng,
+                    )
+                    monthly_files.append(month_output_file)
+                    data.clear()
 
             if count % ten_percent == 0:
                 LOG.info(f"Done with {count} of {num_gens} generators.")
 
-        if file_number != 0:
-            file_number += 1
-
-        month_output_file = write_aws_file(
-            file_number,
-            aws_report_name,
-            month.get("name"),
-            gen_start_date.year,
-            data,
-            aws_finalize_report,
-            gen.AWS_COLUMNS,
-        )
-        monthly_files.append(month_output_file)
-
-        if aws_bucket_name:
-            manifest_values = {"account": payer_account}
-            manifest_values.update(options)
-            manifest_values["start_date"] = gen_start_date
-            manifest_values["end_date"] = gen_end_date
-            manifest_values["file_names"] = monthly_files
-            s3_cur_path, manifest_data = aws_generate_manifest(manifest_values)
-            s3_month_path = os.path.dirname(s3_cur_path)
-            s3_month_manifest_path = s3_month_path + "/" + aws_report_name + "-Manifest.json"
-            s3_assembly_manifest_path = s3_cur_path + "/" + aws_report_name + "-Manifest.json"
-
-            temp_manifest = _write_manifest(manifest_data)
-            aws_route_file(aws_bucket_name, s3_month_manifest_path, temp_manifest)
-            aws_route_file(aws_bucket_name, s3_assembly_manifest_path, temp_manifest)
-
-            for monthly_file in monthly_files:
-                temp_cur_zip = _gzip_report(monthly_file)
-                destination_file = "{}/{}.gz".format(s3_cur_path, os.path.basename(monthly_file))
-                aws_route_file(aws_bucket_name, destination_file, temp_cur_zip)
-                os.remove(temp_cur_zip)
-            os.remove(temp_manifest)
-        if not write_monthly:
-            _remove_files(monthly_files)
+    if file_number != 0:
+        file_number += 1
+
+    month_output_file = write_aws_file(
+        file_number,
+        aws_report_name,
+        month.get("name"),
+        gen_start_date.year,
+        data,
+        aws_finalize_report,
+        columns,
+        gzip_dir,
+        write_csv,
+        aws_gzip_level,
+        rng,
+    )
+    monthly_files.append(month_output_file)
+
+    if aws_bucket_name:
+        manifest_values["account"] = payer_account
+        manifest_values["file_names"] = monthly_files
+        s3_cur_path, manifest_data = aws_generate_manifest(manifest_values)
+        s3_month_path = os.path.dirname(s3_cur_path)
+        s3_month_manifest_path = s3_month_path + "/" + aws_report_name + "-Manifest.json"
+        s3_assembly_manifest_path = s3_cur_path + "/" + aws_report_name + "-Manifest.json"
+
+        temp_manifest = _write_manifest(manifest_data)
+        reports = [
+            (
+                "{}/{}.gz".format(s3_cur_path, os.path.basename(monthly_file)),
+                os.path.join(gzip_dir, "{}.gz".format(os.path.basename(monthly_file))),
+            )
+            for monthly_file in monthly_files
+        ]
+        manifests = [(s3_month_manifest_path, temp_manifest), (s3_assembly_manifest_path, temp_manifest)]
+        if cache:
+            cache.put(key, {"reports": reports, "manifests": manifests})
+
+        if os.path.isdir(aws_bucket_name):
+            # The reports were compressed straight into the bucket.
+            _aws_route_report(options, [], manifests)
+        else:
+            _aws_route_report(options, reports, manifests)
+            _remove_files([temp_cur_zip for _, temp_cur_zip in reports])
+            os.rmdir(gzip_dir)
+        os.remove(temp_manifest)
+    if write_csv and not write_monthly:
+        _remove_files(monthly_files)
 
 
-def azure_create_report(options):  # noqa: C901
+def aws_create_report(options):
     """Create a cost usage report file."""
-    data = []
     if not (options.get("start_date") and options.get("end_date")):
         options = load_static_report_data(options)
     start_date = options.get("start_date")
     end_date = options.get("end_date")
 
     months = _create_month_list(start_date, end_date, options.get("days_per_month"))
+    _load_static_config(options)
+    # Worker processes get the accounts of the run through the options.
+    options["aws_accounts"] = AWSGenerator.init_template_kwargs(_derive_seed(options, "aws", "accounts"))
+    _run_months(_aws_create_month, options, months)
+
 
-    meter_cache = {}
-    # The options params are not going to change so we don't
-    # have to keep resetting the var inside of the for loop
+def write_azure_file(data, rng=None):
+    """Write Azure data to a new report file.
+
+    Args:
+        data (List): rows as tuples in AZURE_COLUMNS order
+        rng (random.Random): source of the file name of a seeded run
+    Returns:
+        (String): path of the local report file
+
+    """
+    local_path, _ = _generate_azure_filename(rng)
+    _write_csv(local_path, data, AZURE_COLUMNS)
+    return local_path
+
+
+def _azure_route_report(options, month, local_path):
+    """Route an Azure report file to the container of the month."""
     azure_container_name = options.get("azure_container_name")
-    storage_account_name = options.get("azure_account_name")
     azure_prefix_name = options.get("azure_prefix_name")
     azure_report_name = options.get("azure_report_name")
+
+    output_file_name = os.path.basename(local_path)
+    date_range = _generate_azure_date_range(month)
+
+    if azure_container_name:
+        file_path = ""
+        if azure_prefix_name:
+            file_path += azure_prefix_name + "/"
+        file_path += azure_report_name + "/"
+        file_path += date_range + "/"
+        file_path += output_file_name
+
+        # azure blob upload
+        storage_account_name = options.get("azure_account_name", None)
+        if storage_account_name:
+            azure_route_file(
+                storage_account_name,
+                azure_container_name,
+                local_path,
+                file_path,
+                options.get("azure_max_concurrency"),
+            )
+        # local dir upload
+        else:
+            azure_route_file(azure_container_name, file_path, local_path)
+
+
+def _azure_create_month(options, month, meter_cache):
+    """Create the cost usage report files for a single month.
+
+    Rows are streamed from the generators into files of at most --file-row-limit rows.
+    Each file is routed to the container by a pool of upload threads while the
+    following files are generated.
+    """
     write_monthly = options.get("write_monthly", False)
-    for month in months:
-        data = []
-        monthly_files = []
-        num_gens = len(AZURE_GENERATORS)
-        ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
-        LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
+
+    cache = _report_cache(options) if options.get("azure_container_name") else None
+    if cache:
+        key = cache_key(options, "azure", month)
+        with cache.get(key) as cached:
+            if cached:
+                routes = [(options, month, local_path) for _, local_path in cached["reports"]]
+                _route_files(_azure_route_report, routes, options.get("upload_workers"))
+                return
+
+    data = []
+    monthly_files = []
+    uploads = []
+    rng = _report_random(options, "azure", "report", _month_key(month))
+    AzureGenerator.init_template_kwargs(accounts=options.get("azure_accounts"))
+    num_gens = len(AZURE_GENERATORS)
+    ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
+    LOG.info(f"Producing data for {num_gens} generators for {month.get('start').strftime('%Y-%m')}.")
+    with ThreadPoolExecutor(max_workers=options.get("upload_workers") or UPLOAD_WORKERS) as executor:
         for count, generator in enumerate(AZURE_GENERATORS):
             gen_start_date = options.get("gen_starts", {}).get(generator.__name__, month.get("start"))
             gen_end_date = options.get("gen_ends", {}).get(generator.__name__, month.get("end"))
@@ -554,36 +938,57 @@ def azure_create_report(options):  # noqa: C901
 
             gen_start_date, gen_end_date = _create_generator_dates_from_yaml(options, month)
 
-            gen = generator(gen_start_date, gen_end_date, meter_cache, user_config=options.get("static_report_file"))
-            data += gen.generate_data()
-            meter_cache = gen.get_meter_cache()
+            gen = generator(
+                gen_start_date,
+                gen_end_date,
+                meter_cache,
+                user_config=_load_static_config(options),
+                seed=_generator_seed(options, "azure", generator, month),
+                meter_seed=_derive_seed(options, "azure", "meters"),
+            )
+            for row in gen.generate_rows(AZURE_COLUMNS):
+                data.append(row)
+                if len(data) == options.get("row_limit"):
+                    monthly_files.append(write_azure_file(data, rng))
+                    uploads.append(executor.submit(_azure_route_report, options, month, monthly_files[-1]))
+                    data.clear()
 
             if count % ten_percent == 0:
                 LOG.info(f"Done with {count} of {num_gens} generators.")
 
-        local_path, output_file_name = _generate_azure_filename()
-        date_range = _generate_azure_date_range(month)
-
-        _write_csv(local_path, data, AZURE_COLUMNS)
-        monthly_files.append(local_path)
-
-        if azure_container_name:
-            file_path = ""
-            if azure_prefix_name:
-                file_path += azure_prefix_name + "/"
-            file_path += azure_report_name + "/"
-            file_path += date_range + "/"
-            file_path += output_file_name
-
-            # azure blob upload
-            storage_account_name = options.get("azure_account_name", None)
-            if storage_account_name:
-                azure_route_file(storage_account_name, azure_container_name, local_path, file_path)
-            # local dir upload
-            else:
-                azure_route_file(azure_container_name, file_path, local_path)
-        if not write_monthly:
-            _remove_files(monthly_files)
+        if data or not monthly_files:
+            monthly_files.append(write_azure_file(data, rng))
+            uploads.append(executor.submit(_azure_route_report, options, month, monthly_files[-1]))
+
+        for upload in uploads:
+            upload.result()
+
+    if cache:
+        cache.put(key, {"reports": [(os.path.basename(local_path), local_path) for local_path in monthly_files]})
+    if not write_monthly:
+        _remove_files(monthly_files)
+
+
+def azure_create_report(options):
+    """Create a cost usage report file."""
+    if not (options.get("start_date") and options.get("end_date")):
+        options = load_static_report_data(options)
+    start_date = options.get("start_date")
+    end_date = options.get("end_date")
+
+    months = _create_month_list(start_date, end_date, options.get("days_per_month"))
+    _load_static_config(options)
+    # Worker processes get the accounts of the run through the options.
+    options["azure_accounts"] = AzureGenerator.init_template_kwargs(_derive_seed(options, "azure", "accounts"))
+
+    # The meter cache keeps meter values consistent across months. Concurrent months of
+    # an unseeded run share it through a manager process; seeded runs derive the values
+    # of each meter from the run seed, so every month worker keeps its own cache.
+    if _month_workers(options, months) > 1 and _derive_seed(options, "azure", "meters") is None:
+        with Manager() as manager:
+            _run_months(_azure_create_month, options, months, manager.dict())
+    else:
+        _run_months(_azure_create_month, options, months, {})
 
 
 def write_ocp_file(file_number, cluster_id, month_name, year, report_type, data):
@@ -599,95 +1004,188 @@ def write_ocp_file(file_number, cluster_id, month_name, year, report_type, data)
     return full_file_name
 
 
-def ocp_create_report(options):  # noqa: C901
-    """Create a usage report file."""
-    cluster_id = options.get("ocp_cluster_id")
-    if not (options.get("start_date") and options.get("end_date")):
-        options = load_static_report_data(options)
-    start_date = options.get("start_date")
-    end_date = options.get("end_date")
-    months = _create_month_list(start_date, end_date, options.get("days_per_month"))
+def _ocp_generate_report_type(gen, options, month, report_type):
+    """Generate and write the month's files of one OCP report type.
 
-    write_monthly = options.get("write_monthly", False)
-    for month in months:
-        data = {OCP_POD_USAGE: [], OCP_STORAGE_USAGE: [], OCP_NODE_LABEL: []}
-        file_numbers = {OCP_POD_USAGE: 0, OCP_STORAGE_USAGE: 0, OCP_NODE_LABEL: 0}
-        monthly_files = []
-
-        gen_start_date, gen_end_date = _create_generator_dates_from_yaml(options, month)
-        gen = OCPGenerator(gen_start_date, gen_end_date, user_config=options.get("static_report_file"))
-        for report_type in gen.ocp_report_generation.keys():
-            LOG.info(f"Generating data for {report_type} for {month.get('name')}")
-            for hour in gen.generate_data(report_type):
-                data[report_type] += [hour]
-
-                if len(data[report_type]) == options.get("row_limit"):
-                    file_numbers[report_type] += 1
-                    month_output_file = write_ocp_file(
-                        file_numbers[report_type],
-                        cluster_id,
-                        month.get("name"),
-                        gen_start_date.year,
-                        report_type,
-                        data[report_type],
-                    )
-                    monthly_files.append(month_output_file)
-                    data[report_type].clear()
+    Runs in a worker process when --workers is greater than one; the generator is
+    pickled to the worker, so every report type shares the same rendered cluster.
+
+    Returns:
+        (List): paths of the written report files
 
-        for report_type in gen.ocp_report_generation.keys():
-            if file_numbers[report_type] != 0:
-                file_numbers[report_type] += 1
+    """
+    cluster_id = options.get("ocp_cluster_id")
+    data = []
+    file_number = 0
+    report_files = []
+
+    LOG.info(f"Generating data for {report_type} for {month.get('name')}")
+    for hour in gen.generate_rows(OCP_REPORT_TYPE_TO_COLS[report_type], report_type):
+        data += [hour]
 
+        if len(data) == options.get("row_limit"):
+            file_number += 1
             month_output_file = write_ocp_file(
-                file_numbers[report_type],
-                cluster_id,
-                month.get("name"),
-                gen_start_date.year,
-                report_type,
-                data[report_type],
+                file_number, cluster_id, month.get("name"), gen.start_date.year, report_type, data
             )
-            monthly_files.append(month_output_file)
-
-        insights_upload = options.get("insights_upload")
-        if insights_upload:
-            # Generate manifest for all files
-            ocp_assembly_id = uuid4()
-            report_datetime = gen_start_date
-            temp_files = {}
-            for num_file in range(len(monthly_files)):
-                temp_filename = f"{ocp_assembly_id}_openshift_report.{num_file}.csv"
-                temp_usage_file = create_temporary_copy(monthly_files[num_file], temp_filename, "payload")
-                temp_files[temp_filename] = temp_usage_file
-
-            manifest_file_names = ", ".join(f'"{w}"' for w in temp_files)
-            manifest_values = {
-                "ocp_cluster_id": cluster_id,
-                "ocp_assembly_id": ocp_assembly_id,
-                "report_datetime": report_datetime,
-                "files": manifest_file_names[1:-1],
-            }
-            manifest_data = ocp_generate_manifest(manifest_values)
-            temp_manifest = _write_manifest(manifest_data)
-            temp_manifest_name = create_temporary_copy(temp_manifest, "manifest.json", "payload")
+            report_files.append(month_output_file)
+            data.clear()
+
+    if file_number != 0:
+        file_number += 1
+    month_output_file = write_ocp_file(
+        file_number, cluster_id, month.get("name"), gen.start_date.year, report_type, data
+    )
+    report_files.append(month_output_file)
+    return report_files
+
+
+def _ocp_route_report(insights_upload, cluster_id, report_datetime, report_names, manifest_data, move=False):
+    """Route the report files of a month to the Insights upload directory or service.
+
+    Args:
+        insights_upload (String): local Insights upload directory or upload service URL
+        cluster_id (String): OCP cluster id
+        report_datetime (DateTime): date of the report month
+        report_names (Dict): payload report names mapped to the generated report files
+        manifest_data (String): contents of manifest.json
+        move (Boolean): move the report files into a local upload directory instead of copying them
+
+    """
+    if os.path.isdir(insights_upload):
+        _ocp_write_local_payload(insights_upload, cluster_id, report_datetime, report_names, manifest_data, move=move)
+        return
+
+    # Tarball and upload files individually
+    for report_name, monthly_file in report_names.items():
+        temp_usage_zip = _tar_gzip_payload(monthly_file, report_name, manifest_data)
+        ocp_route_file(insights_upload, temp_usage_zip)
+        os.remove(temp_usage_zip)
+
+
+def _ocp_create_month(options, month):  # noqa: C901
+    """Create the usage report files for a single month."""
+    cluster_id = options.get("ocp_cluster_id")
+    write_monthly = options.get("write_monthly", False)
+    insights_upload = options.get("insights_upload")
+    workers = options.get("workers") or 1
+    monthly_files = []
 
-            # Tarball and upload files individually
-            for temp_usage_file in temp_files.values():
-                report_files = [temp_usage_file, temp_manifest_name]
-                temp_usage_zip = _tar_gzip_report_files(report_files)
-                ocp_route_file(insights_upload, temp_usage_zip)
-                os.remove(temp_usage_file)
-                os.remove(temp_usage_zip)
+    gen_start_date, gen_end_date = _create_generator_dates_from_yaml(options, month)
+
+    cache = _report_cache(options) if insights_upload else None
+    if cache:
+        key = cache_key(options, "ocp", month)
+        with cache.get(key) as cached:
+            if cached:
+                [(_, manifest_file)] = cached["manifest"]
+                with open(manifest_file) as cached_manifest:
+                    manifest_data = cached_manifest.read()
+                _ocp_route_report(insights_upload, cluster_id, gen_start_date, dict(cached["reports"]), manifest_data)
+                return
+
+    gen = OCPGenerator(
+        gen_start_date,
+        gen_end_date,
+        user_config=_load_static_config(options),
+        vectorized=options.get("ocp_vectorized", False),
+        seed=_generator_seed(options, "ocp", OCPGenerator, month, cluster_id),
+    )
+    report_types = list(gen.ocp_report_generation.keys())
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=min(workers, len(report_types))) as executor:
+            futures = [
+                executor.submit(_ocp_generate_report_type, gen, options, month, report_type)
+                for report_type in report_types
+            ]
+            for future in futures:
+                monthly_files += future.result()
+    else:
+        for report_type in report_types:
+            monthly_files += _ocp_generate_report_type(gen, options, month, report_type)
+
+    if insights_upload:
+        # Generate manifest for all files
+        ocp_assembly_id = _report_uuid(_report_random(options, "ocp", "report", _month_key(month), cluster_id))
+        report_datetime = gen_start_date
+        report_names = {
+            f"{ocp_assembly_id}_openshift_report.{num_file}.csv": monthly_file
+            for num_file, monthly_file in enumerate(monthly_files)
+        }
 
+        manifest_file_names = ", ".join(f'"{w}"' for w in report_names)
+        manifest_values = {
+            "ocp_cluster_id": cluster_id,
+            "ocp_assembly_id": ocp_assembly_id,
+            "report_datetime": report_datetime,
+            "files": manifest_file_names[1:-1],
+        }
+        manifest_data = ocp_generate_manifest(manifest_values)
+        if cache:
+            temp_manifest = _write_manifest(manifest_data)
+            cache.put(key, {"reports": list(report_names.items()), "manifest": [("manifest.json", temp_manifest)]})
             os.remove(temp_manifest)
-            os.remove(temp_manifest_name)
-        if not write_monthly:
-            LOG.info("Cleaning up local directory")
-            _remove_files(monthly_files)
+
+        _ocp_route_report(
+            insights_upload, cluster_id, report_datetime, report_names, manifest_data, move=not write_monthly
+        )
+        if os.path.isdir(insights_upload):
+            # The report files were moved into the upload directory.
+            return
+    if not write_monthly:
+        LOG.info("Cleaning up local directory")
+        _remove_files(monthly_files)
+
+
+def _ocp_cluster_options(options):
+    """Split the options of a run into the options of each cluster.
+
+    ocp_cluster_id may be a single cluster id or a list of them. With a list,
+    static_report_file may be one file shared by every cluster or a list holding
+    one file per cluster.
+
+    Returns:
+        (List): options of each cluster
+
+    """
+    cluster_ids = options.get("ocp_cluster_id")
+    if not isinstance(cluster_ids, (list, tuple)):
+        return [options]
+
+    static_report_files = options.get("static_report_file")
+    if isinstance(static_report_files, (list, tuple)):
+        if len(static_report_files) != len(cluster_ids):
+            raise ValueError("A static report file must be supplied for each OCP cluster id.")
+        return [
+            dict(options, ocp_cluster_id=cluster_id, static_report_file=static_report_file, static_config=None)
+            for cluster_id, static_report_file in zip(cluster_ids, static_report_files)
+        ]
+
+    # A shared static file is parsed once for all clusters.
+    _load_static_config(options)
+    return [dict(options, ocp_cluster_id=cluster_id) for cluster_id in cluster_ids]
+
+
+def ocp_create_report(options):
+    """Create the usage report files of one or more clusters.
+
+    The months of every cluster are generated through one pool of --month-workers processes.
+    """
+    tasks = []
+    for cluster_options in _ocp_cluster_options(options):
+        if not (cluster_options.get("start_date") and cluster_options.get("end_date")):
+            cluster_options = load_static_report_data(cluster_options)
+        start_date = cluster_options.get("start_date")
+        end_date = cluster_options.get("end_date")
+        months = _create_month_list(start_date, end_date, cluster_options.get("days_per_month"))
+        _load_static_config(cluster_options)
+        tasks += [(cluster_options, month) for month in months]
+    _run_month_tasks(_ocp_create_month, tasks, min(options.get("month_workers") or 1, len(tasks)))
 
 
 def gcp_create_report(options):  # noqa: C901
     """Create a GCP cost usage report file."""
-    fake = Faker()
+    _, fake, _ = random_streams(_derive_seed(options, "gcp", "report"))
     report_prefix = options.get("gcp_report_prefix") or fake.word()
     gcp_bucket_name = options.get("gcp_bucket_name")
 
@@ -696,45 +1194,52 @@ def gcp_create_report(options):  # noqa: C901
 
     projects = []
     if options.get("static_report_file"):
-        config = load_yaml(options.get("static_report_file"))
+        config = _load_static_config(options).data
         project_gens = list(filter(lambda x: "ProjectGenerator" in x, config.get("generators")))
         projects = []
-        for gen in project_gens:
-            project_generator = ProjectGenerator(gen.get("ProjectGenerator", {}).get("Account ID"))
+        for index, gen in enumerate(project_gens):
+            project_generator = ProjectGenerator(
+                gen.get("ProjectGenerator", {}).get("Account ID"),
+                seed=_generator_seed(options, "gcp", ProjectGenerator, instance=index),
+            )
             projects = projects + [prj for prj in project_generator.generate_projects()]
     else:
         account = "{}-{}".format(fake.word(), fake.word())
-        project_generator = ProjectGenerator(account)
+        project_generator = ProjectGenerator(account, seed=_generator_seed(options, "gcp", ProjectGenerator))
         projects = projects + [prj for prj in project_generator.generate_projects()]
 
-    data = {}
-    for project in projects:
+    # Rows are appended to the daily files as each generator yields its days.
+    daily_files = {}
+    getter = itemgetter(*GCP_REPORT_COLUMNS)
+    for project_index, project in enumerate(projects):
         num_gens = len(GCP_GENERATORS)
         ten_percent = int(num_gens * 0.1) if num_gens > 50 else 5
         LOG.info(f"Producing data for {num_gens} generators for GCP Project '{project}'.")
         for count, generator in enumerate(GCP_GENERATORS):
-            gen = generator(start_date, end_date, project, user_config=options.get("static_report_file"))
-            generated_data = gen.generate_data()
-            for key, item in generated_data.items():
-                if key in data:
-                    data[key] += item
-                else:
-                    data[key] = item
+            gen = generator(
+                start_date,
+                end_date,
+                project,
+                user_config=_load_static_config(options),
+                seed=_generator_seed(options, "gcp", generator, instance=project_index),
+            )
+            for day, rows in gen.generate_data():
+                output_file_path = daily_files.get(day)
+                append = output_file_path is not None
+                if not append:
+                    output_file_name = "{}-{}.csv".format(report_prefix, day.strftime("%Y-%m-%d"))
+                    output_file_path = os.path.join(os.getcwd(), output_file_name)
+                    daily_files[day] = output_file_path
+                _write_csv(output_file_path, map(getter, rows), GCP_REPORT_COLUMNS, append=append)
 
             count += 1
             if count % ten_percent == 0:
                 LOG.info(f"Done with {count} of {num_gens} generators.")
 
-    monthly_files = []
-    for day, daily_data in data.items():
-        output_file_name = "{}-{}.csv".format(report_prefix, day.strftime("%Y-%m-%d"))
-
-        output_file_path = os.path.join(os.getcwd(), output_file_name)
-        monthly_files.append(output_file_path)
-        _write_csv(output_file_path, daily_data, GCP_REPORT_COLUMNS)
-
+    monthly_files = list(daily_files.values())
     if gcp_bucket_name:
-        gcp_route_file(gcp_bucket_name, output_file_path, output_file_name)
+        routes = [(gcp_bucket_name, file_path, os.path.basename(file_path)) for file_path in monthly_files]
+        _route_files(gcp_route_file, routes, options.get("upload_workers"))
 
     write_monthly = options.get("write_monthly", False)
     if not write_monthly:
@@ -14,64 +14,147 @@
 # You should have received a copy of the GNU Affero General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
-"""Defines the upload mechanism to various clouds."""
+"""Defines the upload mechanism to various clouds.
+
+The cloud SDKs are imported by the functions that use them, so runs that never
+upload to a cloud do not pay for importing them.
+"""
 import os
 import sys
+import threading
 import traceback
 
-import boto3
-from azure.storage.blob import BlobServiceClient
-from botocore.exceptions import ClientError
-from google.cloud import storage
-from google.cloud.exceptions import GoogleCloudError
-from msrestazure.azure_exceptions import ClientException
-from msrestazure.azure_exceptions import CloudError
 from nise.util import LOG
-from requests.exceptions import ConnectionError as BotoConnectionError
 
 
-def upload_to_s3(bucket_name, bucket_file_path, local_path):
+S3_MAX_POOL_CONNECTIONS = 32
+
+_S3_CLIENTS = {}
+_S3_CLIENTS_LOCK = threading.Lock()
+_AZURE_CLIENTS = {}
+_AZURE_CLIENTS_LOCK = threading.Lock()
+_GCP_BUCKETS = {}
+_GCP_BUCKETS_LOCK = threading.Lock()
+
+
+def get_s3_client(endpoint_url=None):
+    """Return the S3 client of this process, creating it on first use.
+
+    boto3 clients are thread-safe, so every upload of a process shares one client and
+    its connection pool. Clients are kept per process because they must not be
+    shared across a fork. The endpoint defaults to the AWS configuration, so
+    AWS_ENDPOINT_URL_S3 points uploads at a local S3 stand-in such as moto or MinIO.
+
+    Args:
+        endpoint_url (String): URL of an S3 compatible endpoint
+    Returns:
+        (S3.Client): the shared client
+
+    """
+    import boto3
+    from botocore.config import Config
+
+    key = (os.getpid(), endpoint_url)
+    with _S3_CLIENTS_LOCK:
+        if key not in _S3_CLIENTS:
+            session = boto3.session.Session()
+            config = Config(max_pool_connections=S3_MAX_POOL_CONNECTIONS)
+            _S3_CLIENTS[key] = session.client("s3", endpoint_url=endpoint_url, config=config)
+        return _S3_CLIENTS[key]
+
+
+def s3_transfer_config(multipart_chunksize=None, max_concurrency=None):
+    """Build the transfer settings of S3 uploads.
+
+    Args:
+        multipart_chunksize (Int): size in MB of each part of a multipart upload
+        max_concurrency (Int): number of threads uploading the parts of one file
+    Returns:
+        (TransferConfig): transfer settings, boto3 defaults for unset values
+
+    """
+    from boto3.s3.transfer import TransferConfig
+
+    settings = {}
+    if multipart_chunksize:
+        settings["multipart_threshold"] = settings["multipart_chunksize"] = multipart_chunksize * 1024 * 1024
+    if max_concurrency:
+        settings["max_concurrency"] = max_concurrency
+    return TransferConfig(**settings)
+
+
+def upload_to_s3(bucket_name, bucket_file_path, local_path, transfer_config=None):
     """Upload data to an S3 bucket.
 
     Args:
         bucket_name (String): The name of the S3 bucket
         bucket_file_path (String): The path to store the file to
         local_path  (String): The local file system path of the file
+        transfer_config (TransferConfig): multipart and concurrency settings of the upload
     Returns:
         (Boolean): True if file was uploaded
 
     """
+    from boto3.exceptions import S3UploadFailedError
+    from botocore.exceptions import ClientError
+    from requests.exceptions import ConnectionError as BotoConnectionError
+
     uploaded = True
     try:
-        s3_client = boto3.resource("s3")
-        s3_client.Bucket(bucket_name).upload_file(local_path, bucket_file_path)
+        s3_client = get_s3_client()
+        s3_client.upload_file(local_path, bucket_name, bucket_file_path, Config=transfer_config)
         msg = f"Uploaded {bucket_file_path} to s3 bucket {bucket_name}."
         LOG.info(msg)
-    except (ClientError, BotoConnectionError, boto3.exceptions.S3UploadFailedError) as upload_err:
+    except (ClientError, BotoConnectionError, S3UploadFailedError) as upload_err:
         LOG.error(upload_err)
         uploaded = False
     return uploaded
 
 
-def upload_to_azure_container(storage_file_name, local_path, storage_file_path):
+def get_blob_service_client(connect_str):
+    """Return the Azure blob service client of this process for a connection string.
+
+    The client is thread-safe and keeps its connection pool between uploads. A
+    connection string pointing at Azurite sends uploads to the local emulator.
+
+    Args:
+        connect_str (String): Azure storage connection string
+    Returns:
+        (BlobServiceClient): the shared client
+
+    """
+    from azure.storage.blob import BlobServiceClient
+
+    key = (os.getpid(), connect_str)
+    with _AZURE_CLIENTS_LOCK:
+        if key not in _AZURE_CLIENTS:
+            _AZURE_CLIENTS[key] = BlobServiceClient.from_connection_string(connect_str)
+        return _AZURE_CLIENTS[key]
+
+
+def upload_to_azure_container(storage_file_name, local_path, storage_file_path, max_concurrency=None):
     """Upload data to a storage account.
 
     Args:
         storage_file_name (String): The container to upload file to
         local_path  (String): The full local file system path of the file
         storage_file_path (String): The file path to upload to within container
+        max_concurrency (Int): number of connections uploading the chunks of the file
 
     Returns:
         (Boolean): True if file was uploaded
 
     """
+    from msrestazure.azure_exceptions import ClientException
+    from msrestazure.azure_exceptions import CloudError
+
     try:
         # Retrieve the connection string for use with the application.
         connect_str = os.getenv("AZURE_STORAGE_CONNECTION_STRING")
-        blob_service_client = BlobServiceClient.from_connection_string(connect_str)
+        blob_service_client = get_blob_service_client(connect_str)
         blob_client = blob_service_client.get_blob_client(container=storage_file_name, blob=storage_file_path)
         with open(local_path, "rb") as data:
-            blob_client.upload_blob(data=data)
+            blob_client.upload_blob(data=data, max_concurrency=max_concurrency or 1)
         LOG.info(f"uploaded {storage_file_name} to {storage_file_path}")
     except (CloudError, ClientException, IOError) as error:
         LOG.error(error)
@@ -80,6 +163,28 @@ def upload_to_azure_container(storage_file_name, local_path, storage_file_path):
     return True
 
 
+def get_gcp_bucket(bucket_name):
+    """Return the GCP Storage bucket handle of this process, creating it on first use.
+
+    Uploads to a bucket share one client and one bucket lookup. STORAGE_EMULATOR_HOST
+    points the client at a local fake GCS server.
+
+    Args:
+        bucket_name (String): The name of the bucket
+    Returns:
+        (Bucket): the shared bucket handle
+
+    """
+    from google.cloud import storage
+
+    key = (os.getpid(), bucket_name)
+    with _GCP_BUCKETS_LOCK:
+        if key not in _GCP_BUCKETS:
+            storage_client = storage.Client()
+            _GCP_BUCKETS[key] = storage_client.get_bucket(bucket_name)
+        return _GCP_BUCKETS[key]
+
+
 def upload_to_gcp_storage(bucket_name, source_file_name, destination_blob_name):
     """
     Upload data to a GCP Storage Bucket.
@@ -93,9 +198,11 @@ def upload_to_gcp_storage(bucket_name, source_file_name, destination_blob_name):
         (Boolean): True if file was uploaded
 
     """
+    from google.cloud.exceptions import GoogleCloudError
+
     uploaded = True
 
-    if "GOOGLE_APPLICATION_CREDENTIALS" not in os.environ:
+    if "GOOGLE_APPLICATION_CREDENTIALS" not in os.environ and "STORAGE_EMULATOR_HOST" not in os.environ:
         LOG.warning(
             "Please set your GOOGLE_APPLICATION_CREDENTIALS "
             "environment variable before attempting to load file into"
@@ -103,9 +210,7 @@ def upload_to_gcp_storage(bucket_name, source_file_name, destination_blob_name):
         )
         return False
     try:
-        storage_client = storage.Client()
-
-        bucket = storage_client.get_bucket(bucket_name)
+        bucket = get_gcp_bucket(bucket_name)
         blob = bucket.blob(destination_blob_name)
 
         blob.upload_from_filename(source_file_name)
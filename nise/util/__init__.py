@@ -17,6 +17,12 @@
 """Utility functions."""
 import yaml
 
+from .fake import derive_seed  # noqa: F401
+from .fake import FAKER  # noqa: F401
+from .fake import get_faker  # noqa: F401
+from .fake import ID_FACTORY  # noqa: F401
+from .fake import random_streams  # noqa: F401
+from .fake import SeededFaker  # noqa: F401
 from .log import LOG  # noqa: F401
 from .log import LOG_FORMAT  # noqa: F401
 from .log import LOG_VERBOSITY  # noqa: F401
@@ -0,0 +1,187 @@
+#
+# Copyright 2020 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Shared Faker instance, a fast factory for the fake values of hot paths, and their seeding."""
+import hashlib
+import os
+import random
+import string
+import threading
+
+_FAKER = None
+_FAKER_LOCK = threading.Lock()
+# Held while a SeededFaker draws from the shared Faker.
+_SEEDED_FAKER_LOCK = threading.Lock()
+
+
+def get_faker():
+    """Return the Faker shared by nise, creating it on first use.
+
+    Faker loads its providers when it is instantiated, so this is deferred
+    until fake data is actually needed.
+    """
+    global _FAKER
+    if _FAKER is None:
+        with _FAKER_LOCK:
+            if _FAKER is None:
+                from faker import Faker
+
+                _FAKER = Faker()
+                # Faker() draws from a random state shared at module level, so give it its own.
+                _FAKER.seed_instance()
+    return _FAKER
+
+
+def derive_seed(seed, *keys):
+    """Derive the seed of an independent random stream from a base seed.
+
+    The base seed is hashed with the keys naming the stream, for example a provider,
+    a generator class and a month, so a stream does not depend on which other streams
+    were created before it or in which process.
+
+    Args:
+        seed (Int): the base seed
+        keys: values naming the stream
+    Returns:
+        (Int): a 64-bit seed
+
+    """
+    data = "\0".join(str(key) for key in (seed,) + keys).encode()
+    return int.from_bytes(hashlib.sha256(data).digest()[:8], "big")
+
+
+def random_streams(seed=None):
+    """Return the random, Faker and ID streams of a seed.
+
+    Without a seed these are the random module, the shared Faker and the shared ID
+    factory. With a seed each is a new, independently seeded stream.
+
+    Returns:
+        (random.Random): source of random choices and samples
+        (Faker): source of fake values
+        (IdFactory): source of IDs and words
+
+    """
+    if seed is None:
+        return random, FAKER, ID_FACTORY
+    return (
+        random.Random(derive_seed(seed, "random")),
+        SeededFaker(derive_seed(seed, "faker")),
+        IdFactory(derive_seed(seed, "ids")),
+    )
+
+
+class LazyFaker:
+    """Stand-in for the shared Faker that creates it on first attribute access."""
+
+    def __getattr__(self, name):
+        """Look the attribute up on the shared Faker."""
+        # Protocol lookups, such as ABCMeta probing class attributes, must not create it.
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return getattr(get_faker(), name)
+
+
+FAKER = LazyFaker()
+
+
+class SeededFaker:
+    """Faker drawing its values from its own random.Random.
+
+    It calls the providers of the shared Faker with its own random state swapped in,
+    so it is cheap to create and can be pickled along with a generator, which a
+    Faker instance cannot.
+    """
+
+    def __init__(self, seed=None):
+        """Initialize the Faker."""
+        self.random = random.Random(seed)
+
+    def __getattr__(self, name):
+        """Return the provider of the shared Faker, bound to the random state of this Faker."""
+        if name.startswith("__"):
+            raise AttributeError(name)
+        provider = getattr(get_faker(), name)
+
+        def call(*args, **kwargs):
+            faker = get_faker()
+            with _SEEDED_FAKER_LOCK:
+                shared_random = faker.random
+                faker.random = self.random
+                try:
+                    return provider(*args, **kwargs)
+                finally:
+                    faker.random = shared_random
+
+        return call
+
+
+class IdFactory:
+    """Seedable factory for the IDs and words generated per row or per resource.
+
+    Values have the formats of the matching Faker providers, but are drawn straight
+    from a PRNG and a precomputed word pool instead of through Faker's provider
+    dispatch, which is several times slower.
+    """
+
+    def __init__(self, seed=None):
+        """Initialize the factory."""
+        self.random = random.Random(seed)
+        self._words = None
+
+    def seed(self, seed):
+        """Seed the factory."""
+        self.random.seed(seed)
+
+    @property
+    def words(self):
+        """Return the word pool of Faker's word provider, loading it on first use."""
+        if self._words is None:
+            from faker.providers.lorem.en_US import Provider
+
+            self._words = tuple(Provider.word_list)
+        return self._words
+
+    def sha1(self):
+        """Return a random SHA1 hex digest."""
+        return format(self.random.getrandbits(160), "040x")
+
+    def pystr(self, min_chars=None, max_chars=20):
+        """Return a random string of upper and lowercase letters."""
+        length = max_chars if min_chars is None else self.random.randint(min_chars, max_chars)
+        return "".join(self.random.choices(string.ascii_letters, k=length))
+
+    def word(self):
+        """Return a random word."""
+        return self.random.choice(self.words)
+
+
+ID_FACTORY = IdFactory()
+
+
+def _reseed_shared_streams():
+    """Reseed the shared Faker and ID factory from the OS.
+
+    Forked worker processes inherit their random state, so like the random module
+    it is reseeded in each child, or every worker would repeat the values of the others.
+    """
+    ID_FACTORY.seed(None)
+    if _FAKER is not None:
+        _FAKER.seed_instance()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reseed_shared_streams)
@@ -22,8 +22,8 @@ from calendar import monthrange
 from datetime import date
 from random import uniform
 
-import faker
 from dateutil.relativedelta import relativedelta
+from nise.util import FAKER
 from nise.util import LOG
 from nise.yaml_generators.aws.ec2_instance_types import INSTANCE_TYPES as EC2_INSTANCES
 from nise.yaml_generators.aws.rds_instance_types import INSTANCE_TYPES as RDS_INSTANCES
@@ -37,7 +37,6 @@ SEEN_NAMES = set()
 SEEN_RESOURCE_IDS = set()
 
 DBL_DASH = re.compile("-+")
-FAKER = faker.Faker()
 RESOURCE_TAG_COLS = {
     "DTG": ["resourceTags/user:app"],
     "EBS": ["resourceTags/user:storageclass"],
@@ -21,15 +21,14 @@ from calendar import monthrange
 from datetime import date
 from uuid import uuid4
 
-import faker
 from dateutil.relativedelta import relativedelta
+from nise.util import FAKER
 from nise.util import LOG
 from nise.yaml_generators.generator import Generator
 from nise.yaml_generators.utils import dicta
 from nise.yaml_generators.utils import generate_name
 
 
-FAKER = faker.Faker()
 ACCTS_STR = {
     "sql": ("Microsoft.Sql", "servers"),
     "storage": ("Microsoft.Storage", "storageAccounts"),
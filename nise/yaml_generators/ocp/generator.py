@@ -18,8 +18,8 @@ import os
 from calendar import monthrange
 from datetime import date
 
-import faker
 from dateutil.relativedelta import relativedelta
+from nise.util import FAKER
 from nise.util import LOG
 from nise.yaml_generators.generator import Generator
 from nise.yaml_generators.utils import dicta
@@ -27,7 +27,6 @@ from nise.yaml_generators.utils import generate_name
 from nise.yaml_generators.utils import generate_resource_id
 
 
-FAKER = faker.Faker()
 SEEN_LABELS = set()
 
 
@@ -18,7 +18,7 @@
 """Utility functions for large yaml generator."""
 import re
 
-import faker
+from nise.util import FAKER
 
 
 SEEN_NAMES = set()
@@ -26,7 +26,6 @@ SEEN_ACCOUNT_IDS = set()
 SEEN_RESOURCE_IDS = set()
 
 DBL_DASH = re.compile("-+")
-FAKER = faker.Faker()
 
 
 def generate_words(config):
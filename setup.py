@@ -61,6 +61,7 @@ setup(
         "google-cloud-storage>=1.19",
         "pyyaml>=5.3",
     ],
+    extras_require={"numpy": ["numpy>=1.17"]},
     dependency_links=[],
     entry_points={"console_scripts": ["nise = nise.__main__:main"]},
     include_package_data=True,
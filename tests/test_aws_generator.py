@@ -29,6 +29,8 @@ from nise.generators.aws import RDSGenerator
 from nise.generators.aws import Route53Generator
 from nise.generators.aws import S3Generator
 from nise.generators.aws import VPCGenerator
+from nise.generators.generator import get_template_environment
+from nise.generators.generator import StaticConfig
 
 
 def create_test_config(**kwargs):
@@ -139,6 +141,25 @@ class AbstractGeneratorTestCase(TestCase):
                 ]
                 self.assertEqual(generator.hours, expected)
 
+    def test_num_instances(self):
+        """Test that each generator emits one row per instance per hour."""
+        two_hours_ago = (self.now - self.one_hour) - self.one_hour
+        for TestGenerator in AWS_GENERATORS:
+            with self.subTest(generator=TestGenerator.__name__):
+                generator = TestGenerator(two_hours_ago, self.now, num_instances=3)
+                self.assertEqual(generator.num_instances, 3)
+                self.assertEqual(generator.expected_row_count, 6)
+                self.assertEqual(len(list(generator.generate_data())), generator.expected_row_count)
+
+    def test_template_environment_cached(self):
+        """Test that generators reuse one template environment per config directory."""
+        two_hours_ago = (self.now - self.one_hour) - self.one_hour
+        EC2Generator(two_hours_ago, self.now)
+        env = get_template_environment(None)
+        EBSGenerator(two_hours_ago, self.now)
+        self.assertIs(get_template_environment(None), env)
+        self.assertEqual(len(env.loader.loaders), 1)
+
     def test_timestamp_none(self):
         """Test that the timestamp method fails with None."""
         for TestGenerator in AWS_GENERATORS:
@@ -164,6 +185,34 @@ class AbstractGeneratorTestCase(TestCase):
                 for col in generator.AWS_COLUMNS:
                     self.assertIsNotNone(a_row.get(col))
 
+    def test_init_data_row_prototype(self):
+        """Test that rows of a billing period are copied from one prototype."""
+        two_hours_ago = (self.now - self.one_hour) - self.one_hour
+        generator = EC2Generator(two_hours_ago, self.now)
+        config = generator.config[0]
+        first = generator._init_data_row(two_hours_ago, two_hours_ago + self.one_hour, config=config)
+        second = generator._init_data_row(two_hours_ago + self.one_hour, self.now, config=config)
+        self.assertEqual(len(generator._row_prototypes), 1)
+        self.assertIsNot(first, second)
+        self.assertEqual(first["bill/BillingPeriodStartDate"], second["bill/BillingPeriodStartDate"])
+        self.assertEqual(first["bill/PayerAccountId"], config.get("payer_account"))
+        self.assertNotEqual(first["identity/LineItemId"], second["identity/LineItemId"])
+        self.assertNotEqual(first["identity/TimeInterval"], second["identity/TimeInterval"])
+
+    def test_generate_rows(self):
+        """Test that rows are generated as tuples in column order."""
+        two_hours_ago = (self.now - self.one_hour) - self.one_hour
+        generator = EC2Generator(two_hours_ago, self.now, num_instances=1)
+        columns = generator.column_order()
+        self.assertEqual(list(columns), sorted(generator.AWS_COLUMNS))
+        self.assertIs(columns, generator.column_order())
+        rows = list(generator.generate_rows(columns))
+        self.assertEqual(len(rows), generator.expected_row_count)
+        for row in rows:
+            self.assertIsInstance(row, tuple)
+            self.assertEqual(len(row), len(columns))
+            self.assertEqual(row[columns.index("lineItem/ProductCode")], "AmazonEC2")
+
     def test_init_data_row_start_none(self):
         """Test the init data row method none start date."""
         two_hours_ago = (self.now - self.one_hour) - self.one_hour
@@ -283,6 +332,19 @@ class AWSGeneratorTestCase(TestCase):
         self.assertNotIn("key-that-has-not-been-added", generator.AWS_COLUMNS)
         os.remove(test_config)
 
+    def test_shared_static_config(self):
+        """Test that a parsed static config can be shared between generators without being modified."""
+        test_config = create_test_config(**self.test_config_kwargs)
+        static_config = StaticConfig(test_config)
+        self.assertEqual(static_config.counts["EC2Generator"], 1)
+        first = EC2Generator(self.two_hours_ago, self.now, user_config=static_config)
+        second = EC2Generator(self.two_hours_ago, self.now, user_config=static_config)
+        self.assertEqual(first.config[0].get("product_sku"), self.product_sku)
+        self.assertEqual(second.config[0].get("product_sku"), self.product_sku)
+        self.assertIsNot(first.config[0], second.config[0])
+        self.assertIsNot(first.config[0].get("tags"), static_config.data["generators"][0]["EC2Generator"]["tags"])
+        os.remove(test_config)
+
     def test_unknown_location(self):
         """Test that an unknown location doesn't result in stack trace."""
         test_args = self.test_config_kwargs
@@ -433,6 +495,12 @@ class TestEC2Generator(AWSGeneratorTestCase):
         data = generator.generate_data()
         self.assertNotEqual(data, [])
 
+    def test_generate_data_with_seed(self):
+        """Test that generators with the same seed produce the same rows."""
+        rows = [list(EC2Generator(self.two_hours_ago, self.now, seed=seed).generate_data()) for seed in (42, 42, 43)]
+        self.assertEqual(rows[0], rows[1])
+        self.assertNotEqual(rows[0], rows[2])
+
 
 class TestRoute53Generator(AWSGeneratorTestCase):
     """Tests for the Route53 Generator type."""
@@ -20,6 +20,7 @@ import tempfile
 from datetime import datetime
 from datetime import timedelta
 from unittest import TestCase
+from unittest.mock import MagicMock
 
 from faker import Faker
 from nise.generators.azure import AZURE_COLUMNS
@@ -122,6 +123,16 @@ class AbstractGeneratorTestCase(TestCase):
                 for col in AZURE_COLUMNS:
                     self.assertIsNotNone(a_row.get(col))
 
+    def test_generate_data_is_lazy(self):
+        """Test that generate_data yields one row per day and config."""
+        yesterday = self.now - timedelta(days=1)
+        for TestGenerator in AZURE_GENERATORS:
+            with self.subTest(generator=TestGenerator.__name__):
+                generator = TestGenerator(yesterday, self.now)
+                rows = generator.generate_data()
+                self.assertIsInstance(next(rows), dict)
+                self.assertEqual(1 + len(list(rows)), len(generator.days) * len(generator.config))
+
     def test_init_data_row_start_none(self):
         """Test the init data row method none start date."""
         two_hours_ago = (self.now - self.one_hour) - self.one_hour
@@ -321,6 +332,26 @@ class TestSQLGenerator(AzureGeneratorTestCase):
 class TestVMGenerator(AzureGeneratorTestCase):
     """Tests for the VM Generator type."""
 
+    def test_cached_meter_values_with_meter_seed(self):
+        """Test that the meter values follow the meter seed, whatever the seed of the generator."""
+        meter_ids = [f"meter-{index}" for index in range(20)]
+
+        def meter_values(seed, meter_seed):
+            generator = VMGenerator(self.two_hours_ago, self.now, {}, seed=seed, meter_seed=meter_seed)
+            return [generator._get_cached_meter_values(meter_id, generator.SERVICE_METER) for meter_id in meter_ids]
+
+        values = meter_values(1, 42)
+        self.assertEqual(meter_values(2, 42), values)
+        self.assertNotEqual(meter_values(1, 43), values)
+
+    def test_cached_meter_values_read_shared_cache_once(self):
+        """Test that the shared meter cache is read once per meter, not once per row."""
+        shared_cache = MagicMock(wraps={})
+        generator = VMGenerator(self.two_hours_ago, self.now, shared_cache)
+        values = [generator._get_cached_meter_values("meter", generator.SERVICE_METER) for _ in range(5)]
+        self.assertEqual(len(set(values)), 1)
+        shared_cache.get.assert_called_once_with("meter")
+
     def test_init_no_attributes(self):
         """Test the init wihout attributes."""
         generator = VMGenerator(self.two_hours_ago, self.now)
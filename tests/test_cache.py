@@ -0,0 +1,141 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Tests for the report cache."""
+import os
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+from unittest.mock import patch
+
+from nise.cache import cache_key
+from nise.cache import INDEX_FILE
+from nise.cache import ReportCache
+
+
+class CacheKeyTestCase(TestCase):
+    """
+    TestCase class for cache_key
+    """
+
+    def test_cache_key(self):
+        """Test that the key follows the options that change the reports, and only those."""
+        options = {"provider": "aws", "seed": 42, "days_per_month": 4, "month_workers": 1, "cache_dir": "a"}
+        key = cache_key(options, "aws", "2024-01")
+        self.assertEqual(cache_key(dict(options, month_workers=4, cache_dir="b"), "aws", "2024-01"), key)
+        self.assertEqual(cache_key(dict(options, workers=4, upload_workers=8), "aws", "2024-01"), key)
+        self.assertNotEqual(cache_key(dict(options, seed=43), "aws", "2024-01"), key)
+        self.assertNotEqual(cache_key(options, "aws", "2024-02"), key)
+        with patch("nise.cache.__version__", "0.0.0"):
+            self.assertNotEqual(cache_key(options, "aws", "2024-01"), key)
+
+    def test_cache_key_static_report_file(self):
+        """Test that the key follows the contents of the static report file, not its path."""
+        with TemporaryDirectory() as directory:
+            static_files = []
+            for name, contents in (("a.yml", "generators: []"), ("b.yml", "generators: []"), ("c.yml", "x: 1")):
+                static_files.append(os.path.join(directory, name))
+                with open(static_files[-1], "w") as static_file:
+                    static_file.write(contents)
+            keys = [cache_key({"static_report_file": static_file}) for static_file in static_files]
+        self.assertEqual(keys[0], keys[1])
+        self.assertNotEqual(keys[0], keys[2])
+
+
+class ReportCacheTestCase(TestCase):
+    """
+    TestCase class for ReportCache
+    """
+
+    def setUp(self):
+        """Test setup."""
+        self.directory = TemporaryDirectory()
+        self.source_dir = TemporaryDirectory()
+
+    def tearDown(self):
+        """Test teardown."""
+        self.directory.cleanup()
+        self.source_dir.cleanup()
+
+    def _source_file(self, name, size=10):
+        """Write a source file of size bytes."""
+        path = os.path.join(self.source_dir.name, name)
+        with open(path, "wb") as source:
+            source.write(b"x" * size)
+        return path
+
+    def test_put_and_get(self):
+        """Test that stored files come back by group with their names and file names."""
+        cache = ReportCache(self.directory.name)
+        report = self._source_file("report.csv.gz")
+        manifest = self._source_file("manifest.json", 5)
+        with cache.get("key") as cached:
+            self.assertIsNone(cached)
+
+        cache.put("key", {"reports": [("cur/report.csv.gz", report)], "manifests": [("a", manifest), ("b", manifest)]})
+        os.remove(report)
+        with cache.get("key") as cached:
+            self.assertEqual(list(cached), ["reports", "manifests"])
+            self.assertEqual([name for name, _ in cached["manifests"]], ["a", "b"])
+            [(name, path)] = cached["reports"]
+            self.assertEqual(name, "cur/report.csv.gz")
+            self.assertEqual(os.path.basename(path), "report.csv.gz")
+            with open(path, "rb") as cached_report:
+                self.assertEqual(cached_report.read(), b"x" * 10)
+        self.assertFalse(os.path.exists(path))
+        self.assertEqual(os.listdir(self.directory.name), ["key"])
+
+    def test_get_survives_eviction(self):
+        """Test that the files of a month stay readable when it is evicted while they are used."""
+        cache = ReportCache(self.directory.name, max_size=1500)
+        cache.put("first", {"reports": [("report", self._source_file("report", 1000))]})
+        with cache.get("first") as cached:
+            [(_, path)] = cached["reports"]
+            # Another month worker stores a month and evicts this one.
+            ReportCache(self.directory.name, max_size=1500).put(
+                "second", {"reports": [("report", self._source_file("report", 1000))]}
+            )
+            self.assertNotIn("first", os.listdir(self.directory.name))
+            with open(path, "rb") as cached_report:
+                self.assertEqual(cached_report.read(), b"x" * 1000)
+
+    def test_put_existing_key(self):
+        """Test that storing a cached month again keeps the first copy."""
+        cache = ReportCache(self.directory.name)
+        cache.put("key", {"reports": [("report", self._source_file("report", 10))]})
+        cache.put("key", {"reports": [("report", self._source_file("report", 20))]})
+        with cache.get("key") as cached:
+            [(_, path)] = cached["reports"]
+            self.assertEqual(os.path.getsize(path), 10)
+        self.assertEqual(os.listdir(self.directory.name), ["key"])
+
+    def test_evict_least_recently_used(self):
+        """Test that the least recently used months are removed past the size limit."""
+        cache = ReportCache(self.directory.name, max_size=2500)
+        for used, key in enumerate(("first", "second")):
+            cache.put(key, {"reports": [("report", self._source_file("report", 1000))]})
+            os.utime(os.path.join(self.directory.name, key, INDEX_FILE), (used, used))
+        with cache.get("first") as cached:
+            self.assertIsNotNone(cached)
+
+        cache.put("third", {"reports": [("report", self._source_file("report", 1000))]})
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["first", "third"])
+
+    def test_evict_unbounded(self):
+        """Test that a cache without a size limit keeps every month."""
+        cache = ReportCache(self.directory.name)
+        for key in ("first", "second", "third"):
+            cache.put(key, {"reports": [("report", self._source_file("report", 1000))]})
+        self.assertEqual(sorted(os.listdir(self.directory.name)), ["first", "second", "third"])
@@ -62,7 +62,7 @@ class TestGCPGenerator(TestCase):
         test_args["generator"] = "CloudStorageGenerator"
         test_config = create_test_config(**test_args)
         generator = CloudStorageGenerator(self.yesterday, self.now, self.project, user_config=test_config)
-        generated_data = generator.generate_data()
+        generated_data = dict(generator.generate_data())
         self.assertEqual(generated_data[self.yesterday][0]["Line Item"], self.test_config_kwargs["Line Item"])
         self.assertEqual(generated_data[self.yesterday][0]["Measurement1"], self.test_config_kwargs["Measurement1"])
         self.assertEqual(generated_data[self.yesterday][0]["Currency"], self.test_config_kwargs["Currency"])
@@ -73,7 +73,7 @@ class TestGCPGenerator(TestCase):
 
         test_config = create_test_config(**self.test_config_kwargs)
         generator = ComputeEngineGenerator(self.yesterday, self.now, self.project, user_config=test_config)
-        generated_data = generator.generate_data()
+        generated_data = dict(generator.generate_data())
         self.assertEqual(generated_data[self.yesterday][0]["Line Item"], self.test_config_kwargs["Line Item"])
         self.assertEqual(generated_data[self.yesterday][0]["Measurement1"], self.test_config_kwargs["Measurement1"])
         self.assertEqual(generated_data[self.yesterday][0]["Currency"], self.test_config_kwargs["Currency"])
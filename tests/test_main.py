@@ -17,13 +17,17 @@
 import argparse
 import builtins
 import os
+import subprocess
+import sys
 from datetime import date
 from unittest import TestCase
 from unittest.mock import patch
 
 from nise.__main__ import _validate_provider_inputs
+from nise.__main__ import _validate_static_report_files
 from nise.__main__ import create_parser
 from nise.__main__ import main
+from nise.__main__ import positive_int
 from nise.__main__ import valid_date
 from nise.util import load_yaml
 
@@ -53,6 +57,18 @@ class CommandLineTestCase(TestCase):
         out_date = valid_date(date_str)
         self.assertEqual(date_obj, out_date.date())
 
+    def test_positive_int(self):
+        """Test that worker counts must be positive integers."""
+        self.assertEqual(positive_int("4"), 4)
+        for value in ("0", "-1", "foo"):
+            with self.subTest(value=value):
+                with self.assertRaises(argparse.ArgumentTypeError):
+                    positive_int(value)
+        for option in ("--workers", "--month-workers", "--upload-workers", "--cache-size"):
+            with self.subTest(option=option):
+                with self.assertRaises(SystemExit):
+                    self.parser.parse_args(["report", "aws", "--start-date", "2018-01-02", option, "0"])
+
     @patch("nise.__main__.argparse.ArgumentParser.parse_args")
     def test_with_empty_args(self, mock_args):
         """
@@ -269,6 +285,71 @@ class CommandLineTestCase(TestCase):
         is_valid, _ = _validate_provider_inputs(self.parser, options)
         self.assertTrue(is_valid)
 
+    def test_ocp_multiple_cluster_ids(self):
+        """
+        Test where user passes ocp with several cluster ids.
+        """
+        args = ["report", "ocp", "--start-date", str(date.today()), "--ocp-cluster-id", "132", "456"]
+        options = vars(self.parser.parse_args(args))
+        self.assertEqual(options.get("ocp_cluster_id"), ["132", "456"])
+        is_valid, _ = _validate_provider_inputs(self.parser, options)
+        self.assertTrue(is_valid)
+
+    def test_static_report_files(self):
+        """
+        Test that a single static file is unwrapped and several files need one OCP cluster id each.
+        """
+        args = ["report", "aws", "--static-report-file", "a.yml"]
+        options = vars(self.parser.parse_args(args))
+        _validate_static_report_files(self.parser, options)
+        self.assertEqual(options.get("static_report_file"), "a.yml")
+
+        args = ["report", "ocp", "--ocp-cluster-id", "132", "456", "--static-report-file", "a.yml", "b.yml"]
+        options = vars(self.parser.parse_args(args))
+        _validate_static_report_files(self.parser, options)
+        self.assertEqual(options.get("static_report_file"), ["a.yml", "b.yml"])
+
+        for args in (
+            ["report", "ocp", "--ocp-cluster-id", "132", "--static-report-file", "a.yml", "b.yml"],
+            ["report", "aws", "--static-report-file", "a.yml", "b.yml"],
+        ):
+            with self.subTest(args=args):
+                options = vars(self.parser.parse_args(args))
+                with self.assertRaises(SystemExit):
+                    _validate_static_report_files(self.parser, options)
+
+    def test_help_does_not_import_cloud_sdks(self):
+        """
+        Test that starting nise does not import the cloud SDKs, Faker or NumPy.
+
+        The startup time itself varies too much between machines to assert on, so the
+        test checks the import log of the interpreter for the modules that made it slow.
+        """
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-m", "nise", "--help"],
+            cwd=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            universal_newlines=True,
+            check=True,
+        )
+        imported = {
+            line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")
+        }
+        self.assertIn("nise.report", imported)
+        lazy_modules = (
+            "boto3",
+            "botocore",
+            "azure.storage.blob",
+            "msrestazure",
+            "google.cloud.storage",
+            "faker",
+            "numpy",
+        )
+        for module in lazy_modules:
+            with self.subTest(module=module):
+                self.assertNotIn(module, imported)
+
     def test_main_no_inputs(self):
         """
         Test execution of main without inputs.
@@ -276,6 +357,19 @@ class CommandLineTestCase(TestCase):
         with self.assertRaises(SystemExit):
             main()
 
+    def test_cache_dir_requires_seed(self):
+        """
+        Test that --cache-dir is refused without --seed.
+        """
+        args = ["report", "ocp", "--start-date", str(date.today()), "--ocp-cluster-id", "c1", "--cache-dir", "cache"]
+        parsed_args = self.parser.parse_args(args)
+        with patch("nise.__main__.run") as mock_run:
+            with patch("nise.__main__.argparse.ArgumentParser.parse_args") as mock_args:
+                mock_args.return_value = parsed_args
+                with self.assertRaises(SystemExit):
+                    main()
+        mock_run.assert_not_called()
+
     def test_load_yaml(self):
         """
         Test to load static report yaml file.
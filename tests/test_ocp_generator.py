@@ -17,10 +17,14 @@
 """OCP Generator Unit Tests."""
 import os
 import random
+import sys
 import tempfile
 from copy import copy
+from copy import deepcopy
+from datetime import date
 from datetime import datetime
 from datetime import timedelta
+from unittest import skipIf
 from unittest import TestCase
 from unittest.mock import Mock
 from unittest.mock import patch
@@ -34,6 +38,12 @@ from nise.generators.ocp.ocp_generator import OCP_POD_USAGE_COLUMNS
 from nise.generators.ocp.ocp_generator import OCP_STORAGE_COLUMNS
 from nise.generators.ocp.ocp_generator import OCP_STORAGE_USAGE
 from nise.generators.ocp.ocp_generator import OCPGenerator
+from nise.generators.ocp.ocp_generator import VECTORIZED_HOURS
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class OCPGeneratorTestCase(TestCase):
@@ -88,6 +98,7 @@ class OCPGeneratorTestCase(TestCase):
                                     "mem_request_gig": self.fake.pyint(1, 32),
                                     "cpu_limit": self.fake.pyint(1, 10),
                                     "mem_limit_gig": self.fake.pyint(1, 32),
+                                    "pod_seconds": self.fake.pyint(300, 3600),
                                     "labels": (
                                         f"label_{self.fake.word()}:{self.fake.word()}",
                                         f"|label_{self.fake.word()}:{self.fake.word()}",
@@ -217,6 +228,22 @@ generators:
                                     self.assertIsNotNone(row[col])
                         break  # only test one row
 
+    def test_gen_hourly_pods_usage_leaves_pods_unchanged(self):
+        """Test that pod usage rows are built without modifying the pod config."""
+        generator = OCPGenerator(self.two_hours_ago, self.now)
+        generator.nodes = self.attributes.get("nodes")
+        pods = [pod for namespace in generator.nodes[0].get("namespaces") for pod in namespace.get("pods")]
+        expected = deepcopy(pods)
+
+        rows = list(generator._gen_hourly_pods_usage(report_type=OCP_POD_USAGE))
+        self.assertEqual(len(rows), len(generator.hours) * len(pods))
+        self.assertEqual(pods, expected)
+        for row in rows:
+            with self.subTest(row=row):
+                self.assertEqual(set(row), set(OCP_POD_USAGE_COLUMNS))
+                self.assertLessEqual(row["pod_usage_cpu_core_seconds"], row["pod_limit_cpu_core_seconds"])
+                self.assertLessEqual(row["pod_usage_memory_byte_seconds"], row["pod_limit_memory_byte_seconds"])
+
     def test_gen_hourly_storage_usage(self):
         """Test that gen_hourly_storage_usage generates rows."""
         generator = OCPGenerator(self.two_hours_ago, self.now)
@@ -474,9 +501,50 @@ generators:
         """Test that get_usage_for_date returns selected data."""
         test_usage = self._usage_dict()
         start_date = random.choice(list(test_usage.keys()))
-        output = OCPGenerator._get_usage_for_date(test_usage, datetime.strptime(start_date, "%m-%d-%Y"))
+        output = OCPGenerator._get_usage_for_date(
+            OCPGenerator._normalize_usage(test_usage), datetime.strptime(start_date, "%m-%d-%Y")
+        )
         self.assertEqual(output, test_usage.get(start_date))
 
+    def test_get_usage_for_date_full_period(self):
+        """Test that get_usage_for_date falls back to the full period usage."""
+        test_usage = OCPGenerator._normalize_usage({"full_period": 5, "06-01-2020": 3, date(2020, 6, 2): 4})
+        self.assertEqual(OCPGenerator._get_usage_for_date(test_usage, datetime(2020, 6, 1, 13)), 3)
+        self.assertEqual(OCPGenerator._get_usage_for_date(test_usage, datetime(2020, 6, 2)), 4)
+        self.assertEqual(OCPGenerator._get_usage_for_date(test_usage, datetime(2020, 6, 3)), 5)
+        self.assertIsNone(OCPGenerator._get_usage_for_date({}, datetime(2020, 6, 3)))
+
+    def test_init_normalizes_usage(self):
+        """Test that the usage dicts of a static file are keyed by date at init."""
+        in_yaml = """
+---
+generators:
+  - OCPGenerator:
+      nodes:
+        - node_name: test_node
+          namespaces:
+            - namespace_name: test_namespace
+              pods:
+                - pod_name: test_pod
+                  cpu_usage:
+                    1-21-2019: 1
+                    1-22-2019: 2
+                  mem_usage_gig:
+                    full_period: 1
+"""
+        _, tmp_filename = tempfile.mkstemp()
+        with open(tmp_filename, "w+") as tmp_handle:
+            tmp_handle.write(in_yaml)
+
+        generator = OCPGenerator(datetime(2019, 1, 21), datetime(2019, 1, 23), user_config=tmp_filename)
+        pod = generator.nodes[0].get("namespaces")[0].get("pods")[0]
+        self.assertEqual(pod.get("cpu_usage").get(date(2019, 1, 21)), 1)
+        self.assertEqual(pod.get("cpu_usage").get(date(2019, 1, 22)), 2)
+        self.assertNotIn("1-21-2019", pod.get("cpu_usage"))
+        self.assertEqual(pod.get("mem_usage_gig").get("full_period"), 1)
+        self.assertEqual(generator._get_usage_for_date(pod.get("cpu_usage"), datetime(2019, 1, 22, 5)), 2)
+        os.remove(tmp_filename)
+
     def test_init_data_row(self):
         """Test that init_data_row initializes a row of data."""
         generator = OCPGenerator(self.two_hours_ago, self.now)
@@ -519,67 +587,22 @@ generators:
         self.assertEqual(out_row.get("node_labels"), node.get("node_labels"))
         self.assertNotEqual(out_row.get("node_labels"), in_row.get("node_labels"))
 
-    def test_update_pod_data(self):
-        """Test that _update_pod_data updates pod data"""
-        pods = self.attributes.get("nodes")[0].get("namespaces")[0].get("pods")
+    def test_pod_usage_seconds(self):
+        """Test that the usage of a pod stays within its limit, and its limit within its request."""
+        pod = self.attributes.get("nodes")[0].get("namespaces")[0].get("pods")[0]
         usage_dict = self._usage_dict()
-        kwargs = {
-            "report_type": "test_report",
-            "cpu_usage": usage_dict,
-            "mem_usage_gig": usage_dict,
-            "pod_seconds": 86400,
-            "pod": pods[0],
-        }
-        changed = {
-            "pod_usage_cpu_core_seconds",
-            "pod_request_cpu_core_seconds",
-            "pod_limit_cpu_core_seconds",
-            "pod_usage_memory_byte_seconds",
-            "pod_request_memory_byte_seconds",
-            "pod_limit_memory_byte_seconds",
-        }
-
         generator = OCPGenerator(self.two_hours_ago, self.now)
-        generator.nodes = self.attributes
-        in_row = generator._init_data_row(self.two_hours_ago, self.now, report_type=OCP_POD_USAGE)
-        out_row = generator._update_pod_data(
-            copy(in_row), datetime.strptime(random.choice(list(usage_dict.keys())), "%m-%d-%Y"), self.now, **kwargs
-        )
-
-        for key in changed:
-            with self.subTest(key=key):
-                self.assertIsNotNone(out_row.get(key))
-                self.assertNotEqual(out_row.get(key), in_row.get(key))
-
-        for key in list(set(out_row.keys()) - changed):
-            with self.subTest(key=key):
-                self.assertIsNotNone(out_row.get(key))
-
-    def test_update_pod_data_usage_lt_request(self):
-        """Test that _update_pod_data keeps usage <= limit <= request."""
-        pods = self.attributes.get("nodes")[0].get("namespaces")[0].get("pods")
-        kwargs = {
-            "report_type": "test_report",
-            "cpu_usage": self._usage_dict(),
-            "mem_usage_gig": self._usage_dict(),
-            "pod_seconds": 86400,
-            "pod": pods[0],
-        }
-
-        generator = OCPGenerator(self.two_hours_ago, self.now)
-        in_row = generator._init_data_row(self.two_hours_ago, self.now, report_type=OCP_POD_USAGE)
-        out_row = generator._update_pod_data(copy(in_row), self.two_hours_ago, self.now, **kwargs)
-
-        for x in ["cpu_core", "memory_byte"]:
-            with self.subTest(row=out_row):
-                with self.subTest(x=x):
-                    self.assertLessEqual(
-                        out_row.get(f"pod_usage_{x}_seconds"), out_row.get(f"pod_request_{x}_seconds")
-                    )
-                    self.assertLessEqual(out_row.get(f"pod_usage_{x}_seconds"), out_row.get(f"pod_limit_{x}_seconds"))
-                    self.assertLessEqual(
-                        out_row.get(f"pod_limit_{x}_seconds"), out_row.get(f"pod_request_{x}_seconds")
-                    )
+        spec = generator._pod_usage_spec(pod, 86400, usage_dict, usage_dict)
+        fields = generator._pod_request_fields(spec)
+        start = datetime.strptime(random.choice(list(usage_dict.keys())), "%m-%d-%Y")
+        cpu_seconds, mem_seconds = generator._pod_usage_seconds(spec, start)
+
+        for x, usage_seconds in (("cpu_core", cpu_seconds), ("memory_byte", mem_seconds)):
+            with self.subTest(x=x):
+                self.assertGreater(usage_seconds, 0)
+                self.assertLessEqual(usage_seconds, fields[f"pod_request_{x}_seconds"])
+                self.assertLessEqual(usage_seconds, fields[f"pod_limit_{x}_seconds"])
+                self.assertLessEqual(fields[f"pod_limit_{x}_seconds"], fields[f"pod_request_{x}_seconds"])
 
     def test_update_storage_data(self):
         """Test that _update_storage_data updates storage data."""
@@ -679,3 +702,73 @@ generators:
         """Test that timestamp raises a ValueError with invalid input."""
         with self.assertRaises(ValueError):
             OCPGenerator.timestamp(self.fake.word())
+
+    def test_vectorized_requires_numpy(self):
+        """Test that vectorized sampling fails clearly without numpy."""
+        with patch.dict(sys.modules, {"numpy": None}):
+            with self.assertRaises(ImportError):
+                OCPGenerator(self.two_hours_ago, self.now, vectorized=True)
+
+
+@skipIf(numpy is None, "numpy is not installed")
+class OCPGeneratorVectorizedTestCase(TestCase):
+    """Tests for NumPy vectorized pod usage sampling."""
+
+    def setUp(self):
+        """Set up the test dates."""
+        self.start = datetime(2020, 6, 1)
+        self.end = datetime(2020, 6, 3)
+
+    def test_gen_hourly_pods_usage(self):
+        """Test that vectorized rows have every column and a usage sample."""
+        generator = OCPGenerator(self.start, self.end, vectorized=True)
+        pods = [pod for node in generator.nodes for ns in node.get("namespaces") for pod in ns.get("pods")]
+        rows = list(generator.generate_data(OCP_POD_USAGE))
+        self.assertEqual(len(rows), len(generator.hours) * len(pods))
+        for row in rows:
+            with self.subTest(row=row):
+                self.assertEqual(set(row), set(OCP_POD_USAGE_COLUMNS))
+                self.assertIsInstance(row["pod_usage_cpu_core_seconds"], float)
+                self.assertGreaterEqual(row["pod_usage_cpu_core_seconds"], 0)
+                self.assertGreaterEqual(row["pod_usage_memory_byte_seconds"], 0)
+
+    def test_gen_hourly_pods_usage_seeded(self):
+        """Test that seeding the generator makes the vectorized samples repeatable."""
+        outputs = []
+        for _ in range(2):
+            generator = OCPGenerator(self.start, self.end, vectorized=True, seed=42)
+            outputs.append([row["pod_usage_cpu_core_seconds"] for row in generator.generate_data(OCP_POD_USAGE)])
+        self.assertEqual(outputs[0], outputs[1])
+
+    def test_generate_data_with_seed(self):
+        """Test that a seed fixes each report type whatever the order they are generated in."""
+        generator = OCPGenerator(self.start, self.end, vectorized=True, seed=42)
+        pods = list(generator.generate_data(OCP_POD_USAGE))
+        storage = list(generator.generate_data(OCP_STORAGE_USAGE))
+
+        generator = OCPGenerator(self.start, self.end, vectorized=True, seed=42)
+        self.assertEqual(list(generator.generate_data(OCP_STORAGE_USAGE)), storage)
+        self.assertEqual(list(generator.generate_data(OCP_POD_USAGE)), pods)
+
+    def test_gen_hourly_pods_usage_in_chunks(self):
+        """Test that usage is sampled for a chunk of hours at a time, before the rows of the chunk."""
+        generator = OCPGenerator(self.start, self.end, vectorized=True)
+        with patch.object(
+            generator, "_sample_pods_usage_seconds", wraps=generator._sample_pods_usage_seconds
+        ) as mock_sample:
+            rows = generator.generate_data(OCP_POD_USAGE)
+            next(rows)
+            mock_sample.assert_called_once()
+            self.assertEqual(len(mock_sample.call_args[0][1]), VECTORIZED_HOURS)
+            list(rows)
+        self.assertEqual(mock_sample.call_count, -(-len(generator.hours) // VECTORIZED_HOURS))
+
+    def test_usage_overrides(self):
+        """Test that per-date and full period usage override the samples."""
+        generator = OCPGenerator(self.start, self.end, vectorized=True)
+        starts = [hour.get("start") for hour in generator.hours]
+        usage = OCPGenerator._normalize_usage({"full_period": 2, "06-02-2020": 3})
+        by_hour = generator._usage_by_hour(usage, starts)
+        self.assertEqual(by_hour.tolist(), [2] * 24 + [3] * 24)
+        self.assertEqual(generator._usage_by_hour({"full_period": 2}, starts).tolist(), [2] * 48)
+        self.assertEqual(generator._usage_by_hour(None, starts).tolist(), [0] * 48)
@@ -17,13 +17,20 @@
 import base64
 import calendar
 import csv
+import gzip
 import json
 import os
 import re
 import shutil
+import subprocess
+import sys
+import tarfile
+from concurrent.futures import ProcessPoolExecutor
 from datetime import date
 from datetime import datetime
 from datetime import timedelta
+from functools import partial
+from multiprocessing import get_context
 from tempfile import mkdtemp
 from tempfile import mkstemp
 from tempfile import NamedTemporaryFile
@@ -33,11 +40,18 @@ from unittest.mock import patch
 
 import faker
 from dateutil.relativedelta import relativedelta
+from nise.generators.aws import AWSGenerator
+from nise.generators.aws import EBSGenerator
+from nise.generators.gcp import GCP_GENERATORS
+from nise.generators.gcp import GCP_REPORT_COLUMNS
 from nise.generators.ocp.ocp_generator import OCP_REPORT_TYPE_TO_COLS
+from nise.report import _aws_write_shard
 from nise.report import _convert_bytes
+from nise.report import _create_aws_generator
 from nise.report import _create_month_list
 from nise.report import _generate_azure_filename
 from nise.report import _remove_files
+from nise.report import _tar_gzip_payload
 from nise.report import _write_csv
 from nise.report import _write_manifest
 from nise.report import aws_create_report
@@ -48,16 +62,83 @@ from nise.report import load_static_report_data
 from nise.report import ocp_create_report
 from nise.report import ocp_route_file
 from nise.report import post_payload_to_ingest_service
+from nise.util import LOG
 
 
 fake = faker.Faker()
 
 
+def read_tree(path):
+    """Return the contents of the files below path, keyed by their path relative to it."""
+    contents = {}
+    for dirpath, _, files in os.walk(path):
+        for fname in files:
+            with open(os.path.join(dirpath, fname), "rb") as report:
+                contents[os.path.relpath(os.path.join(dirpath, fname), path)] = report.read()
+    return contents
+
+
 class MiscReportTestCase(TestCase):
     """
     TestCase class for report functions
     """
 
+    def test_month_workers_with_spawn(self):
+        """Test that spawned month workers, which inherit no state, write the reports of a serial run."""
+        today = datetime.now().replace(microsecond=0, second=0, minute=0, hour=0)
+        last_month = today.replace(day=1) + relativedelta(months=-1)
+        spawn_executor = partial(ProcessPoolExecutor, mp_context=get_context("spawn"))
+        for create_report, destination_option, report_options in (
+            (aws_create_report, "aws_bucket_name", {"aws_report_name": "cur_report"}),
+            (azure_create_report, "azure_container_name", {"azure_report_name": "cost_report"}),
+        ):
+            with self.subTest(create_report=create_report.__name__):
+                # The AWS manifests hold the bucket name, so both runs write to the same directory.
+                output_dir = mkdtemp()
+                trees = []
+                for month_workers in (1, 2):
+                    options = dict(
+                        report_options,
+                        start_date=last_month,
+                        end_date=today,
+                        days_per_month=1,
+                        month_workers=month_workers,
+                        seed=42,
+                    )
+                    options[destination_option] = output_dir
+                    with patch("nise.report.ProcessPoolExecutor", spawn_executor):
+                        create_report(options)
+                    trees.append(read_tree(output_dir))
+                    shutil.rmtree(output_dir)
+                    os.mkdir(output_dir)
+                os.rmdir(output_dir)
+                self.assertTrue(trees[0])
+                self.assertEqual(trees[0].keys(), trees[1].keys())
+                # Compared as a whole, a diff of the report bytes would take minutes to print.
+                self.assertTrue(trees[0] == trees[1])
+
+    def test_seeded_reports_ignore_hash_seed(self):
+        """Test that seeded runs write the same files in processes with different hash seeds."""
+        package_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        for provider, args in (("aws", []), ("azure", []), ("ocp", ["--ocp-cluster-id", "11112222"])):
+            with self.subTest(provider=provider):
+                trees = []
+                for hash_seed in ("1", "2"):
+                    with TemporaryDirectory() as output_dir:
+                        subprocess.run(
+                            [sys.executable, "-m", "nise", "report", provider, "-s", "2024-01-01", "-e", "2024-01-03"]
+                            + ["--seed", "42", "--write-monthly"]
+                            + args,
+                            cwd=output_dir,
+                            env=dict(os.environ, PYTHONHASHSEED=hash_seed, PYTHONPATH=package_dir),
+                            stdout=subprocess.DEVNULL,
+                            stderr=subprocess.DEVNULL,
+                            check=True,
+                        )
+                        trees.append(read_tree(output_dir))
+                self.assertTrue(trees[0])
+                self.assertEqual(trees[0], trees[1])
+
     def test_convert_bytes(self):
         """Test the _convert_bytes method."""
         expected = "5.0 GB"
@@ -73,16 +154,42 @@ class MiscReportTestCase(TestCase):
         """Test the writing of the CSV data."""
         temp_file = NamedTemporaryFile(mode="w", delete=False)
         headers = ["col1", "col2"]
-        data = [{"col1": "r1c1", "col2": "r1c2"}, {"col1": "r2c1", "col2": "r2c2"}]
+        data = [("r1c1", "r1c2"), ("r2c1", "r2c2")]
         _write_csv(temp_file.name, data, headers)
         self.assertTrue(os.path.exists(temp_file.name))
         os.remove(temp_file.name)
 
+    def test_write_csv_gzip(self):
+        """Test that rows are compressed into the gzip copy as they are written."""
+        with TemporaryDirectory() as temp_dir:
+            gzip_file = os.path.join(temp_dir, "report.csv.gz")
+            headers = ["col1", "col2"]
+            data = [("r1c1", "r1c2"), ("r2c1", "r2c2")]
+            _write_csv(None, data, headers, gzip_file, compresslevel=1)
+            self.assertEqual(os.listdir(temp_dir), ["report.csv.gz"])
+            with gzip.open(gzip_file, "rt") as gzip_in:
+                rows = list(csv.reader(gzip_in))
+        self.assertEqual(rows, [headers, ["r1c1", "r1c2"], ["r2c1", "r2c2"]])
+
+    def test_tar_gzip_payload(self):
+        """Test that the report and manifest are streamed into the payload tarball."""
+        with TemporaryDirectory() as temp_dir:
+            report_file = os.path.join(temp_dir, "report.csv")
+            _write_csv(report_file, [("r1c1", "r1c2")], ["col1", "col2"])
+            payload = _tar_gzip_payload(report_file, "uuid_openshift_report.0.csv", '{"uuid": "uuid"}')
+            self.assertEqual(os.listdir(temp_dir), ["report.csv"])
+            with tarfile.open(payload) as tar:
+                self.assertEqual(tar.getnames(), ["uuid_openshift_report.0.csv", "manifest.json"])
+                self.assertEqual(tar.extractfile("manifest.json").read(), b'{"uuid": "uuid"}')
+                with open(report_file, "rb") as report:
+                    self.assertEqual(tar.extractfile("uuid_openshift_report.0.csv").read(), report.read())
+            os.remove(payload)
+
     def test_remove_files(self):
         """Test to see if files are deleted."""
         temp_file = NamedTemporaryFile(mode="w", delete=False)
         headers = ["col1", "col2"]
-        data = [{"col1": "r1c1", "col2": "r1c2"}, {"col1": "r2c1", "col2": "r2c2"}]
+        data = [("r1c1", "r1c2"), ("r2c1", "r2c2")]
         _write_csv(temp_file.name, data, headers)
         self.assertTrue(os.path.exists(temp_file.name))
         _remove_files([temp_file.name])
@@ -149,7 +256,7 @@ class MiscReportTestCase(TestCase):
 
         temp_file = NamedTemporaryFile(mode="w", delete=False)
         headers = ["col1", "col2"]
-        data = [{"col1": "r1c1", "col2": "r1c2"}, {"col1": "r2c1", "col2": "r2c2"}]
+        data = [("r1c1", "r1c2"), ("r2c1", "r2c2")]
         _write_csv(temp_file.name, data, headers)
 
         insights_upload = {}
@@ -169,7 +276,7 @@ class MiscReportTestCase(TestCase):
 
         temp_file = NamedTemporaryFile(mode="w", delete=False)
         headers = ["col1", "col2"]
-        data = [{"col1": "r1c1", "col2": "r1c2"}, {"col1": "r2c1", "col2": "r2c2"}]
+        data = [("r1c1", "r1c2"), ("r2c1", "r2c2")]
         _write_csv(temp_file.name, data, headers)
 
         insights_upload = {}
@@ -231,6 +338,27 @@ class AWSReportTestCase(TestCase):
         self.assertTrue(os.path.isfile(expected_month_output_file))
         os.remove(expected_month_output_file)
 
+    @patch("nise.report.upload_to_s3")
+    def test_aws_create_report_with_s3_uploads_concurrently(self, mock_upload_to_s3):
+        """Test the aws report creation method uploads reports before their manifests."""
+        mock_upload_to_s3.return_value = True
+        options = {
+            "start_date": self.today,
+            "end_date": self.today,
+            "aws_bucket_name": "my_bucket",
+            "aws_report_name": "cur_report",
+            "aws_multipart_chunksize": 16,
+            "upload_workers": 2,
+            "days_per_month": 1,
+        }
+        aws_create_report(options)
+        bucket_file_paths = [upload_call[0][1] for upload_call in mock_upload_to_s3.call_args_list]
+        self.assertTrue(bucket_file_paths[0].endswith(".csv.gz"))
+        self.assertTrue(all(path.endswith("-Manifest.json") for path in bucket_file_paths[-2:]))
+        for upload_call in mock_upload_to_s3.call_args_list:
+            self.assertEqual(upload_call[0][3].multipart_chunksize, 16 * 1024 * 1024)
+            self.assertFalse(os.path.exists(upload_call[0][2]))
+
     def test_aws_create_report_with_local_dir(self):
         """Test the aws report creation method with local directory."""
         local_bucket_path = mkdtemp()
@@ -537,6 +665,175 @@ accounts:
         shutil.rmtree(local_bucket_path)
         os.remove(tmp_filename)
 
+    def test_aws_create_report_with_local_dir_gzip(self):
+        """Test the aws report creation writes the compressed reports into the assembly directory."""
+        local_bucket_path = mkdtemp()
+        options = {
+            "start_date": self.yesterday,
+            "end_date": self.today,
+            "aws_bucket_name": local_bucket_path,
+            "aws_report_name": "cur_report",
+            "aws_gzip_level": 1,
+            "days_per_month": 4,
+        }
+        aws_create_report(options)
+        month_output_file_name = "{}-{}-{}".format(
+            calendar.month_name[self.today.month], self.today.year, "cur_report"
+        )
+        self.assertFalse(os.path.isfile("{}/{}.csv".format(os.getcwd(), month_output_file_name)))
+
+        manifests = []
+        for dirpath, _, files in os.walk(local_bucket_path):
+            manifests += [os.path.join(dirpath, fname) for fname in files if fname.endswith("Manifest.json")]
+        with open(manifests[0]) as manifest_file:
+            report_keys = json.load(manifest_file).get("reportKeys")
+        self.assertEqual(len(report_keys), 1)
+        with gzip.open(f"{local_bucket_path}/{report_keys[0]}", "rt") as gzip_in:
+            rows = list(csv.DictReader(gzip_in))
+        self.assertTrue(rows)
+        self.assertIn("lineItem/ProductCode", rows[0])
+        shutil.rmtree(local_bucket_path)
+
+    def test_aws_create_report_with_workers(self):
+        """Test that seeded runs write the same report files with and without workers."""
+        # The manifests hold the bucket name, so both runs write to the same bucket.
+        local_bucket_path = mkdtemp()
+        trees = []
+        for workers in (1, 3):
+            options = {
+                "start_date": self.yesterday,
+                "end_date": self.today,
+                "aws_bucket_name": local_bucket_path,
+                "aws_report_name": "cur_report",
+                "aws_finalize_report": "overwrite",
+                "days_per_month": 4,
+                "row_limit": 50,
+                "workers": workers,
+                "seed": 42,
+            }
+            aws_create_report(options)
+            trees.append(read_tree(local_bucket_path))
+            shutil.rmtree(local_bucket_path)
+            os.mkdir(local_bucket_path)
+        os.rmdir(local_bucket_path)
+        self.assertGreater(len(trees[0]), 3)
+        self.assertEqual(sorted(trees[0]), sorted(trees[1]))
+        self.assertTrue(trees[0] == trees[1])
+
+    def test_aws_create_report_with_workers_unique_ids(self):
+        """Test that worker processes do not repeat each other's line item ids."""
+        local_bucket_path = mkdtemp()
+        options = {
+            "start_date": self.yesterday,
+            "end_date": self.today,
+            "aws_bucket_name": local_bucket_path,
+            "aws_report_name": "cur_report",
+            "days_per_month": 4,
+            "workers": 4,
+        }
+        aws_create_report(options)
+        line_item_ids = []
+        for dirpath, _, files in os.walk(local_bucket_path):
+            for fname in files:
+                if fname.endswith(".csv.gz"):
+                    with gzip.open(os.path.join(dirpath, fname), "rt") as gzip_in:
+                        line_item_ids += [row["identity/LineItemId"] for row in csv.DictReader(gzip_in)]
+        shutil.rmtree(local_bucket_path)
+        self.assertTrue(line_item_ids)
+        self.assertEqual(len(set(line_item_ids)), len(line_item_ids))
+
+    def test_aws_write_shard_columns(self):
+        """Test that a shard holds the rows of a generator in the columns of the month given by the parent."""
+        month = {"name": calendar.month_name[self.today.month], "start": self.yesterday, "end": self.today}
+        options = {"start_date": self.yesterday, "end_date": self.today, "aws_report_name": "cur_report"}
+        AWSGenerator.reset_tag_columns()
+        gen = _create_aws_generator(EBSGenerator, options, month)
+        columns = AWSGenerator.column_order()
+        # A spawned worker process starts without the tag columns of the month.
+        AWSGenerator.reset_tag_columns()
+        with TemporaryDirectory() as shard_dir:
+            shard_path = _aws_write_shard(gen, columns, os.path.join(shard_dir, "shard.csv"))
+            with open(shard_path, newline="") as shard_file:
+                rows = list(csv.reader(shard_file))
+        self.assertIn("resourceTags/user:environment", columns)
+        self.assertEqual(AWSGenerator.column_order(), columns)
+        self.assertEqual(len(rows), gen.expected_row_count)
+        self.assertEqual({len(row) for row in rows}, {len(columns)})
+
+    def test_aws_create_report_with_month_workers(self):
+        """Test the aws report creation method generates concurrent months."""
+        last_month = self.today.replace(day=1) + relativedelta(months=-1)
+        options = {
+            "start_date": last_month,
+            "end_date": self.today,
+            "aws_report_name": "cur_report",
+            "write_monthly": True,
+            "days_per_month": 1,
+            "month_workers": 2,
+            "workers": 2,
+        }
+        with self.assertLogs(LOG, level="WARNING") as logs:
+            aws_create_report(options)
+        self.assertIn("Ignoring --workers 2", logs.output[0])
+        for month_date in (last_month, self.today):
+            month_output_file_name = "{}-{}-{}".format(
+                calendar.month_name[month_date.month], month_date.year, "cur_report"
+            )
+            expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+            self.assertTrue(os.path.isfile(expected_month_output_file))
+            os.remove(expected_month_output_file)
+
+    def test_aws_create_report_with_seed(self):
+        """Test that seeded runs write the same reports with and without month workers."""
+        last_month = self.today.replace(day=1) + relativedelta(months=-1)
+        # The manifests hold the bucket name, so both runs write to the same bucket.
+        local_bucket_path = mkdtemp()
+        trees = []
+        for month_workers in (1, 2):
+            options = {
+                "start_date": last_month,
+                "end_date": self.today,
+                "aws_bucket_name": local_bucket_path,
+                "aws_report_name": "cur_report",
+                "aws_finalize_report": "overwrite",
+                "days_per_month": 1,
+                "month_workers": month_workers,
+                "seed": 42,
+            }
+            aws_create_report(options)
+            trees.append(read_tree(local_bucket_path))
+            shutil.rmtree(local_bucket_path)
+            os.mkdir(local_bucket_path)
+        os.rmdir(local_bucket_path)
+        self.assertEqual(len(trees[0]), 6)
+        self.assertEqual(trees[0], trees[1])
+
+    def test_aws_create_report_with_cache(self):
+        """Test that a cached month is routed to the bucket without generating it again."""
+        last_month = self.today.replace(day=1) + relativedelta(months=-1)
+        local_bucket_path = mkdtemp()
+        with TemporaryDirectory() as cache_dir:
+            options = {
+                "start_date": last_month,
+                "end_date": self.today,
+                "aws_bucket_name": local_bucket_path,
+                "aws_report_name": "cur_report",
+                "days_per_month": 1,
+                "seed": 42,
+                "cache_dir": cache_dir,
+            }
+            aws_create_report(dict(options))
+            tree = read_tree(local_bucket_path)
+            self.assertEqual(len(os.listdir(cache_dir)), 2)
+            shutil.rmtree(local_bucket_path)
+            os.mkdir(local_bucket_path)
+
+            with patch("nise.report._create_aws_generator") as mock_create_generator:
+                aws_create_report(dict(options))
+            mock_create_generator.assert_not_called()
+            self.assertEqual(read_tree(local_bucket_path), tree)
+        shutil.rmtree(local_bucket_path)
+
 
 class OCPReportTestCase(TestCase):
     """
@@ -590,6 +887,149 @@ class OCPReportTestCase(TestCase):
             os.remove(expected_month_output_file)
         shutil.rmtree(local_insights_upload)
 
+    @patch("nise.report.extract_payload")
+    def test_ocp_create_report_with_local_dir_writes_payload(self, mock_extract):
+        """Test the ocp report creation method writes the payload into the local directory layout."""
+        local_insights_upload = mkdtemp()
+        cluster_id = "11112222"
+        options = {
+            "start_date": self.yesterday,
+            "end_date": self.today,
+            "insights_upload": local_insights_upload,
+            "ocp_cluster_id": cluster_id,
+            "days_per_month": 4,
+        }
+        ocp_create_report(options)
+        mock_extract.assert_not_called()
+        for usage_month in os.listdir(os.path.join(local_insights_upload, cluster_id)):
+            payload_dir = os.path.join(local_insights_upload, cluster_id, usage_month)
+            with open(os.path.join(payload_dir, "manifest.json")) as manifest_file:
+                manifest = json.load(manifest_file)
+            self.assertEqual(manifest.get("cluster_id"), cluster_id)
+            self.assertEqual(len(manifest.get("files")), len(OCP_REPORT_TYPE_TO_COLS))
+            self.assertEqual(sorted(os.listdir(payload_dir)), sorted(manifest.get("files") + ["manifest.json"]))
+        for report_type in OCP_REPORT_TYPE_TO_COLS.keys():
+            month_output_file_name = "{}-{}-{}-{}".format(
+                calendar.month_name[self.today.month], self.today.year, cluster_id, report_type
+            )
+            self.assertFalse(os.path.isfile("{}/{}.csv".format(os.getcwd(), month_output_file_name)))
+        shutil.rmtree(local_insights_upload)
+
+    def test_ocp_create_report_with_month_workers(self):
+        """Test the ocp report creation method generates concurrent months into a local directory."""
+        local_insights_upload = mkdtemp()
+        cluster_id = "11112222"
+        last_month = self.today.replace(day=1) + relativedelta(months=-1)
+        options = {
+            "start_date": last_month,
+            "end_date": self.today,
+            "insights_upload": local_insights_upload,
+            "ocp_cluster_id": cluster_id,
+            "days_per_month": 1,
+            "month_workers": 2,
+        }
+        ocp_create_report(options)
+        self.assertEqual(len(os.listdir(os.path.join(local_insights_upload, cluster_id))), 2)
+        shutil.rmtree(local_insights_upload)
+
+    def test_ocp_create_report_with_multiple_clusters(self):
+        """Test the ocp report creation method generates each cluster into its own local directory."""
+        local_insights_upload = mkdtemp()
+        cluster_ids = ["11112222", "33334444"]
+        options = {
+            "start_date": self.yesterday,
+            "end_date": self.today,
+            "insights_upload": local_insights_upload,
+            "ocp_cluster_id": cluster_ids,
+            "days_per_month": 1,
+            "month_workers": 2,
+        }
+        ocp_create_report(options)
+        self.assertEqual(sorted(os.listdir(local_insights_upload)), cluster_ids)
+        for cluster_id in cluster_ids:
+            with self.subTest(cluster_id=cluster_id):
+                cluster_dir = os.path.join(local_insights_upload, cluster_id)
+                self.assertEqual(len(os.listdir(cluster_dir)), 1)
+        shutil.rmtree(local_insights_upload)
+
+    def test_ocp_create_report_static_file_per_cluster(self):
+        """Test the ocp report creation method requires a static file for each cluster."""
+        options = {
+            "start_date": self.yesterday,
+            "end_date": self.today,
+            "ocp_cluster_id": ["11112222", "33334444"],
+            "static_report_file": ["ocp_static_data.yml"],
+        }
+        with self.assertRaises(ValueError):
+            ocp_create_report(options)
+
+    def test_ocp_create_report_with_workers(self):
+        """Test the ocp report creation method generates the report types in worker processes."""
+        cluster_id = "11112222"
+        options = {
+            "start_date": self.yesterday,
+            "end_date": self.today,
+            "ocp_cluster_id": cluster_id,
+            "write_monthly": True,
+            "days_per_month": 4,
+            "workers": 3,
+        }
+        ocp_create_report(options)
+        for report_type in OCP_REPORT_TYPE_TO_COLS.keys():
+            with self.subTest(report_type=report_type):
+                month_output_file_name = "{}-{}-{}-{}".format(
+                    calendar.month_name[self.today.month], self.today.year, cluster_id, report_type
+                )
+                expected_month_output_file = "{}/{}.csv".format(os.getcwd(), month_output_file_name)
+                self.assertTrue(os.path.isfile(expected_month_output_file))
+                with open(expected_month_output_file) as report:
+                    self.assertEqual(next(csv.reader(report)), list(OCP_REPORT_TYPE_TO_COLS[report_type]))
+                os.remove(expected_month_output_file)
+
+    def test_ocp_create_report_with_seed(self):
+        """Test that seeded runs write the same reports with and without workers."""
+        trees = []
+        for workers in (1, 3):
+            local_insights_upload = mkdtemp()
+            options = {
+                "start_date": self.yesterday,
+                "end_date": self.today,
+                "insights_upload": local_insights_upload,
+                "ocp_cluster_id": "11112222",
+                "days_per_month": 4,
+                "workers": workers,
+                "seed": 42,
+            }
+            ocp_create_report(options)
+            trees.append(read_tree(local_insights_upload))
+            shutil.rmtree(local_insights_upload)
+        self.assertEqual(len(trees[0]), 4)
+        self.assertEqual(trees[0], trees[1])
+
+    def test_ocp_create_report_with_cache(self):
+        """Test that a cached month is routed to the upload directory without generating it again."""
+        local_insights_upload = mkdtemp()
+        with TemporaryDirectory() as cache_dir:
+            options = {
+                "start_date": self.yesterday,
+                "end_date": self.today,
+                "insights_upload": local_insights_upload,
+                "ocp_cluster_id": "11112222",
+                "days_per_month": 4,
+                "seed": 42,
+                "cache_dir": cache_dir,
+            }
+            ocp_create_report(dict(options))
+            tree = read_tree(local_insights_upload)
+            shutil.rmtree(local_insights_upload)
+            os.mkdir(local_insights_upload)
+
+            with patch("nise.report.OCPGenerator") as mock_generator:
+                ocp_create_report(dict(options))
+            mock_generator.assert_not_called()
+            self.assertEqual(read_tree(local_insights_upload), tree)
+        shutil.rmtree(local_insights_upload)
+
     def test_ocp_create_report_with_local_dir_static_generation(self):
         """Test the ocp report creation method with local directory and static generation."""
         local_insights_upload = mkdtemp()
@@ -751,7 +1191,7 @@ class OCPReportTestCase(TestCase):
 
         temp_file = NamedTemporaryFile(mode="w", delete=False)
         headers = ["col1", "col2"]
-        data = [{"col1": "r1c1", "col2": "r1c2"}, {"col1": "r2c1", "col2": "r2c2"}]
+        data = [("r1c1", "r1c2"), ("r2c1", "r2c2")]
         _write_csv(temp_file.name, data, headers)
 
         insights_upload = "test"
@@ -885,7 +1325,7 @@ class AzureReportTestCase(TestCase):
         self.one_day = timedelta(days=1)
         self.yesterday = self.today - self.one_day
 
-    def mock_generate_azure_filename(self):
+    def mock_generate_azure_filename(self, rng=None):
         """Create a fake azure filename."""
         fake_uuid = "12345678-1234-5678-1234-567812345678"
         output_file_name = "{}_{}".format("costreport", fake_uuid)
@@ -945,6 +1385,91 @@ class AzureReportTestCase(TestCase):
         self.assertTrue(os.path.isfile(local_path))
         os.remove(local_path)
 
+    def test_azure_create_report_with_month_workers(self):
+        """Test the azure report creation method generates concurrent months into a local directory."""
+        local_storage_path = mkdtemp()
+        last_month = self.today.replace(day=1) + relativedelta(months=-1)
+        options = {
+            "start_date": last_month,
+            "end_date": self.today,
+            "azure_container_name": local_storage_path,
+            "azure_report_name": "cost_report",
+            "days_per_month": 1,
+            "month_workers": 2,
+        }
+        azure_create_report(options)
+        report_files = [fname for _, _, files in os.walk(local_storage_path) for fname in files]
+        self.assertEqual(len(report_files), 2)
+        shutil.rmtree(local_storage_path)
+
+    def test_azure_create_report_with_seed(self):
+        """Test that seeded runs write the same reports with and without month workers."""
+        last_month = self.today.replace(day=1) + relativedelta(months=-1)
+        trees = []
+        for month_workers in (1, 2):
+            local_storage_path = mkdtemp()
+            options = {
+                "start_date": last_month,
+                "end_date": self.today,
+                "azure_container_name": local_storage_path,
+                "azure_report_name": "cost_report",
+                "days_per_month": 1,
+                "month_workers": month_workers,
+                "seed": 42,
+            }
+            with patch("nise.report.Manager") as mock_manager:
+                azure_create_report(options)
+            # Seeded meter values need no cache shared between the month workers.
+            mock_manager.assert_not_called()
+            trees.append(read_tree(local_storage_path))
+            shutil.rmtree(local_storage_path)
+        self.assertEqual(len(trees[0]), 2)
+        self.assertEqual(trees[0], trees[1])
+
+    def test_azure_create_report_with_cache(self):
+        """Test that a cached month is routed to the container without generating it again."""
+        local_storage_path = mkdtemp()
+        with TemporaryDirectory() as cache_dir:
+            options = {
+                "start_date": self.yesterday,
+                "end_date": self.today,
+                "azure_container_name": local_storage_path,
+                "azure_report_name": "cost_report",
+                "days_per_month": 4,
+                "seed": 42,
+                "cache_dir": cache_dir,
+            }
+            azure_create_report(dict(options))
+            tree = read_tree(local_storage_path)
+            shutil.rmtree(local_storage_path)
+            os.mkdir(local_storage_path)
+
+            with patch("nise.report.AZURE_GENERATORS", []):
+                azure_create_report(dict(options))
+            self.assertEqual(read_tree(local_storage_path), tree)
+        shutil.rmtree(local_storage_path)
+
+    def test_azure_create_report_with_row_limit(self):
+        """Test the azure report creation method rotates files at the row limit."""
+        local_storage_path = mkdtemp()
+        options = {
+            "start_date": self.yesterday,
+            "end_date": self.today,
+            "azure_container_name": local_storage_path,
+            "azure_report_name": "cost_report",
+            "days_per_month": 4,
+            "row_limit": 5,
+        }
+        azure_create_report(options)
+        row_counts = []
+        for dirpath, _, files in os.walk(local_storage_path):
+            for fname in files:
+                with open(os.path.join(dirpath, fname)) as report:
+                    row_counts.append(len(list(csv.reader(report))) - 1)
+        self.assertGreater(len(row_counts), 1)
+        self.assertTrue(all(0 < count <= 5 for count in row_counts))
+        shutil.rmtree(local_storage_path)
+
     @patch("nise.report._generate_azure_filename")
     def test_azure_create_report_with_local_dir(self, mock_name):
         """Test the azure report creation method with local directory."""
@@ -990,11 +1515,13 @@ class AzureReportTestCase(TestCase):
             "azure_prefic_name": "prefix",
             "azure_container_name": local_storage_path,
             "azure_report_name": "cur_report",
+            "azure_max_concurrency": 4,
             "write_monthly": True,
             "days_per_month": 4,
         }
         azure_create_report(options)
         mock_upload.assert_called()
+        self.assertEqual(mock_upload.call_args[0][3], 4)
         os.remove(self.MOCK_AZURE_REPORT_FILENAME)
 
     @patch("nise.report._generate_azure_filename")
@@ -1035,6 +1562,48 @@ class GCPReportTestCase(TestCase):
         self.assertTrue(os.path.isfile(expected_output_file_path))
         os.remove(expected_output_file_path)
 
+    def test_gcp_create_report_appends_daily_files(self):
+        """Test that every generator's rows are appended to the daily file under a single header."""
+        report_prefix = "test_report"
+        gcp_create_report(
+            {
+                "start_date": self.yesterday,
+                "end_date": self.today,
+                "gcp_report_prefix": report_prefix,
+                "write_monthly": True,
+            }
+        )
+        output_file_name = "{}-{}.csv".format(report_prefix, self.yesterday.strftime("%Y-%m-%d"))
+        expected_output_file_path = "{}/{}".format(os.getcwd(), output_file_name)
+        with open(expected_output_file_path) as report:
+            rows = list(csv.reader(report))
+        os.remove(expected_output_file_path)
+
+        self.assertEqual(rows.count(list(GCP_REPORT_COLUMNS)), 1)
+        self.assertEqual(rows[0], list(GCP_REPORT_COLUMNS))
+        self.assertGreaterEqual(len(rows) - 1, len(GCP_GENERATORS))
+
+    @patch("nise.report.upload_to_gcp_storage")
+    def test_gcp_create_report_uploads_every_daily_file(self, mock_upload):
+        """Test that every daily file is uploaded to the bucket."""
+        mock_upload.return_value = True
+        report_prefix = "test_report"
+        gcp_create_report(
+            {
+                "start_date": self.yesterday - timedelta(days=1),
+                "end_date": self.today,
+                "gcp_report_prefix": report_prefix,
+                "gcp_bucket_name": "my_bucket",
+                "upload_workers": 2,
+                "write_monthly": True,
+            }
+        )
+        daily_files = sorted(name for name in os.listdir(os.getcwd()) if name.startswith(f"{report_prefix}-"))
+        _remove_files(daily_files)
+        uploads = [upload_call[0][2] for upload_call in mock_upload.call_args_list]
+        self.assertEqual(sorted(uploads), daily_files)
+        self.assertGreaterEqual(len(daily_files), 2)
+
     @patch("nise.report.copy_to_local_dir")
     @patch("nise.report.upload_to_gcp_storage")
     def test_gcp_route_file_local(self, mock_upload, mock_copy):
@@ -15,16 +15,25 @@
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 #
 import os
+import threading
 from tempfile import NamedTemporaryFile
 from unittest import TestCase
-from unittest.mock import Mock
 from unittest.mock import patch
 
 import boto3
 import faker
+from azure.core.pipeline.transport import HttpResponse
+from azure.core.pipeline.transport import HttpTransport
+from azure.storage.blob import BlobServiceClient
 from botocore.exceptions import ClientError
+from botocore.stub import Stubber
 from google.cloud.exceptions import GoogleCloudError
-from nise.upload import BlobServiceClient
+from nise.upload import _AZURE_CLIENTS
+from nise.upload import _GCP_BUCKETS
+from nise.upload import _S3_CLIENTS
+from nise.upload import get_blob_service_client
+from nise.upload import get_s3_client
+from nise.upload import s3_transfer_config
 from nise.upload import upload_to_azure_container
 from nise.upload import upload_to_gcp_storage
 from nise.upload import upload_to_s3
@@ -32,51 +41,158 @@ from nise.upload import upload_to_s3
 
 fake = faker.Faker()
 
+AZURITE_CONNECTION_STRING = (
+    "DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;"
+    "AccountKey=Eby8vdM02xNOcqFlqUwJPLlmEtlCDXJ1OUzFT50uSRZ6IFsuFq2UVErCz4I6tq/K1SZFPTOtr/KBHBeksoGMGw==;"
+    "BlobEndpoint=http://127.0.0.1:10000/devstoreaccount1;"
+)
+
+
+class CreatedResponse(HttpResponse):
+    """Azure response accepting any upload request."""
+
+    def __init__(self, request):
+        """Initialize the response."""
+        super().__init__(request, None)
+        self.status_code = 201
+        self.reason = "Created"
+        self.headers = {"ETag": '"0x1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}
+
+    def body(self):
+        """Return the empty body."""
+        return b""
+
+
+class RecordingTransport(HttpTransport):
+    """Azure transport recording the requests it is sent instead of sending them."""
+
+    def __init__(self):
+        """Initialize the transport."""
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        pass
+
+    def open(self):
+        pass
+
+    def close(self):
+        pass
+
+    def send(self, request, stream=False):
+        """Record the request and answer it.
+
+        Like the requests transport, it raises TypeError on keyword arguments the SDK did not consume.
+        """
+        with self._lock:
+            self.requests.append(request)
+        return CreatedResponse(request)
+
 
 class UploadTestCase(TestCase):
     """
     TestCase class for upload
     """
 
-    @patch("boto3.resource")
-    def test_upload_to_s3_success(self, mock_boto_resource):
+    @patch("nise.upload.get_s3_client")
+    def test_upload_to_s3_success(self, mock_get_s3_client):
         """Test upload_to_s3 method with mock s3."""
         bucket_name = "my_bucket"
-        s3_client = Mock()
-        s3_client.Bucket.create.return_value = Mock()
-        s3_client.Bucket.return_value.upload_file.return_value = Mock()
-        mock_boto_resource.return_value = s3_client
-        s3_client = boto3.resource("s3")
-        s3_client.Bucket(bucket_name).create()
+        transfer_config = s3_transfer_config()
         with NamedTemporaryFile(delete=False) as t_file:
-            success = upload_to_s3(bucket_name, "/file.txt", t_file.name)
+            success = upload_to_s3(bucket_name, "/file.txt", t_file.name, transfer_config)
         self.assertTrue(success)
+        mock_get_s3_client.return_value.upload_file.assert_called_with(
+            t_file.name, bucket_name, "/file.txt", Config=transfer_config
+        )
         os.remove(t_file.name)
 
-    @patch("boto3.resource")
-    def test_upload_to_s3_failure(self, mock_boto_resource):
+    @patch("nise.upload.get_s3_client")
+    def test_upload_to_s3_failure(self, mock_get_s3_client):
         """Test upload_to_s3 method with mock s3."""
         bucket_name = "my_bucket"
-        s3_client = Mock()
-        s3_client.Bucket.create.return_value = Mock()
-        s3_client.Bucket.return_value.upload_file.side_effect = ClientError({"Error": {}}, "Create")
-        mock_boto_resource.return_value = s3_client
-        s3_client = boto3.resource("s3")
-        s3_client.Bucket(bucket_name).create()
+        mock_get_s3_client.return_value.upload_file.side_effect = ClientError({"Error": {}}, "Create")
         with NamedTemporaryFile(delete=False) as t_file:
             success = upload_to_s3(bucket_name, "/file.txt", t_file.name)
         self.assertFalse(success)
         os.remove(t_file.name)
 
+    @patch.object(boto3.session, "Session")
+    def test_get_s3_client_is_shared(self, mock_session):
+        """Test that one S3 client is created per process and endpoint."""
+        endpoint_url = "http://localhost:5000"
+        with patch.dict(_S3_CLIENTS, clear=True):
+            s3_client = get_s3_client(endpoint_url)
+            self.assertIs(get_s3_client(endpoint_url), s3_client)
+        mock_session.assert_called_once()
+        self.assertEqual(mock_session.return_value.client.call_args[1]["endpoint_url"], endpoint_url)
+
+    def test_s3_transfer_config(self):
+        """Test that the multipart chunk size is given in MB."""
+        transfer_config = s3_transfer_config(multipart_chunksize=16, max_concurrency=4)
+        self.assertEqual(transfer_config.multipart_chunksize, 16 * 1024 * 1024)
+        self.assertEqual(transfer_config.multipart_threshold, 16 * 1024 * 1024)
+        self.assertEqual(transfer_config.max_concurrency, 4)
+
+    def test_upload_to_s3_multipart(self):
+        """Test that boto3 uploads a file in parts of the chunk size given in MB."""
+        session = boto3.session.Session(aws_access_key_id="key", aws_secret_access_key="secret")
+        s3_client = session.client("s3", region_name="us-east-1")
+        stubber = Stubber(s3_client)
+        stubber.add_response("create_multipart_upload", {"UploadId": "upload"})
+        # 11 MB in 5 MB parts.
+        for _ in range(3):
+            stubber.add_response("upload_part", {"ETag": '"etag"'})
+        stubber.add_response("complete_multipart_upload", {})
+        with NamedTemporaryFile() as t_file:
+            t_file.write(b"0" * 11 * 1024 * 1024)
+            t_file.flush()
+            with stubber, patch("nise.upload.get_s3_client", return_value=s3_client):
+                success = upload_to_s3("my_bucket", "/file.txt", t_file.name, s3_transfer_config(5, 2))
+        self.assertTrue(success)
+        stubber.assert_no_pending_responses()
+
+    @patch.dict(_AZURE_CLIENTS, clear=True)
     @patch.object(BlobServiceClient, "from_connection_string")
-    def test_upload_to_azure_success(self, _):
+    def test_upload_to_azure_success(self, mock_blob_service):
         """Test successful upload_to_storage method with mock."""
         container_name = "my_container"
         with NamedTemporaryFile(delete=False) as t_file:
-            success = upload_to_azure_container(container_name, t_file.name, "/file.txt")
+            success = upload_to_azure_container(container_name, t_file.name, "/file.txt", max_concurrency=4)
         self.assertTrue(success)
+        blob_client = mock_blob_service.return_value.get_blob_client.return_value
+        self.assertEqual(blob_client.upload_blob.call_args[1]["max_concurrency"], 4)
         os.remove(t_file.name)
 
+    def test_upload_to_azure_blocks(self):
+        """Test that the Azure SDK accepts the upload arguments and uploads the file in blocks."""
+        transport = RecordingTransport()
+        blob_service_client = BlobServiceClient.from_connection_string(
+            AZURITE_CONNECTION_STRING, transport=transport, max_single_put_size=1024, max_block_size=1024
+        )
+        with NamedTemporaryFile() as t_file:
+            t_file.write(b"0" * 4096)
+            t_file.flush()
+            with patch("nise.upload.get_blob_service_client", return_value=blob_service_client):
+                success = upload_to_azure_container("my_container", t_file.name, "file.txt", max_concurrency=2)
+        self.assertTrue(success)
+        queries = [request.url.split("?")[1] for request in transport.requests]
+        self.assertEqual(sum(query.startswith("comp=block&") for query in queries), 4)
+        self.assertEqual(queries[-1], "comp=blocklist")
+
+    @patch.dict(_AZURE_CLIENTS, clear=True)
+    @patch.object(BlobServiceClient, "from_connection_string")
+    def test_get_blob_service_client_is_shared(self, mock_blob_service):
+        """Test that one blob service client is created per process and connection string."""
+        blob_service_client = get_blob_service_client("UseDevelopmentStorage=true")
+        self.assertIs(get_blob_service_client("UseDevelopmentStorage=true"), blob_service_client)
+        mock_blob_service.assert_called_once_with("UseDevelopmentStorage=true")
+
+    @patch.dict(_AZURE_CLIENTS, clear=True)
     @patch.object(BlobServiceClient, "from_connection_string")
     def test_upload_to_azure_failure(self, mock_blob_service):
         """Test failure upload_to_storage method with mock."""
@@ -87,16 +203,17 @@ class UploadTestCase(TestCase):
         self.assertFalse(success)
         os.remove(t_file.name)
 
+    @patch.dict(_GCP_BUCKETS, clear=True)
     @patch.dict(os.environ, {"GOOGLE_APPLICATION_CREDENTIALS": "/path/to/creds"})
-    @patch("nise.upload.storage")
-    def test_gcp_upload_success(self, mock_storage):
+    @patch("google.cloud.storage.Client")
+    def test_gcp_upload_success(self, mock_storage_client):
         """Test upload_to_s3 method with mock s3."""
         bucket_name = fake.slug()
         local_path = fake.file_path()
         remote_path = fake.file_path()
         uploaded = upload_to_gcp_storage(bucket_name, local_path, remote_path)
 
-        mock_client = mock_storage.Client.return_value
+        mock_client = mock_storage_client.return_value
         mock_client.get_bucket.assert_called_with(bucket_name)
 
         mock_bucket = mock_client.get_bucket.return_value
@@ -107,8 +224,9 @@ class UploadTestCase(TestCase):
 
         self.assertTrue(uploaded)
 
+    @patch.dict(_GCP_BUCKETS, clear=True)
     @patch.dict(os.environ, {"GOOGLE_APPLICATION_CREDENTIALS": "/path/to/creds"})
-    @patch("nise.upload.storage.Client")
+    @patch("google.cloud.storage.Client")
     def test_gcp_upload_error(self, mock_storage):
         """Test upload_to_s3 method with mock s3."""
         gcp_client = mock_storage.return_value
@@ -121,6 +239,17 @@ class UploadTestCase(TestCase):
 
         self.assertFalse(uploaded)
 
+    @patch.dict(_GCP_BUCKETS, clear=True)
+    @patch.dict(os.environ, {"STORAGE_EMULATOR_HOST": "http://localhost:4443"})
+    @patch("google.cloud.storage.Client")
+    def test_gcp_get_bucket_is_shared(self, mock_storage_client):
+        """Test that uploads to a bucket share one client and bucket handle."""
+        bucket_name = fake.slug()
+        for _ in range(2):
+            self.assertTrue(upload_to_gcp_storage(bucket_name, fake.file_path(), fake.file_path()))
+        mock_storage_client.assert_called_once()
+        mock_storage_client.return_value.get_bucket.assert_called_once_with(bucket_name)
+
     def test_gcp_upload_fail_no_credentials(self):
         """Test upload_to_s3 method with mock s3."""
         bucket_name = fake.slug()
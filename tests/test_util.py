@@ -0,0 +1,152 @@
+#
+# Copyright 2018 Red Hat, Inc.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Affero General Public License as
+# published by the Free Software Foundation, either version 3 of the
+# License, or (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Affero General Public License for more details.
+#
+# You should have received a copy of the GNU Affero General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+#
+"""Tests for the utility functions."""
+import pickle
+import random
+import re
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from unittest import TestCase
+
+from nise import jinja_ext
+from nise.generators.aws import AWSGenerator
+from nise.generators.azure import AzureGenerator
+from nise.generators.generator import AbstractGenerator
+from nise.util import derive_seed
+from nise.util import FAKER
+from nise.util import get_faker
+from nise.util import ID_FACTORY
+from nise.util import random_streams
+from nise.util import SeededFaker
+from nise.util.fake import IdFactory
+from nise.yaml_generators import utils as yaml_utils
+
+
+def _shared_sha1(_):
+    """Return an ID of the shared factory, run in a worker process."""
+    return ID_FACTORY.sha1()
+
+
+class FakerTestCase(TestCase):
+    """
+    TestCase class for the shared Faker
+    """
+
+    def test_faker_is_shared(self):
+        """Test that the generators, the templates and the yaml generators share one Faker."""
+        for fake in (AbstractGenerator.fake, jinja_ext.FAKE, yaml_utils.FAKER):
+            with self.subTest(fake=fake):
+                self.assertIs(fake, FAKER)
+        self.assertIs(get_faker(), get_faker())
+        self.assertEqual(FAKER.seed_instance, get_faker().seed_instance)
+
+    def test_bound_faker_passthrough(self):
+        """Test that a passthrough bound to a seeded Faker makes the template values repeatable."""
+        words = []
+        for _ in range(2):
+            _, fake, _ = random_streams(42)
+            faker_passthrough = jinja_ext.bind_faker_passthrough(fake)
+            words.append([faker_passthrough("word") for _ in range(5)])
+        self.assertEqual(words[0], words[1])
+
+    def test_lazy_faker_protocol_lookups(self):
+        """Test that protocol lookups on the proxy do not reach the Faker."""
+        self.assertFalse(hasattr(FAKER, "__isabstractmethod__"))
+
+    def test_template_kwargs_accounts(self):
+        """Test that the account values are generated once and kept."""
+        for generator in (AWSGenerator, AzureGenerator):
+            with self.subTest(generator=generator):
+                generator.init_template_kwargs()
+                payer = generator.TEMPLATE_KWARGS["payer"]
+                generator.init_template_kwargs()
+                self.assertEqual(generator.TEMPLATE_KWARGS["payer"], payer)
+                self.assertTrue(generator.TEMPLATE_KWARGS["users"])
+
+    def test_template_kwargs_given_accounts(self):
+        """Test that given accounts replace the current ones and are returned."""
+        for generator in (AWSGenerator, AzureGenerator):
+            with self.subTest(generator=generator):
+                accounts = generator.init_template_kwargs()
+                self.assertEqual(generator.init_template_kwargs(accounts=dict(accounts, payer="1")).get("payer"), "1")
+                self.assertEqual(generator.TEMPLATE_KWARGS["payer"], "1")
+                self.assertEqual(generator.init_template_kwargs(accounts=accounts), accounts)
+
+
+class IdFactoryTestCase(TestCase):
+    """
+    TestCase class for the ID factory
+    """
+
+    def test_formats(self):
+        """Test that the factory values have the formats of the Faker providers."""
+        ids = IdFactory()
+        self.assertRegex(ids.sha1(), re.compile(r"^[0-9a-f]{40}$"))
+        for _ in range(50):
+            self.assertRegex(ids.pystr(min_chars=1, max_chars=6), re.compile(r"^[a-zA-Z]{1,6}$"))
+        self.assertEqual(len(ids.pystr(max_chars=8)), 8)
+        self.assertIn(ids.word(), ids.words)
+        self.assertIn("ability", ids.words)
+
+    def test_seed(self):
+        """Test that seeding makes the values repeatable."""
+        ids = IdFactory(42)
+        values = [ids.sha1(), ids.pystr(1, 6), ids.word()]
+        ids.seed(42)
+        self.assertEqual([ids.sha1(), ids.pystr(1, 6), ids.word()], values)
+
+    def test_shared_factory_reseeded_after_fork(self):
+        """Test that forked processes do not repeat the IDs of the shared factory."""
+        self.assertIs(AbstractGenerator.ids, ID_FACTORY)
+        with ProcessPoolExecutor(max_workers=2, mp_context=get_context("fork")) as executor:
+            sha1s = list(executor.map(_shared_sha1, range(4)))
+        self.assertEqual(len(set(sha1s)), len(sha1s))
+
+
+class SeedTestCase(TestCase):
+    """
+    TestCase class for the seeded random streams
+    """
+
+    def test_derive_seed(self):
+        """Test that derived seeds are stable and differ per stream."""
+        self.assertEqual(derive_seed(42, "aws", "EC2Generator"), derive_seed(42, "aws", "EC2Generator"))
+        self.assertNotEqual(derive_seed(42, "aws", "EC2Generator"), derive_seed(42, "aws", "RDSGenerator"))
+        self.assertNotEqual(derive_seed(42, "aws"), derive_seed(43, "aws"))
+        self.assertLess(derive_seed(42, "aws"), 2**64)
+
+    def test_random_streams(self):
+        """Test that a seed gives new streams and no seed gives the shared ones."""
+        self.assertEqual(random_streams(), (random, FAKER, ID_FACTORY))
+        rng, fake, ids = random_streams(42)
+        self.assertIsInstance(rng, random.Random)
+        self.assertIsInstance(fake, SeededFaker)
+        self.assertIsInstance(ids, IdFactory)
+        values = [rng.random(), fake.uuid4(), ids.sha1()]
+        rng, fake, ids = random_streams(42)
+        self.assertEqual([rng.random(), fake.uuid4(), ids.sha1()], values)
+
+    def test_seeded_faker(self):
+        """Test that a seeded Faker is repeatable, picklable and leaves the shared Faker alone."""
+        shared_random = get_faker().random
+        fake = SeededFaker(42)
+        words = [fake.word() for _ in range(5)]
+        other = SeededFaker(42)
+        self.assertEqual([other.word() for _ in range(5)], words)
+        copied = pickle.loads(pickle.dumps(fake))
+        self.assertEqual(copied.ean13(), fake.ean13())
+        self.assertIs(get_faker().random, shared_random)